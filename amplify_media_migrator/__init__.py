@@ -1,20 +1,45 @@
 """Amplify Media Migrator - Migrate media files from Google Drive to AWS Amplify Storage."""
 
 import importlib.metadata
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_exports
 
 try:
     __version__ = importlib.metadata.version("amplify-media-migrator")
 except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0"
 
-from .config import ConfigManager
-from .migration.engine import MigrationEngine
-from .migration.progress import ProgressTracker, FileStatus
-from .migration.mapper import FilenameMapper, ParsedFilename
-from .auth import AuthenticationProvider, CognitoAuthProvider, GoogleDriveAuthProvider
-from .sources.google_drive import GoogleDriveClient
-from .targets.amplify_storage import AmplifyStorageClient
-from .targets.graphql_client import GraphQLClient
+if TYPE_CHECKING:
+    from .auth import (
+        AuthenticationProvider,
+        CognitoAuthProvider,
+        GoogleDriveAuthProvider,
+    )
+    from .config import ConfigManager
+    from .migration.engine import MigrationEngine
+    from .migration.mapper import FilenameMapper, ParsedFilename
+    from .migration.progress import FileStatus, ProgressTracker
+    from .sources.google_drive import GoogleDriveClient
+    from .targets.amplify_storage import AmplifyStorageClient
+    from .targets.graphql_client import GraphQLClient
+
+# Resolved on first access (PEP 562) so that importing the package, e.g. for
+# the CLI entry point, does not pull in boto3 / googleapiclient / requests.
+_LAZY_ATTRS = {
+    "ConfigManager": ".config",
+    "MigrationEngine": ".migration.engine",
+    "ProgressTracker": ".migration.progress",
+    "FileStatus": ".migration.progress",
+    "FilenameMapper": ".migration.mapper",
+    "ParsedFilename": ".migration.mapper",
+    "AuthenticationProvider": ".auth",
+    "CognitoAuthProvider": ".auth",
+    "GoogleDriveAuthProvider": ".auth",
+    "GoogleDriveClient": ".sources.google_drive",
+    "AmplifyStorageClient": ".targets.amplify_storage",
+    "GraphQLClient": ".targets.graphql_client",
+}
 
 __all__ = [
     "ConfigManager",
@@ -30,3 +55,6 @@ __all__ = [
     "AmplifyStorageClient",
     "GraphQLClient",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
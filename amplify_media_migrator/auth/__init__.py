@@ -1,8 +1,23 @@
-from amplify_auth import AuthenticationProvider, CognitoAuthProvider
-from .google_drive import GoogleDriveAuthProvider
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from amplify_auth import AuthenticationProvider, CognitoAuthProvider
+
+    from .google_drive import GoogleDriveAuthProvider
+
+_LAZY_ATTRS = {
+    "AuthenticationProvider": "amplify_auth",
+    "CognitoAuthProvider": "amplify_auth",
+    "GoogleDriveAuthProvider": ".google_drive",
+}
 
 __all__ = [
     "AuthenticationProvider",
     "CognitoAuthProvider",
     "GoogleDriveAuthProvider",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
@@ -9,6 +9,8 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
+from ..utils.json_io import loads, write_atomic
+
 logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
@@ -40,7 +42,7 @@ class GoogleDriveAuthProvider:
             return self._run_oauth_flow()
 
         except Exception as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             return False
 
     def get_credentials(self) -> Optional[Credentials]:
@@ -69,7 +71,7 @@ class GoogleDriveAuthProvider:
             return True
 
         except Exception as e:
-            logger.warning(f"Token refresh failed: {e}")
+            logger.warning("Token refresh failed: %s", e)
             return False
 
     def save_token(self) -> None:
@@ -78,8 +80,8 @@ class GoogleDriveAuthProvider:
             return
 
         self._token_path.parent.mkdir(parents=True, exist_ok=True)
-        self._token_path.write_text(self._credentials.to_json())
-        logger.debug(f"Token saved to {self._token_path}")
+        write_atomic(self._token_path, self._credentials.to_json().encode("utf-8"))
+        logger.debug("Token saved to %s", self._token_path)
 
     def load_token(self) -> bool:
         """Load credentials token from disk."""
@@ -87,13 +89,12 @@ class GoogleDriveAuthProvider:
             if not self._token_path.exists():
                 return False
 
-            self._credentials = Credentials.from_authorized_user_file(
-                str(self._token_path), SCOPES
-            )
+            info = loads(self._token_path.read_bytes())
+            self._credentials = Credentials.from_authorized_user_info(info, SCOPES)
             return True
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
-            logger.warning(f"Corrupted token file, will re-authenticate: {e}")
+            logger.warning("Corrupted token file, will re-authenticate: %s", e)
             self._credentials = None
             return False
 
@@ -101,7 +102,7 @@ class GoogleDriveAuthProvider:
         """Run the OAuth2 browser flow."""
         try:
             if not self._credentials_path.exists():
-                logger.error(f"Credentials file not found: {self._credentials_path}")
+                logger.error("Credentials file not found: %s", self._credentials_path)
                 return False
 
             flow = InstalledAppFlow.from_client_secrets_file(
@@ -113,5 +114,5 @@ class GoogleDriveAuthProvider:
             return True
 
         except Exception as e:
-            logger.error(f"OAuth flow failed: {e}")
+            logger.error("OAuth flow failed: %s", e)
             return False
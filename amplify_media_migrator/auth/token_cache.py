@@ -0,0 +1,104 @@
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils.json_io import dumps_pretty, loads, write_atomic
+
+from .token_manager import REFRESH_BEFORE_EXPIRY_SECONDS, _decode_jwt_expiry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_DIR = Path.home() / ".amplify-media-migrator"
+
+
+@dataclass
+class CachedCognitoTokens:
+    id_token: str
+    refresh_token: str
+    access_token: Optional[str] = None
+
+
+class CachedCognitoSession:
+    """Stands in for CognitoAuthProvider when the tokens came from the cache.
+
+    Exposes the same ``cognito_client`` and ``get_id_token()`` the migration
+    uses, reading the ID token from the client so renewals show up here.
+    """
+
+    def __init__(self, cognito_client: Any) -> None:
+        self.cognito_client = cognito_client
+
+    def get_id_token(self) -> Optional[str]:
+        id_token: Optional[str] = self.cognito_client.id_token
+        return id_token
+
+
+class CognitoTokenCache:
+    """On-disk cache of Cognito tokens so back-to-back runs skip the password prompt.
+
+    Entries are keyed by user pool and username, written with mode 0600, and
+    ignored once the ID token is within the proactive-refresh window.
+    """
+
+    def __init__(
+        self,
+        user_pool_id: str,
+        username: str,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        digest = hashlib.sha256(f"{user_pool_id}:{username}".encode()).hexdigest()
+        self._path = (cache_dir or DEFAULT_TOKEN_CACHE_DIR) / (
+            f"cognito_token_{digest[:16]}.json"
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> Optional[CachedCognitoTokens]:
+        try:
+            data = loads(self._path.read_bytes())
+            tokens = CachedCognitoTokens(
+                id_token=data["id_token"],
+                refresh_token=data["refresh_token"],
+                access_token=data.get("access_token"),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable Cognito token cache: %s", e)
+            return None
+
+        expiry = _decode_jwt_expiry(tokens.id_token)
+        if expiry is None or expiry - time.time() < REFRESH_BEFORE_EXPIRY_SECONDS:
+            return None
+        return tokens
+
+    def save(
+        self, id_token: str, refresh_token: str, access_token: Optional[str] = None
+    ) -> None:
+        payload = dumps_pretty(
+            {
+                "id_token": id_token,
+                "refresh_token": refresh_token,
+                "access_token": access_token,
+            }
+        )
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self._path, payload)
+            os.chmod(self._path, 0o600)
+        except OSError as e:
+            logger.warning("Failed to write Cognito token cache: %s", e)
+            return
+        logger.debug("Cognito tokens cached at %s", self._path)
+
+    def clear(self) -> None:
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
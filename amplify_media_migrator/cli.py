@@ -1,36 +1,58 @@
 import asyncio
-import json
+import functools
 import logging
+import os
+import sys
 import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional
 
 import click
 
-from .auth.google_drive import GoogleDriveAuthProvider
+from .auth.token_cache import CachedCognitoSession, CognitoTokenCache
 from .auth.token_manager import CognitoTokenManager
-from .cli_progress import LiveReporter
 from .config import ConfigManager, ConfigurationError, config_to_dict
 from .migration.concurrency import AdaptiveSettings
-from .migration.engine import MigrationEngine
 from .migration.mapper import FilenameMapper
 from .migration.progress import DEFAULT_PROGRESS_DIR, FileStatus, ProgressTracker
-from .utils.logger import DEFAULT_LOG_FORMAT
-from .sources.google_drive import GoogleDriveClient
-from .targets.amplify_storage import AmplifyStorageClient
-from .targets.graphql_client import GraphQLClient
 from .utils.exceptions import AuthenticationError, MigratorError
+from .utils.json_io import dumps_pretty
 from .utils.keep_awake import KeepAwake
-from .utils.logger import setup_logging
+from .utils.logger import DEFAULT_LOG_FORMAT, setup_logging
+
+if TYPE_CHECKING:
+    from .cli_progress import LiveReporter
+    from .migration.engine import MigrationEngine
+    from .sources.google_drive import GoogleDriveClient
+
+# The Drive, S3 and AppSync clients (and rich) are imported inside the commands
+# that use them so `--help`, `config` and `status` start without loading them.
 
 logger = logging.getLogger(__name__)
 
+COGNITO_PASSWORD_ENV = "AMPLIFY_COGNITO_PASSWORD"
+
+_password_stdin_option = click.option(
+    "--password-stdin",
+    is_flag=True,
+    help="Read the Cognito password from the first line of stdin",
+)
+
+
+def _install_uvloop() -> None:
+    """Run the engine's event loop on uvloop when the 'speedups' extra is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 @click.group()
 @click.version_option()
 def main() -> None:
-    pass
+    _install_uvloop()
 
 
 @main.command()
@@ -119,10 +141,17 @@ def show() -> None:
         raise SystemExit(1)
 
     click.echo(f"Configuration file: {mgr.config_path}\n")
-    click.echo(json.dumps(config_to_dict(cfg), indent=2))
+    click.echo(dumps_pretty(config_to_dict(cfg)).decode("utf-8"), nl=False)
 
 
 def _load_config() -> ConfigManager:
+    """Load and validate the config file at most once per CLI invocation."""
+    ctx = click.get_current_context(silent=True)
+    meta = ctx.find_root().meta if ctx is not None else {}
+    cached: Optional[ConfigManager] = meta.get("amplify_media_migrator.config")
+    if cached is not None:
+        return cached
+
     mgr = ConfigManager()
     if not mgr.exists():
         click.echo("No configuration found. Run 'amplify-media-migrator config' first.")
@@ -132,10 +161,27 @@ def _load_config() -> ConfigManager:
     except ConfigurationError as e:
         click.echo(f"Configuration error: {e}", err=True)
         raise SystemExit(1)
+    meta["amplify_media_migrator.config"] = mgr
     return mgr
 
 
-def _authenticate_google(cfg: ConfigManager) -> GoogleDriveClient:
+def _load_tracker(folder_id: str) -> Optional[ProgressTracker]:
+    """Load the progress file for folder_id at most once per CLI invocation."""
+    cache: Dict[str, Optional[ProgressTracker]] = (
+        click.get_current_context()
+        .find_root()
+        .meta.setdefault("amplify_media_migrator.trackers", {})
+    )
+    if folder_id not in cache:
+        tracker = ProgressTracker()
+        cache[folder_id] = tracker if tracker.load(folder_id) else None
+    return cache[folder_id]
+
+
+def _authenticate_google(cfg: ConfigManager) -> "GoogleDriveClient":
+    from .auth.google_drive import GoogleDriveAuthProvider
+    from .sources.google_drive import GoogleDriveClient
+
     creds_path = Path(cfg.get("google_drive.credentials_path")).expanduser()
     token_path = Path(cfg.get("google_drive.token_path")).expanduser()
 
@@ -150,22 +196,84 @@ def _authenticate_google(cfg: ConfigManager) -> GoogleDriveClient:
         raise SystemExit(1)
 
     credentials = auth_provider.get_credentials()
-    drive_client = GoogleDriveClient(credentials=credentials)
+    drive_client = GoogleDriveClient(
+        credentials=credentials,
+        download_chunk_size_mb=cfg.config.google_drive.download_chunk_size_mb,
+        max_workers=cfg.config.migration.max_workers,
+    )
     drive_client.connect()
     return drive_client
 
 
-def _authenticate_cognito(cfg: ConfigManager) -> tuple[str, Any]:
+def _read_cognito_password(password_stdin: bool = False) -> str:
+    if password_stdin:
+        line = sys.stdin.readline().rstrip("\r\n")
+        if not line:
+            click.echo("No Cognito password received on stdin.", err=True)
+            raise SystemExit(1)
+        return line
+    password = os.environ.get(COGNITO_PASSWORD_ENV)
+    if password:
+        return password
+    result: str = click.prompt("Cognito password", hide_input=True)
+    return result
+
+
+def _cognito_token_cache(cfg: ConfigManager) -> CognitoTokenCache:
+    return CognitoTokenCache(
+        cfg.get("aws.cognito.user_pool_id"), cfg.get("aws.cognito.username")
+    )
+
+
+def _cache_cognito_tokens(
+    token_cache: CognitoTokenCache, id_token: str, cognito_client: Any
+) -> None:
+    refresh_token = getattr(cognito_client, "refresh_token", None)
+    if isinstance(refresh_token, str) and refresh_token:
+        access_token = getattr(cognito_client, "access_token", None)
+        token_cache.save(
+            id_token,
+            refresh_token,
+            access_token if isinstance(access_token, str) else None,
+        )
+
+
+def _authenticate_cognito(
+    cfg: ConfigManager, password_stdin: bool = False
+) -> tuple[str, Any]:
     from amplify_auth import CognitoAuthProvider
 
+    user_pool_id = cfg.get("aws.cognito.user_pool_id")
+    client_id = cfg.get("aws.cognito.client_id")
+    region = cfg.get("aws.region")
+    username = cfg.get("aws.cognito.username")
+
+    token_cache = _cognito_token_cache(cfg)
+    cached = token_cache.load()
+    if cached is not None:
+        from pycognito import Cognito
+
+        # Rebuild the underlying client from the cached tokens so the token
+        # manager can still renew via REFRESH_TOKEN_AUTH during long runs.
+        cognito_client = Cognito(
+            user_pool_id,
+            client_id,
+            user_pool_region=region,
+            username=username,
+            id_token=cached.id_token,
+            refresh_token=cached.refresh_token,
+            access_token=cached.access_token,
+        )
+        click.echo("Using cached AWS Cognito session.")
+        return cached.id_token, CachedCognitoSession(cognito_client)
+
     cognito = CognitoAuthProvider(
-        user_pool_id=cfg.get("aws.cognito.user_pool_id"),
-        client_id=cfg.get("aws.cognito.client_id"),
-        region=cfg.get("aws.region"),
+        user_pool_id=user_pool_id,
+        client_id=client_id,
+        region=region,
     )
 
-    username = cfg.get("aws.cognito.username")
-    password = click.prompt("Cognito password", hide_input=True)
+    password = _read_cognito_password(password_stdin)
 
     click.echo("Authenticating with AWS Cognito...")
     if not cognito.authenticate(username, password):
@@ -177,6 +285,9 @@ def _authenticate_cognito(cfg: ConfigManager) -> tuple[str, Any]:
         click.echo("Failed to obtain ID token.", err=True)
         raise SystemExit(1)
 
+    _cache_cognito_tokens(
+        token_cache, id_token, getattr(cognito, "cognito_client", None)
+    )
     return id_token, cognito
 
 
@@ -192,10 +303,18 @@ def _adaptive_settings(migration_cfg: Any) -> AdaptiveSettings:
 
 def _create_engine(
     cfg: ConfigManager,
-    drive_client: GoogleDriveClient,
+    drive_client: "GoogleDriveClient",
     id_token: str,
     cognito_provider: Any = None,
-) -> MigrationEngine:
+    token_cache: Optional[CognitoTokenCache] = None,
+) -> "MigrationEngine":
+    from .migration.engine import MigrationEngine
+    from .targets.amplify_storage import (
+        TRANSFER_MAX_CONCURRENCY,
+        AmplifyStorageClient,
+    )
+    from .targets.graphql_client import GraphQLClient
+
     migration_cfg = cfg.config.migration
 
     storage_client = AmplifyStorageClient(
@@ -203,13 +322,14 @@ def _create_engine(
         region=cfg.get("aws.region"),
         identity_pool_id=cfg.get("aws.cognito.identity_pool_id"),
         user_pool_id=cfg.get("aws.cognito.user_pool_id"),
-        max_pool_connections=migration_cfg.max_workers,
+        max_pool_connections=migration_cfg.max_workers * TRANSFER_MAX_CONCURRENCY,
     )
     storage_client.connect(id_token)
 
     graphql_client = GraphQLClient(
         api_endpoint=cfg.get("aws.amplify.api_endpoint"),
         region=cfg.get("aws.region"),
+        max_pool_connections=migration_cfg.max_workers,
     )
     graphql_client.connect(id_token)
 
@@ -230,9 +350,17 @@ def _create_engine(
                 new_token: Optional[str] = cognito_provider.cognito_client.id_token
                 if new_token:
                     cognito_provider._id_token = new_token
+                    if token_cache is not None:
+                        # So the next run starts from the renewed tokens.
+                        _cache_cognito_tokens(
+                            token_cache, new_token, cognito_provider.cognito_client
+                        )
                 return new_token
             except Exception:
                 logger.exception("Cognito token renewal failed")
+                if token_cache is not None:
+                    # The cached refresh token is no good to the next run either.
+                    token_cache.clear()
                 return None
 
         def _on_new_token(t: str) -> None:
@@ -263,6 +391,10 @@ def _create_engine(
         token_manager=token_manager,
         initial_id_token=id_token,
         adaptive=_adaptive_settings(migration_cfg),
+        media_batch_size=migration_cfg.media_batch_size,
+        large_file_threshold_mb=migration_cfg.stream_threshold_mb,
+        upload_chunk_size_mb=migration_cfg.chunk_size_mb,
+        lookup_batch_size=migration_cfg.lookup_batch_size,
     )
 
 
@@ -295,11 +427,13 @@ def _quiet_stream_handlers(logger: logging.Logger) -> List[logging.Handler]:
 
 def _run_with_progress(
     coro_fn: Callable[[], Any],
-    engine: MigrationEngine,
+    engine: "MigrationEngine",
     desc: str = "Processing",
 ) -> None:
     from rich.console import Console
 
+    from .cli_progress import LiveReporter
+
     console = Console(stderr=True)
     reporter = LiveReporter()
     engine.set_reporter(reporter)
@@ -312,7 +446,7 @@ def _run_with_progress(
 
 def _run_live(
     coro_fn: Callable[[], Any],
-    reporter: LiveReporter,
+    reporter: "LiveReporter",
     console: Any,
     fps: int = 6,
 ) -> None:
@@ -321,7 +455,9 @@ def _run_live(
     app_logger = logging.getLogger("amplify_media_migrator")
     stop = threading.Event()
 
-    with Live(reporter.render(), console=console, refresh_per_second=fps) as live:
+    # The ticker is the only writer: rich's own auto-refresh thread would
+    # redraw the terminal a second time per tick for no new information.
+    with Live(reporter.render(), console=console, auto_refresh=False) as live:
         muted = _quiet_stream_handlers(app_logger)
         log_handler = _LiveLogHandler(live)
         app_logger.addHandler(log_handler)
@@ -329,7 +465,7 @@ def _run_live(
         def _ticker() -> None:
             while not stop.wait(1.0 / fps):
                 reporter.sample()
-                live.update(reporter.render())
+                live.update(reporter.render(), refresh=True)
 
         thread = threading.Thread(target=_ticker, daemon=True)
         thread.start()
@@ -339,7 +475,7 @@ def _run_live(
             stop.set()
             thread.join(timeout=2)
             reporter.sample()
-            live.update(reporter.render())
+            live.update(reporter.render(), refresh=True)
             app_logger.removeHandler(log_handler)
             for handler in muted:
                 handler.setLevel(logging.NOTSET)
@@ -347,7 +483,7 @@ def _run_live(
 
 def _run_plain(
     coro_fn: Callable[[], Any],
-    reporter: LiveReporter,
+    reporter: "LiveReporter",
     console: Any,
     interval: float = 30.0,
     clock: Callable[[], float] = time.monotonic,
@@ -374,22 +510,34 @@ def _run_plain(
         console.print(reporter.plain_line())
 
 
-def _print_summary(summary: dict) -> None:
-    click.echo("\n--- Migration Summary ---")
-    click.echo(f"  Total files:    {summary['total']}")
-    click.echo(f"  Completed:      {summary['completed']}")
-    click.echo(f"  Failed:         {summary['failed']}")
-    click.echo(f"  Orphan:         {summary['orphan']}")
-    click.echo(f"  Needs review:   {summary['needs_review']}")
-    click.echo(f"  Partial:        {summary['partial']}")
-    click.echo(f"  Duplicate:      {summary['duplicate']}")
-    click.echo(f"  Pending:        {summary['pending']}")
+_SUMMARY_TEMPLATE = "\n".join(
+    [
+        "\n--- Migration Summary ---",
+        "  Total files:    {total}",
+        "  Completed:      {completed}",
+        "  Failed:         {failed}",
+        "  Orphan:         {orphan}",
+        "  Needs review:   {needs_review}",
+        "  Partial:        {partial}",
+        "  Duplicate:      {duplicate}",
+        "  Pending:        {pending}",
+    ]
+)
+
+
+def _print_summary(summary: Mapping[str, int]) -> None:
+    # Multi-line reports are written once: click.echo flushes per call.
+    click.echo(_SUMMARY_TEMPLATE.format_map(summary))
 
 
 @main.command()
 @click.option("--folder-id", required=True, help="Google Drive folder ID")
 def scan(folder_id: str) -> None:
     """Scan Google Drive folder and validate file mappings (dry-run)."""
+    from .migration.engine import MigrationEngine
+    from .targets.amplify_storage import AmplifyStorageClient
+    from .targets.graphql_client import GraphQLClient
+
     cfg = _load_config()
     drive_client = _authenticate_google(cfg)
 
@@ -440,12 +588,14 @@ def scan(folder_id: str) -> None:
     "--retry-orphans", is_flag=True, help="Retry files previously marked as orphan"
 )
 @click.option("--verbose", is_flag=True, help="Enable debug logging")
+@_password_stdin_option
 def migrate(
     folder_id: str,
     dry_run: bool,
     rescan: bool,
     retry_orphans: bool,
     verbose: bool,
+    password_stdin: bool,
 ) -> None:
     """Run or resume the media migration.
 
@@ -458,14 +608,16 @@ def migrate(
 
     cfg = _load_config()
     drive_client = _authenticate_google(cfg)
-    id_token, cognito_provider = _authenticate_cognito(cfg)
-    engine = _create_engine(cfg, drive_client, id_token, cognito_provider)
+    id_token, cognito_provider = _authenticate_cognito(cfg, password_stdin)
+    engine = _create_engine(
+        cfg, drive_client, id_token, cognito_provider, _cognito_token_cache(cfg)
+    )
 
     if dry_run:
         click.echo("\n[DRY RUN] No files will be downloaded or uploaded.\n")
 
-    _peek = ProgressTracker()
-    if _peek.load(folder_id):
+    _peek = _load_tracker(folder_id)
+    if _peek is not None:
         _s = _peek.get_summary()
         retrying = (
             _s.failed
@@ -499,8 +651,8 @@ def migrate(
 @click.option("--folder-id", required=True, help="Google Drive folder ID")
 def review(folder_id: str) -> None:
     """Show files that need manual review."""
-    tracker = ProgressTracker()
-    if not tracker.load(folder_id):
+    tracker = _load_tracker(folder_id)
+    if tracker is None:
         click.echo(f"No progress file found for folder {folder_id}")
         raise SystemExit(1)
 
@@ -509,11 +661,12 @@ def review(folder_id: str) -> None:
         click.echo("No files need review.")
         return
 
-    click.echo(f"Files needing review: {len(files)}\n")
+    lines = [f"Files needing review: {len(files)}\n"]
     for fp in files:
-        click.echo(f"  {fp.filename}")
+        lines.append(f"  {fp.filename}")
         if fp.error:
-            click.echo(f"    Reason: {fp.error}")
+            lines.append(f"    Reason: {fp.error}")
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -527,8 +680,8 @@ def review(folder_id: str) -> None:
 @click.option("--output", required=True, help="Output file path")
 def export(folder_id: str, status: str, output: str) -> None:
     """Export files with a given status to a JSON file."""
-    tracker = ProgressTracker()
-    if not tracker.load(folder_id):
+    tracker = _load_tracker(folder_id)
+    if tracker is None:
         click.echo(f"No progress file found for folder {folder_id}")
         raise SystemExit(1)
 
@@ -539,7 +692,8 @@ def export(folder_id: str, status: str, output: str) -> None:
 
 @main.command()
 @click.option("--folder-id", required=True, help="Google Drive folder ID")
-def validate(folder_id: str) -> None:
+@_password_stdin_option
+def validate(folder_id: str, password_stdin: bool) -> None:
     """Run pre-flight checks before migration."""
     failed = False
 
@@ -551,70 +705,42 @@ def validate(folder_id: str) -> None:
         click.echo("[FAIL] Configuration")
         raise SystemExit(1)
 
-    # 2. Google Drive authentication
-    google_ok = False
+    # 2-3. Authentication stays sequential: either provider may prompt.
+    drive_client = None
     try:
         drive_client = _authenticate_google(cfg)
         click.echo("[PASS] Google Drive authentication")
-        google_ok = True
     except SystemExit:
         click.echo("[FAIL] Google Drive authentication")
         failed = True
 
-    # 3. Google Drive folder access
-    if google_ok:
-        try:
-            list(drive_client.list_files(folder_id, recursive=False))
-            click.echo("[PASS] Google Drive folder access")
-        except Exception as e:
-            click.echo(f"[FAIL] Google Drive folder access: {e}")
-            failed = True
-    else:
-        click.echo("[SKIP] Google Drive folder access")
-
-    # 4. Cognito authentication
-    cognito_ok = False
+    id_token = None
     try:
-        id_token, _ = _authenticate_cognito(cfg)
+        id_token, _ = _authenticate_cognito(cfg, password_stdin)
         click.echo("[PASS] Cognito authentication")
-        cognito_ok = True
     except SystemExit:
         click.echo("[FAIL] Cognito authentication")
         failed = True
 
-    # 5. S3 bucket access
-    if cognito_ok:
-        try:
-            storage_client = AmplifyStorageClient(
-                bucket=cfg.get("aws.amplify.storage_bucket"),
-                region=cfg.get("aws.region"),
-                identity_pool_id=cfg.get("aws.cognito.identity_pool_id"),
-                user_pool_id=cfg.get("aws.cognito.user_pool_id"),
-            )
-            storage_client.connect(id_token)
-            storage_client.file_exists("media/__validate_check__")
-            click.echo("[PASS] S3 bucket access")
-        except Exception as e:
-            click.echo(f"[FAIL] S3 bucket access: {e}")
-            failed = True
-    else:
-        click.echo("[SKIP] S3 bucket access")
-
-    # 6. GraphQL endpoint
-    if cognito_ok:
-        try:
-            graphql_client = GraphQLClient(
-                api_endpoint=cfg.get("aws.amplify.api_endpoint"),
-                region=cfg.get("aws.region"),
-            )
-            graphql_client.connect(id_token)
-            graphql_client.get_observation_by_sequential_id(0)
-            click.echo("[PASS] GraphQL endpoint")
-        except Exception as e:
-            click.echo(f"[FAIL] GraphQL endpoint: {e}")
+    # 4-6. The access probes are independent network round trips.
+    probes: Dict[str, Callable[[], Any]] = {}
+    if drive_client is not None:
+        probes["Google Drive folder access"] = functools.partial(
+            drive_client.probe_folder, folder_id
+        )
+    if id_token is not None:
+        probes["S3 bucket access"] = functools.partial(_probe_s3, cfg, id_token)
+        probes["GraphQL endpoint"] = functools.partial(_probe_graphql, cfg, id_token)
+
+    errors = dict(zip(probes, asyncio.run(_run_probes(list(probes.values())))))
+    for label in ("Google Drive folder access", "S3 bucket access", "GraphQL endpoint"):
+        if label not in errors:
+            click.echo(f"[SKIP] {label}")
+        elif errors[label] is None:
+            click.echo(f"[PASS] {label}")
+        else:
+            click.echo(f"[FAIL] {label}: {errors[label]}")
             failed = True
-    else:
-        click.echo("[SKIP] GraphQL endpoint")
 
     if failed:
         click.echo("\nValidation failed.")
@@ -623,12 +749,53 @@ def validate(folder_id: str) -> None:
         click.echo("\nAll checks passed.")
 
 
+def _probe_s3(cfg: ConfigManager, id_token: str) -> None:
+    from .targets.amplify_storage import AmplifyStorageClient
+
+    storage_client = AmplifyStorageClient(
+        bucket=cfg.get("aws.amplify.storage_bucket"),
+        region=cfg.get("aws.region"),
+        identity_pool_id=cfg.get("aws.cognito.identity_pool_id"),
+        user_pool_id=cfg.get("aws.cognito.user_pool_id"),
+    )
+    try:
+        storage_client.connect(id_token)
+        storage_client.file_exists("media/__validate_check__")
+    finally:
+        storage_client.close()
+
+
+def _probe_graphql(cfg: ConfigManager, id_token: str) -> None:
+    from .targets.graphql_client import GraphQLClient
+
+    graphql_client = GraphQLClient(
+        api_endpoint=cfg.get("aws.amplify.api_endpoint"),
+        region=cfg.get("aws.region"),
+    )
+    try:
+        graphql_client.connect(id_token)
+        graphql_client.get_observation_by_sequential_id(0)
+    finally:
+        graphql_client.close()
+
+
+async def _run_probes(probes: List[Callable[[], Any]]) -> List[Optional[Exception]]:
+    """Run blocking probes concurrently; return each one's exception, or None."""
+    results = await asyncio.gather(
+        *(asyncio.to_thread(probe) for probe in probes), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    return [result if isinstance(result, Exception) else None for result in results]
+
+
 @main.command()
 @click.option("--folder-id", required=True, help="Google Drive folder ID")
 def status(folder_id: str) -> None:
     """Show migration progress for a folder."""
-    tracker = ProgressTracker()
-    if not tracker.load(folder_id):
+    tracker = _load_tracker(folder_id)
+    if tracker is None:
         click.echo(f"No progress file found for folder {folder_id}")
         raise SystemExit(1)
 
@@ -642,23 +809,22 @@ def status(folder_id: str) -> None:
         + summary.partial
     )
 
-    click.echo(f"Migration status for folder {folder_id}\n")
-    click.echo(f"  Total files:    {total}")
-    click.echo(f"  Completed:      {summary.completed}")
-    click.echo(f"  Failed:         {summary.failed}")
-    click.echo(f"  Orphan:         {summary.orphan}")
-    click.echo(f"  Needs review:   {summary.needs_review}")
-    click.echo(f"  Partial:        {summary.partial}")
-    click.echo(f"  Duplicate:      {summary.duplicate}")
-    click.echo(f"  Pending:        {summary.pending}")
-    click.echo(f"  Downloaded:     {summary.downloaded}")
-    click.echo(f"  Uploaded:       {summary.uploaded}")
-
-    if total > 0:
-        pct = (processed / total) * 100
-        click.echo(f"\n  Progress:       {pct:.1f}%")
-    else:
-        click.echo(f"\n  Progress:       0.0%")
+    pct = (processed / total) * 100 if total > 0 else 0.0
+    lines = [
+        f"Migration status for folder {folder_id}\n",
+        f"  Total files:    {total}",
+        f"  Completed:      {summary.completed}",
+        f"  Failed:         {summary.failed}",
+        f"  Orphan:         {summary.orphan}",
+        f"  Needs review:   {summary.needs_review}",
+        f"  Partial:        {summary.partial}",
+        f"  Duplicate:      {summary.duplicate}",
+        f"  Pending:        {summary.pending}",
+        f"  Downloaded:     {summary.downloaded}",
+        f"  Uploaded:       {summary.uploaded}",
+        f"\n  Progress:       {pct:.1f}%",
+    ]
+    click.echo("\n".join(lines))
 
 
 @main.command()
@@ -670,10 +836,13 @@ def status(folder_id: str) -> None:
         "(default: ~/.amplify-media-migrator/observations_without_media.json)"
     ),
 )
-def observations_without_media(output: Optional[str]) -> None:
+@_password_stdin_option
+def observations_without_media(output: Optional[str], password_stdin: bool) -> None:
     """List observations with no linked media records."""
+    from .targets.graphql_client import GraphQLClient
+
     cfg = _load_config()
-    id_token, _ = _authenticate_cognito(cfg)
+    id_token, _ = _authenticate_cognito(cfg, password_stdin)
 
     graphql_client = GraphQLClient(
         api_endpoint=cfg.get("aws.amplify.api_endpoint"),
@@ -700,7 +869,7 @@ def observations_without_media(output: Optional[str]) -> None:
     payload = [
         {"id": o.id, "sequentialId": o.sequential_id} for o in sorted_observations
     ]
-    output_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    output_path.write_bytes(dumps_pretty(payload))
 
     if not payload:
         click.echo(f"\nNo observations without media found. Written to {output_path}")
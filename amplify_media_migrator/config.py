@@ -1,12 +1,15 @@
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass, replace
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 
+from .utils.json_io import dumps_pretty, loads, write_atomic
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,14 +17,15 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GoogleDriveConfig:
     folder_id: str = ""
     credentials_path: str = "~/.amplify-media-migrator/google_credentials.json"
     token_path: str = "~/.amplify-media-migrator/google_token.json"
+    download_chunk_size_mb: int = 8
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CognitoConfig:
     user_pool_id: str = ""
     client_id: str = ""
@@ -29,20 +33,20 @@ class CognitoConfig:
     username: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AmplifyConfig:
     api_endpoint: str = ""
     storage_bucket: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AWSConfig:
     region: str = "us-east-1"
     cognito: CognitoConfig = field(default_factory=CognitoConfig)
     amplify: AmplifyConfig = field(default_factory=AmplifyConfig)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MigrationConfig:
     max_workers: int = 50
     retry_attempts: int = 3
@@ -54,16 +58,19 @@ class MigrationConfig:
     initial_workers: Optional[int] = None
     max_inflight_buffer_mb: int = 512
     window_seconds: float = 10.0
+    media_batch_size: int = 25
+    stream_threshold_mb: int = 25
+    lookup_batch_size: int = 25
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PrefixDisambiguationConfig:
     enabled: bool = False
     discriminator_field: str = ""
     prefixes: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     google_drive: GoogleDriveConfig = field(default_factory=GoogleDriveConfig)
     aws: AWSConfig = field(default_factory=AWSConfig)
@@ -76,6 +83,8 @@ class Config:
         errors: List[str] = []
         if self.migration.max_workers <= 0:
             errors.append("migration.max_workers must be > 0")
+        if self.google_drive.download_chunk_size_mb <= 0:
+            errors.append("google_drive.download_chunk_size_mb must be > 0")
         if self.migration.retry_attempts < 0:
             errors.append("migration.retry_attempts must be >= 0")
         if self.migration.retry_delay_seconds < 0:
@@ -95,6 +104,12 @@ class Config:
             errors.append("migration.max_inflight_buffer_mb must be > 0")
         if self.migration.window_seconds <= 0:
             errors.append("migration.window_seconds must be > 0")
+        if self.migration.media_batch_size < 1:
+            errors.append("migration.media_batch_size must be >= 1")
+        if self.migration.lookup_batch_size < 1:
+            errors.append("migration.lookup_batch_size must be >= 1")
+        if self.migration.stream_threshold_mb < 0:
+            errors.append("migration.stream_threshold_mb must be >= 0")
         pd = self.prefix_disambiguation
         if pd.enabled:
             if not pd.discriminator_field:
@@ -120,81 +135,133 @@ def validate_config(config: Config) -> None:
     config.validate()
 
 
-def config_to_dict(config: Config) -> dict:
-    return asdict(config)
+# (name, nested dataclass or None, default factory) per field, computed once
+# so loading and saving don't re-inspect the dataclasses on every call.
+_FieldSpec = Tuple[str, Optional[type], Callable[[], Any]]
 
 
-def config_from_dict(data: dict) -> Config:
-    gd_data = data.get("google_drive", {})
-    google_drive = GoogleDriveConfig(
-        folder_id=gd_data.get("folder_id", ""),
-        credentials_path=gd_data.get(
-            "credentials_path", "~/.amplify-media-migrator/google_credentials.json"
-        ),
-        token_path=gd_data.get(
-            "token_path", "~/.amplify-media-migrator/google_token.json"
-        ),
-    )
+def _constant(value: Any) -> Callable[[], Any]:
+    return lambda: value
 
-    aws_data = data.get("aws", {})
-    cognito_data = aws_data.get("cognito", {})
-    cognito = CognitoConfig(
-        user_pool_id=cognito_data.get("user_pool_id", ""),
-        client_id=cognito_data.get("client_id", ""),
-        identity_pool_id=cognito_data.get("identity_pool_id", ""),
-        username=cognito_data.get("username", ""),
-    )
 
-    amplify_data = aws_data.get("amplify", {})
-    amplify = AmplifyConfig(
-        api_endpoint=amplify_data.get("api_endpoint", ""),
-        storage_bucket=amplify_data.get("storage_bucket", ""),
+def _compile_field_specs(cls: type) -> Tuple[_FieldSpec, ...]:
+    specs: List[_FieldSpec] = []
+    for f in fields(cls):
+        nested = f.type if isinstance(f.type, type) and is_dataclass(f.type) else None
+        factory: Callable[[], Any] = (
+            f.default_factory
+            if f.default_factory is not MISSING
+            else _constant(f.default)
+        )
+        specs.append((f.name, nested, factory))
+    return tuple(specs)
+
+
+_FIELD_SPECS: Dict[type, Tuple[_FieldSpec, ...]] = {
+    cls: _compile_field_specs(cls)
+    for cls in (
+        GoogleDriveConfig,
+        CognitoConfig,
+        AmplifyConfig,
+        AWSConfig,
+        MigrationConfig,
+        PrefixDisambiguationConfig,
+        Config,
     )
+}
 
-    aws = AWSConfig(
-        region=aws_data.get("region", "us-east-1"),
-        cognito=cognito,
-        amplify=amplify,
-    )
 
-    mig_data = data.get("migration", {})
-    mig_defaults = MigrationConfig()
-    migration = MigrationConfig(
-        max_workers=mig_data.get(
-            "max_workers", mig_data.get("concurrency", mig_defaults.max_workers)
-        ),
-        retry_attempts=mig_data.get("retry_attempts", mig_defaults.retry_attempts),
-        retry_delay_seconds=mig_data.get(
-            "retry_delay_seconds", mig_defaults.retry_delay_seconds
-        ),
-        chunk_size_mb=mig_data.get("chunk_size_mb", mig_defaults.chunk_size_mb),
-        default_media_public=mig_data.get(
-            "default_media_public", mig_defaults.default_media_public
-        ),
-        adaptive_concurrency=mig_data.get(
-            "adaptive_concurrency", mig_defaults.adaptive_concurrency
-        ),
-        min_workers=mig_data.get("min_workers", mig_defaults.min_workers),
-        initial_workers=mig_data.get("initial_workers", mig_defaults.initial_workers),
-        max_inflight_buffer_mb=mig_data.get(
-            "max_inflight_buffer_mb", mig_defaults.max_inflight_buffer_mb
-        ),
-        window_seconds=mig_data.get("window_seconds", mig_defaults.window_seconds),
-    )
+# Dotted key -> (value getter, attribute path) for every field, so
+# ConfigManager.get/set are a single dict lookup instead of a segment walk.
+_PathEntry = Tuple[Callable[[Any], Any], Tuple[str, ...]]
 
-    pd_data = data.get("prefix_disambiguation", {})
-    prefix_disambiguation = PrefixDisambiguationConfig(
-        enabled=pd_data.get("enabled", False),
-        discriminator_field=pd_data.get("discriminator_field", ""),
-        prefixes=dict(pd_data.get("prefixes", {})),
-    )
 
-    return Config(
-        google_drive=google_drive,
-        aws=aws,
-        migration=migration,
-        prefix_disambiguation=prefix_disambiguation,
-    )
+def _compile_config_paths() -> Dict[str, _PathEntry]:
+    paths: Dict[str, _PathEntry] = {}
+
+    def walk(cls: type, prefix: Tuple[str, ...]) -> None:
+        for name, nested, _ in _FIELD_SPECS[cls]:
+            segments = prefix + (name,)
+            path = ".".join(segments)
+            paths[path] = (attrgetter(path), segments)
+            if nested is not None:
+                walk(nested, segments)
+
+    walk(Config, ())
+    return paths
+
+
+_CONFIG_PATHS = _compile_config_paths()
+
+
+# Environment variables that override a config field when set and non-empty.
+_ENV_OVERRIDES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("AWS_REGION", ("aws", "region")),
+    ("AMPLIFY_API_ENDPOINT", ("aws", "amplify", "api_endpoint")),
+    ("GOOGLE_APPLICATION_CREDENTIALS", ("google_drive", "credentials_path")),
+)
+
+
+def _unknown_segment(key: str) -> str:
+    segments = key.split(".")
+    for i, segment in enumerate(segments):
+        if ".".join(segments[: i + 1]) not in _CONFIG_PATHS:
+            return segment
+    return segments[-1]
+
+
+def _replace_path(obj: Any, segments: Tuple[str, ...], value: Any) -> Any:
+    """Return a copy of a frozen config tree with the field at segments replaced."""
+    name = segments[0]
+    if len(segments) > 1:
+        value = _replace_path(getattr(obj, name), segments[1:], value)
+    return replace(obj, **{name: value})
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _build(cls: type, data: Dict[str, Any]) -> Any:
+    kwargs: Dict[str, Any] = {}
+    for name, nested, default in _FIELD_SPECS[cls]:
+        if nested is not None:
+            kwargs[name] = _build(nested, data.get(name, {}))
+        elif name in data:
+            kwargs[name] = _copy_value(data[name])
+        else:
+            kwargs[name] = default()
+    return cls(**kwargs)
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Serialize a config dataclass to nested dicts.
+
+    Mutable containers are shallow-copied so callers can't mutate the config
+    through the returned dict.
+    """
+    result: Dict[str, Any] = {}
+    for name, nested, _ in _FIELD_SPECS[type(obj)]:
+        value = getattr(obj, name)
+        result[name] = _to_dict(value) if nested is not None else _copy_value(value)
+    return result
+
+
+def config_to_dict(config: Config) -> dict:
+    return _to_dict(config)
+
+
+def config_from_dict(data: dict) -> Config:
+    mig_data = data.get("migration", {})
+    if "max_workers" not in mig_data and "concurrency" in mig_data:
+        mig_data = {**mig_data, "max_workers": mig_data["concurrency"]}
+        data = {**data, "migration": mig_data}
+    config: Config = _build(Config, data)
+    return config
 
 
 class ConfigManager:
@@ -229,45 +296,37 @@ class ConfigManager:
                 "Run 'amplify-media-migrator config' to create one."
             )
 
+        config = config_from_dict(self._read_data())
+
+        environ = os.environ
+        for env_var, segments in _ENV_OVERRIDES:
+            value = environ.get(env_var)
+            if value:
+                config = _replace_path(config, segments, value)
+                logger.debug(
+                    "Overriding %s from %s environment variable",
+                    ".".join(segments),
+                    env_var,
+                )
+
+        config.validate()
+        self._config = config
+        logger.info("Configuration loaded from %s", self._config_path)
+        return config
+
+    def _read_data(self) -> Dict[str, Any]:
         try:
-            raw = self._config_path.read_text(encoding="utf-8")
+            raw = self._config_path.read_bytes()
         except OSError as e:
             raise ConfigurationError(f"Failed to read configuration file: {e}") from e
 
         try:
-            data = json.loads(raw)
+            data: Dict[str, Any] = loads(raw)
         except json.JSONDecodeError as e:
             raise ConfigurationError(
                 f"Invalid JSON in configuration file {self._config_path}: {e}"
             ) from e
-
-        config = config_from_dict(data)
-
-        aws_region = os.environ.get("AWS_REGION")
-        if aws_region:
-            config.aws.region = aws_region
-            logger.debug("Overriding aws.region from AWS_REGION environment variable")
-
-        api_endpoint = os.environ.get("AMPLIFY_API_ENDPOINT")
-        if api_endpoint:
-            config.aws.amplify.api_endpoint = api_endpoint
-            logger.debug(
-                "Overriding aws.amplify.api_endpoint from "
-                "AMPLIFY_API_ENDPOINT environment variable"
-            )
-
-        credentials_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
-        if credentials_path:
-            config.google_drive.credentials_path = credentials_path
-            logger.debug(
-                "Overriding google_drive.credentials_path from "
-                "GOOGLE_APPLICATION_CREDENTIALS environment variable"
-            )
-
-        config.validate()
-        self._config = config
-        logger.info("Configuration loaded from %s", self._config_path)
-        return config
+        return data
 
     def save(self) -> None:
         self.ensure_config_dir()
@@ -275,9 +334,7 @@ class ConfigManager:
             self._config = Config()
         data = config_to_dict(self._config)
         try:
-            self._config_path.write_text(
-                json.dumps(data, indent=2) + "\n", encoding="utf-8"
-            )
+            write_atomic(self._config_path, dumps_pretty(data))
         except OSError as e:
             raise ConfigurationError(f"Failed to write configuration file: {e}") from e
         logger.info("Configuration saved to %s", self._config_path)
@@ -288,13 +345,10 @@ class ConfigManager:
                 self.load()
             except ConfigurationError:
                 self._config = Config()
-        segments = key.split(".")
-        obj: Any = self._config
-        for segment in segments:
-            if not hasattr(obj, segment):
-                return default
-            obj = getattr(obj, segment)
-        return obj
+        entry = _CONFIG_PATHS.get(key)
+        if entry is None:
+            return default
+        return entry[0](self._config)
 
     def set(self, key: str, value: Any) -> None:
         if self._config is None:
@@ -303,25 +357,13 @@ class ConfigManager:
             except ConfigurationError:
                 self._config = Config()
 
-        segments = key.split(".")
-        if len(segments) < 1:
-            raise ConfigurationError(f"Invalid configuration key: {key}")
-
-        obj: Any = self._config
-        for segment in segments[:-1]:
-            if not hasattr(obj, segment):
-                raise ConfigurationError(
-                    f"Invalid configuration key: {key} "
-                    f"(unknown segment '{segment}')"
-                )
-            obj = getattr(obj, segment)
-
-        final = segments[-1]
-        if not hasattr(obj, final):
+        entry = _CONFIG_PATHS.get(key)
+        if entry is None:
             raise ConfigurationError(
-                f"Invalid configuration key: {key} " f"(unknown segment '{final}')"
+                f"Invalid configuration key: {key} "
+                f"(unknown segment '{_unknown_segment(key)}')"
             )
-        setattr(obj, final, value)
+        self._config = _replace_path(self._config, entry[1], value)
 
     def update(self, key: str, value: Any) -> None:
         self.set(key, value)
@@ -1,6 +1,21 @@
-from .engine import MigrationEngine
-from .progress import ProgressTracker, FileStatus, FileProgress
-from .mapper import FilenameMapper, ParsedFilename, FilenamePattern
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .engine import MigrationEngine
+    from .mapper import FilenameMapper, FilenamePattern, ParsedFilename
+    from .progress import FileProgress, FileStatus, ProgressTracker
+
+_LAZY_ATTRS = {
+    "MigrationEngine": ".engine",
+    "ProgressTracker": ".progress",
+    "FileStatus": ".progress",
+    "FileProgress": ".progress",
+    "FilenameMapper": ".mapper",
+    "ParsedFilename": ".mapper",
+    "FilenamePattern": ".mapper",
+}
 
 __all__ = [
     "MigrationEngine",
@@ -11,3 +26,6 @@ __all__ = [
     "ParsedFilename",
     "FilenamePattern",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
@@ -2,7 +2,20 @@ import asyncio
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import (
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 @dataclass
@@ -217,3 +230,68 @@ class ConcurrencyController:
                 on_limit(self.current_limit())
             await self.notify_waiters()
             last_total, last_time = total, now
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesce single-item async calls into batched calls.
+
+    ``submit`` parks the caller until its item's batch is flushed, either when
+    ``max_size`` items are pending or ``max_delay_seconds`` after the first one
+    arrived. ``flush_fn`` returns one result per item, in order; an Exception
+    in a result slot is raised to that item's caller only.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[T]], Awaitable[List[Union[R, Exception]]]],
+        max_size: int = 25,
+        max_delay_seconds: float = 0.25,
+    ) -> None:
+        self._flush_fn = flush_fn
+        self._max_size = max_size
+        self._max_delay = max_delay_seconds
+        self._pending: List[Tuple[T, "asyncio.Future[R]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[R]" = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        # Hold a reference so the task is not garbage-collected mid-flight.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, "asyncio.Future[R]"]]) -> None:
+        try:
+            results = await self._flush_fn([item for item, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            for _, future in batch:
+                future.cancel()
+            raise
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
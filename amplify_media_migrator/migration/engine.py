@@ -1,14 +1,27 @@
 import asyncio
 import concurrent.futures
+import itertools
 import logging
 import random
 import threading
-from typing import Callable, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..auth.token_manager import CognitoTokenManager
 from ..sources.google_drive import DriveFile, GoogleDriveClient
 from ..targets.amplify_storage import AmplifyStorageClient
-from ..targets.graphql_client import GraphQLClient, Media, Observation
+from ..targets.graphql_client import GraphQLClient, Media, MediaInput, Observation
 from ..utils.exceptions import (
     AuthenticationError,
     DownloadError,
@@ -17,11 +30,12 @@ from ..utils.exceptions import (
     RateLimitError,
     UploadError,
 )
-from ..utils.media import MediaType, get_content_type, get_media_type
+from ..utils.media import MediaType, lookup_media
 from .concurrency import (
     AdaptiveSettings,
     ConcurrencyController,
     InflightBudget,
+    MicroBatcher,
     ThroughputMeter,
 )
 from .mapper import (
@@ -30,11 +44,17 @@ from .mapper import (
     FilenamePattern,
     ParsedFilename,
 )
-from .progress import FileStatus, ProgressTracker
+from .progress import FileProgress, FileStatus, ProgressTracker
 from .reporter import NullReporter, ProgressReporter
 
 logger = logging.getLogger(__name__)
 
+# Files pulled from the Drive listing generator per worker-thread hop; matches
+# the Drive API page size.
+_LISTING_BATCH_SIZE = 1000
+# Observation lookups kept for reuse; least recently used entries go first.
+_OBSERVATION_CACHE_SIZE = 4096
+
 
 class MigrationEngine:
     def __init__(
@@ -55,6 +75,9 @@ class MigrationEngine:
         token_manager: Optional[CognitoTokenManager] = None,
         initial_id_token: Optional[str] = None,
         adaptive: Optional[AdaptiveSettings] = None,
+        media_batch_size: int = 1,
+        upload_chunk_size_mb: int = 8,
+        lookup_batch_size: int = 1,
     ) -> None:
         self._drive_client = drive_client
         self._storage_client = storage_client
@@ -64,15 +87,44 @@ class MigrationEngine:
         self._concurrency = concurrency
         self._retry_attempts = retry_attempts
         self._retry_delay_seconds = retry_delay_seconds
+        self._backoff_table: List[float] = [
+            retry_delay_seconds * (1 << attempt) for attempt in range(retry_attempts)
+        ]
         self._default_media_public = default_media_public
         self._disambiguation_enabled = disambiguation_enabled
         self._discriminator_field = discriminator_field
         self._prefix_rules: Dict[str, str] = prefix_rules or {}
         self._large_file_threshold_bytes: int = large_file_threshold_mb * 1024 * 1024
+        self._upload_chunk_size_mb = upload_chunk_size_mb
         self._token_manager = token_manager
         self._initial_id_token = initial_id_token
         self._uploaded_urls: set[str] = set()
+        self._autosave_thread: Optional[threading.Thread] = None
         self._reporter: ProgressReporter = NullReporter()
+        # With a batch size above 1, createMedia calls from concurrent workers
+        # are coalesced into aliased BatchCreateMedia mutations.
+        self._media_batcher: Optional[MicroBatcher[MediaInput, Media]] = (
+            MicroBatcher(self._flush_media_batch, max_size=media_batch_size)
+            if media_batch_size > 1
+            else None
+        )
+        # Likewise, sequential-ID lookups are coalesced into aliased
+        # listObservations queries; the short delay only gathers in-flight peers.
+        self._observation_batcher: Optional[
+            MicroBatcher[int, Optional[Observation]]
+        ] = (
+            MicroBatcher(
+                self._flush_observation_batch,
+                max_size=lookup_batch_size,
+                max_delay_seconds=0.01,
+            )
+            if lookup_batch_size > 1
+            else None
+        )
+        self._observation_cache: OrderedDict[
+            Tuple[int, Optional[str]], asyncio.Future[Optional[Observation]]
+        ] = OrderedDict()
+        self._observation_cache_loop: Optional[asyncio.AbstractEventLoop] = None
 
         settings = adaptive or AdaptiveSettings()
         self._window_seconds = settings.window_seconds
@@ -100,59 +152,113 @@ class MigrationEngine:
     def _populate_url_cache(self) -> None:
         self._uploaded_urls = {
             fp.s3_url
-            for fp in self._progress.files.values()
-            if fp.s3_url and fp.status == FileStatus.COMPLETED
+            for fp in self._progress.get_files_by_status(FileStatus.COMPLETED)
+            if fp.s3_url
         }
 
-    def _start_autosave(self, interval: float = 30.0) -> threading.Event:
+    def _start_autosave(
+        self,
+        interval: float = 30.0,
+        max_unsaved: int = 50,
+        poll: float = 2.0,
+    ) -> threading.Event:
+        """Checkpoint progress from a background thread, off the event loop.
+
+        Saves once max_unsaved updates have accumulated, or after interval
+        seconds when anything changed at all, so bursts checkpoint promptly
+        and idle periods don't rewrite an unchanged file.
+        """
         stop = threading.Event()
+        poll = min(poll, interval)
 
         def _loop() -> None:
-            while not stop.wait(interval):
-                self._progress.save()
-
-        threading.Thread(target=_loop, daemon=True, name="autosave").start()
+            saved_revision = self._progress.revision
+            last_save = time.monotonic()
+            while not stop.wait(poll):
+                revision = self._progress.revision
+                if revision == saved_revision:
+                    continue
+                if (
+                    revision - saved_revision >= max_unsaved
+                    or time.monotonic() - last_save >= interval
+                ):
+                    self._progress.save()
+                    saved_revision = revision
+                    last_save = time.monotonic()
+
+        self._autosave_thread = threading.Thread(
+            target=_loop, daemon=True, name="autosave"
+        )
+        self._autosave_thread.start()
         return stop
 
+    def _stop_autosave(self, stop: threading.Event) -> None:
+        """Stop the autosave thread and wait out any save it has in progress."""
+        stop.set()
+        if self._autosave_thread is not None:
+            self._autosave_thread.join()
+            self._autosave_thread = None
+
     async def scan(self, folder_id: str) -> Dict[str, int]:
         self._progress.load(folder_id)
 
-        files = await asyncio.to_thread(
-            lambda: list(self._drive_client.list_files(folder_id))
-        )
-
-        self._progress.set_total_files(len(files))
-
         pattern_counts: Dict[str, int] = {p.value: 0 for p in FilenamePattern}
+        total = 0
+        known = self._progress.files
+        parse = self._mapper.parse
+
+        async for batch in self._list_in_batches(folder_id):
+            total += len(batch)
+            for drive_file in batch:
+                parsed = parse(drive_file.name)
+                pattern_counts[parsed.pattern.value] += 1
+                if self._needs_recording(known.get(drive_file.id)):
+                    self._record_listed_file(drive_file, parsed)
+
+        self._progress.set_total_files(total)
+        self._progress.save()
+        return pattern_counts
 
-        for drive_file in files:
-            parsed = self._mapper.parse(drive_file.name)
-            pattern_counts[parsed.pattern.value] += 1
+    async def _list_in_batches(self, folder_id: str) -> AsyncIterator[List[DriveFile]]:
+        """Pull the Drive listing off the event loop one page at a time.
 
-            existing = self._progress.files.get(drive_file.id)
-            if existing is not None and existing.status != FileStatus.NEEDS_REVIEW:
-                continue
+        Each page is recorded as it arrives instead of materializing the whole
+        folder listing first.
+        """
+        listing = iter(self._drive_client.list_files(folder_id))
+        while True:
+            batch = await asyncio.to_thread(
+                lambda: list(itertools.islice(listing, _LISTING_BATCH_SIZE))
+            )
+            if not batch:
+                return
+            yield batch
 
-            if parsed.pattern == FilenamePattern.INVALID:
-                self._progress.update_file(
-                    file_id=drive_file.id,
-                    filename=drive_file.name,
-                    status=FileStatus.NEEDS_REVIEW,
-                    error=parsed.error,
-                    size=drive_file.size,
-                )
-            else:
-                self._progress.update_file(
-                    file_id=drive_file.id,
-                    filename=drive_file.name,
-                    status=FileStatus.PENDING,
-                    sequential_ids=parsed.sequential_ids,
-                    size=drive_file.size,
-                    checksum=drive_file.checksum,
-                )
+    @staticmethod
+    def _needs_recording(existing: Optional[FileProgress]) -> bool:
+        """New listing entries and needs_review ones (possibly renamed) get parsed."""
+        return existing is None or existing.status is FileStatus.NEEDS_REVIEW
 
-        self._progress.save()
-        return pattern_counts
+    def _record_listed_file(
+        self, drive_file: DriveFile, parsed: ParsedFilename
+    ) -> None:
+        if parsed.pattern == FilenamePattern.INVALID:
+            self._progress.update_file(
+                file_id=drive_file.id,
+                filename=drive_file.name,
+                status=FileStatus.NEEDS_REVIEW,
+                error=parsed.error,
+                size=drive_file.size,
+            )
+        else:
+            self._progress.update_file(
+                file_id=drive_file.id,
+                filename=drive_file.name,
+                status=FileStatus.PENDING,
+                sequential_ids=parsed.sequential_ids,
+                size=drive_file.size,
+                checksum=drive_file.checksum,
+            )
 
     async def migrate(
         self,
@@ -205,41 +311,35 @@ class MigrationEngine:
     async def _build_work_with_scan(
         self, folder_id: str, dry_run: bool, retry_orphans: bool
     ) -> List[DriveFile]:
-        files = await asyncio.to_thread(
-            lambda: list(self._drive_client.list_files(folder_id))
-        )
-        self._progress.set_total_files(len(files))
-
-        for drive_file in files:
-            existing = self._progress.files.get(drive_file.id)
-            if existing is not None and existing.status != FileStatus.NEEDS_REVIEW:
-                continue
-            parsed = self._mapper.parse(drive_file.name)
-            if parsed.pattern == FilenamePattern.INVALID:
-                self._progress.update_file(
-                    file_id=drive_file.id,
-                    filename=drive_file.name,
-                    status=FileStatus.NEEDS_REVIEW,
-                    error=parsed.error,
-                    size=drive_file.size,
-                )
-            else:
-                self._progress.update_file(
-                    file_id=drive_file.id,
-                    filename=drive_file.name,
-                    status=FileStatus.PENDING,
-                    sequential_ids=parsed.sequential_ids,
-                    size=drive_file.size,
-                    checksum=drive_file.checksum,
-                )
-
-        self._requeue_as_pending(self._collect_retryable_ids(retry_orphans))
+        # Listing never touches entries outside pending/needs_review, so the
+        # retry set can be taken up front and work selected in the same pass.
+        retryable_ids = self._collect_retryable_ids(retry_orphans)
+        work: List[DriveFile] = []
+        total = 0
+        # load() has already run, so the dict and bound methods are stable for
+        # the whole pass; one lookup per file covers both checks.
+        known = self._progress.files
+        parse = self._mapper.parse
+        pending = FileStatus.PENDING
+
+        async for batch in self._list_in_batches(folder_id):
+            total += len(batch)
+            for drive_file in batch:
+                fp = known.get(drive_file.id)
+                if self._needs_recording(fp):
+                    self._record_listed_file(drive_file, parse(drive_file.name))
+                    fp = known[drive_file.id]
+                assert fp is not None
+                if fp.status is pending or drive_file.id in retryable_ids:
+                    work.append(drive_file)
+
+        self._progress.set_total_files(total)
+        self._requeue_as_pending(retryable_ids)
 
         if not dry_run:
             self._progress.save()
 
-        pending_ids = set(self._progress.get_pending_file_ids())
-        return [f for f in files if f.id in pending_ids]
+        return work
 
     async def _build_work_from_progress(self, retry_orphans: bool) -> List[DriveFile]:
         pending_ids = set(self._progress.get_pending_file_ids())
@@ -270,13 +370,9 @@ class MigrationEngine:
             logger.info(
                 "Checking %d needs_review files for renames...", len(needs_review_ids)
             )
-            review_tasks = [
-                self._fetch_and_evaluate_needs_review(file_id)
-                for file_id in needs_review_ids
-            ]
-            for drive_file in await asyncio.gather(*review_tasks):
-                if drive_file is not None:
-                    files_to_process.append(drive_file)
+            files_to_process.extend(
+                await self._fetch_and_evaluate_needs_review(needs_review_ids)
+            )
 
         return files_to_process
 
@@ -297,8 +393,8 @@ class MigrationEngine:
             return (f.checksum, frozenset(parsed_by_id[f.id].sequential_ids))
 
         claimed: Dict[tuple, str] = {}
-        for fp in self._progress.files.values():
-            if fp.status == FileStatus.COMPLETED and fp.checksum and fp.sequential_ids:
+        for fp in self._progress.get_files_by_status(FileStatus.COMPLETED):
+            if fp.checksum and fp.sequential_ids:
                 claimed.setdefault(
                     (fp.checksum, frozenset(fp.sequential_ids)), fp.filename
                 )
@@ -345,8 +441,8 @@ class MigrationEngine:
             await self._run_workers(files_to_process, dry_run)
         finally:
             if _autosave_stop is not None:
-                _autosave_stop.set()
-                self._progress.save()
+                self._stop_autosave(_autosave_stop)
+                self._progress.save(compact=True)
             if self._token_manager:
                 self._token_manager.stop()
             self._graphql_client.close()
@@ -354,22 +450,33 @@ class MigrationEngine:
     async def _run_workers(
         self, files_to_process: List[DriveFile], dry_run: bool
     ) -> None:
-        queue: "asyncio.Queue[DriveFile]" = asyncio.Queue()
-        for file in files_to_process:
-            queue.put_nowait(file)
+        # Workers claim files by advancing one shared position; it is only
+        # moved between awaits, so no queue copy of the work list is needed.
+        position = 0
 
         aborted: List[BaseException] = []
         controller = self._controller
+        prefetches: Set["asyncio.Task[None]"] = set()
 
         async def worker() -> None:
+            nonlocal position
             while not aborted:
                 if controller is not None:
                     await controller.acquire()
                 try:
-                    try:
-                        file = queue.get_nowait()
-                    except asyncio.QueueEmpty:
+                    if position >= len(files_to_process):
                         return
+                    file = files_to_process[position]
+                    position += 1
+                    # Warm the observation lookup for the next unclaimed file,
+                    # without claiming it, so that query overlaps this file's
+                    # transfer and whichever worker frees up first takes it.
+                    if position < len(files_to_process):
+                        task = asyncio.ensure_future(
+                            self._prefetch_observations(files_to_process[position])
+                        )
+                        prefetches.add(task)
+                        task.add_done_callback(prefetches.discard)
                     try:
                         await self.process_file(file, dry_run)
                     except BaseException as exc:  # noqa: BLE001
@@ -380,34 +487,57 @@ class MigrationEngine:
                         await controller.release()
 
         worker_count = min(self._concurrency, len(files_to_process))
-        if controller is not None:
-            stop = asyncio.Event()
-            control_task = asyncio.ensure_future(
-                controller.run(
-                    self._throughput,
-                    stop,
-                    self._window_seconds,
-                    on_limit=self._reporter.on_concurrency,
+        try:
+            if controller is not None:
+                stop = asyncio.Event()
+                control_task = asyncio.ensure_future(
+                    controller.run(
+                        self._throughput,
+                        stop,
+                        self._window_seconds,
+                        on_limit=self._reporter.on_concurrency,
+                    )
                 )
-            )
-            try:
+                try:
+                    await asyncio.gather(*(worker() for _ in range(worker_count)))
+                finally:
+                    stop.set()
+                    await control_task
+            else:
                 await asyncio.gather(*(worker() for _ in range(worker_count)))
-            finally:
-                stop.set()
-                await control_task
-        else:
-            await asyncio.gather(*(worker() for _ in range(worker_count)))
+        finally:
+            for task in prefetches:
+                task.cancel()
+            await asyncio.gather(*prefetches, return_exceptions=True)
 
         if aborted:
             raise aborted[0]
 
+    async def _prefetch_observations(self, file: DriveFile) -> None:
+        parsed = self._mapper.parse(file.name)
+        if parsed.pattern == FilenamePattern.INVALID:
+            return
+        try:
+            await self._lookup_observations(parsed.sequential_ids, parsed.prefix)
+        except MigratorError:
+            # Failed lookups are evicted from the cache, so process_file
+            # repeats the query and reports the error itself.
+            pass
+
     async def _fetch_and_evaluate_needs_review(
-        self, file_id: str
-    ) -> Optional[DriveFile]:
+        self, file_ids: Set[str]
+    ) -> List[DriveFile]:
+        # get_files_metadata splits the ids into Drive batch requests itself.
         try:
-            drive_file = await asyncio.to_thread(
-                self._drive_client.get_file_metadata, file_id
+            drive_files: Dict[str, DriveFile] = await asyncio.to_thread(
+                self._drive_client.get_files_metadata, sorted(file_ids)
             )
+        except MigratorError as e:
+            logger.warning("Could not fetch metadata for needs_review files: %s", e)
+            drive_files = {}
+
+        renamed: List[DriveFile] = []
+        for file_id, drive_file in drive_files.items():
             parsed = self._mapper.parse(drive_file.name)
             if parsed.pattern != FilenamePattern.INVALID:
                 self._progress.update_file(
@@ -416,12 +546,8 @@ class MigrationEngine:
                     status=FileStatus.PENDING,
                     sequential_ids=parsed.sequential_ids,
                 )
-                return drive_file
-        except MigratorError as e:
-            logger.warning(
-                "Could not fetch metadata for needs_review file %s: %s", file_id, e
-            )
-        return None
+                renamed.append(drive_file)
+        return renamed
 
     @staticmethod
     def _select_by_prefix(
@@ -451,7 +577,7 @@ class MigrationEngine:
     ) -> Dict[int, Observation]:
         if self._disambiguation_enabled and prefix is not None:
 
-            async def _lookup(sid: int) -> Optional[Observation]:
+            async def _fetch(sid: int) -> Optional[Observation]:
                 candidates = await asyncio.to_thread(
                     self._graphql_client.get_all_observations_by_sequential_id,
                     sid,
@@ -459,15 +585,26 @@ class MigrationEngine:
                 )
                 return self._select_by_prefix(candidates, prefix, self._prefix_rules)
 
-            tasks = [_lookup(sid) for sid in sequential_ids]
+            fetch: Callable[[int], Awaitable[Optional[Observation]]] = _fetch
+            cache_prefix = prefix
+        elif self._observation_batcher is not None:
+            fetch = self._observation_batcher.submit
+            cache_prefix = None
         else:
-            tasks = [
-                asyncio.to_thread(
+
+            async def _fetch_one(sid: int) -> Optional[Observation]:
+                result: Optional[Observation] = await asyncio.to_thread(
                     self._graphql_client.get_observation_by_sequential_id, sid
                 )
-                for sid in sequential_ids
-            ]
+                return result
+
+            fetch = _fetch_one
+            cache_prefix = None
 
+        tasks = [
+            asyncio.shield(self._cached_lookup((sid, cache_prefix), fetch))
+            for sid in sequential_ids
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         observations: Dict[int, Observation] = {}
         for sid, result in zip(sequential_ids, results):
@@ -477,6 +614,42 @@ class MigrationEngine:
                 observations[sid] = result
         return observations
 
+    def _cached_lookup(
+        self,
+        key: Tuple[int, Optional[str]],
+        fetch: Callable[[int], Awaitable[Optional[Observation]]],
+    ) -> "asyncio.Future[Optional[Observation]]":
+        """Share one lookup per sequential ID (and prefix) for the current run.
+
+        Files for the same observation reuse the in-flight or finished future
+        instead of issuing their own query; failures are evicted so a later
+        file retries. The cache is scoped to the running event loop and holds
+        at most _OBSERVATION_CACHE_SIZE entries.
+        """
+        loop = asyncio.get_running_loop()
+        if self._observation_cache_loop is not loop:
+            self._observation_cache = OrderedDict()
+            self._observation_cache_loop = loop
+
+        future = self._observation_cache.get(key)
+        if future is not None:
+            self._observation_cache.move_to_end(key)
+        else:
+            future = asyncio.ensure_future(fetch(key[0]))
+            self._observation_cache[key] = future
+            if len(self._observation_cache) > _OBSERVATION_CACHE_SIZE:
+                self._observation_cache.popitem(last=False)
+
+            def _evict_on_failure(
+                done: "asyncio.Future[Optional[Observation]]",
+            ) -> None:
+                if done.cancelled() or done.exception() is not None:
+                    if self._observation_cache.get(key) is done:
+                        del self._observation_cache[key]
+
+            future.add_done_callback(_evict_on_failure)
+        return future
+
     async def process_file(
         self,
         file: DriveFile,
@@ -516,8 +689,8 @@ class MigrationEngine:
             self._reporter.on_file_done(file.id, FileStatus.ORPHAN)
             return
 
-        first_obs = next(iter(observations.values()))
-        s3_key = self._mapper.build_s3_key(first_obs.id, file.name)
+        all_obs_ids = [obs.id for obs in observations.values()]
+        s3_key = self._mapper.build_s3_key(all_obs_ids[0], file.name)
         s3_url = self._storage_client.get_url(s3_key)
 
         if s3_url in self._uploaded_urls:
@@ -526,7 +699,7 @@ class MigrationEngine:
                 filename=file.name,
                 status=FileStatus.COMPLETED,
                 sequential_ids=parsed.sequential_ids,
-                observation_ids=[obs.id for obs in observations.values()],
+                observation_ids=all_obs_ids,
                 s3_url=s3_url,
             )
             self._reporter.on_file_done(file.id, FileStatus.COMPLETED)
@@ -543,14 +716,13 @@ class MigrationEngine:
         except MigratorError as e:
             logger.warning("Duplicate check failed for %s: %s", file.name, e)
 
-        target_obs_ids = {obs.id for obs in observations.values()}
-        if target_obs_ids <= already_linked:
+        if already_linked.issuperset(all_obs_ids):
             self._progress.update_file(
                 file_id=file.id,
                 filename=file.name,
                 status=FileStatus.COMPLETED,
                 sequential_ids=parsed.sequential_ids,
-                observation_ids=[obs.id for obs in observations.values()],
+                observation_ids=all_obs_ids,
                 s3_url=s3_url,
             )
             self._uploaded_urls.add(s3_url)
@@ -572,17 +744,21 @@ class MigrationEngine:
 
             def _cb(cumulative: int) -> None:
                 nonlocal last
+                if cumulative < last:
+                    # The count restarted (a retry, or a ranged download
+                    # falling back to a sequential one).
+                    last = 0
                 self._throughput.add(cumulative - last)
                 last = cumulative
                 self._reporter.on_file_bytes(file.id, cumulative)
 
             return _cb
 
-        if stored and stored.status == FileStatus.UPLOADED and stored.s3_url:
+        content_type, media_type = lookup_media(parsed.extension)
+        if stored and stored.status is FileStatus.UPLOADED and stored.s3_url:
             s3_url = stored.s3_url
         elif file.size == 0 or file.size > self._large_file_threshold_bytes:
             self._reporter.on_file_phase(file.id, "uploading")
-            content_type = get_content_type(parsed.extension)
             try:
                 s3_url = await self._stream_upload_with_retry(
                     file, s3_key, content_type, _metered_callback()
@@ -604,7 +780,9 @@ class MigrationEngine:
             async with self._inflight_budget.reserve(file.size):
                 self._reporter.on_file_phase(file.id, "downloading")
                 try:
-                    data = await self._download_with_retry(file.id, _metered_callback())
+                    data = await self._download_with_retry(
+                        file.id, _metered_callback(), file.size
+                    )
                 except AuthenticationError:
                     raise
                 except MigratorError as e:
@@ -619,7 +797,6 @@ class MigrationEngine:
                 )
 
                 self._reporter.on_file_phase(file.id, "uploading")
-                content_type = get_content_type(parsed.extension)
                 try:
                     s3_url = await self._upload_with_retry(
                         file, data, s3_key, content_type, _metered_callback()
@@ -629,6 +806,9 @@ class MigrationEngine:
                 except MigratorError as e:
                     self._mark_failed(file, parsed, f"Upload failed: {e}")
                     return
+                # Drop the payload before the budget is released so the bytes do
+                # not stay resident while the Media records are being linked.
+                del data
 
             self._progress.update_file(
                 file_id=file.id,
@@ -639,7 +819,6 @@ class MigrationEngine:
             )
 
         self._reporter.on_file_phase(file.id, "linking")
-        media_type = get_media_type(parsed.extension)
         media_ids: List[str] = list(stored.media_ids) if stored else []
         observation_ids: List[str] = []
         failed_seq_ids: List[int] = []
@@ -704,25 +883,33 @@ class MigrationEngine:
 
         return _cb
 
+    def _backoff_delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """Server-requested delay, else the exponential step, plus jitter."""
+        return (retry_after or self._backoff_table[attempt]) + random.random()
+
     def _note_retryable_error(self) -> None:
         if self._controller is not None:
             self._controller.record_retryable_error()
 
     async def _download_with_retry(
-        self, file_id: str, on_bytes: Optional[Callable[[int], None]] = None
-    ) -> bytes:
+        self,
+        file_id: str,
+        on_bytes: Optional[Callable[[int], None]] = None,
+        size: Optional[int] = None,
+    ) -> Union[bytes, bytearray]:
         last_error: Optional[MigratorError] = None
         for attempt in range(self._retry_attempts):
             try:
-                data: bytes = await asyncio.to_thread(
-                    self._drive_client.download_file, file_id, on_bytes
+                data: Union[bytes, bytearray] = await asyncio.to_thread(
+                    self._drive_client.download_file, file_id, on_bytes, size
                 )
                 return data
             except RateLimitError as e:
                 last_error = e
                 self._note_retryable_error()
-                delay = e.retry_after or self._retry_delay_seconds * (2**attempt)
-                delay += random.uniform(0, 1)
+                delay = self._backoff_delay(attempt, e.retry_after)
                 logger.warning(
                     "Rate limit downloading %s (attempt %d/%d), retrying in %.1fs",
                     file_id,
@@ -734,7 +921,7 @@ class MigrationEngine:
             except (DownloadError,) as e:
                 last_error = e
                 self._note_retryable_error()
-                delay = self._retry_delay_seconds * (2**attempt) + random.uniform(0, 1)
+                delay = self._backoff_delay(attempt)
                 logger.warning(
                     "Error downloading %s (attempt %d/%d): %s, retrying in %.1fs",
                     file_id,
@@ -753,7 +940,7 @@ class MigrationEngine:
     async def _upload_with_retry(
         self,
         file: DriveFile,
-        data: bytes,
+        data: Union[bytes, bytearray],
         s3_key: str,
         content_type: str,
         on_bytes: Optional[Callable[[int], None]] = None,
@@ -778,8 +965,7 @@ class MigrationEngine:
             except RateLimitError as e:
                 last_error = e
                 self._note_retryable_error()
-                delay = e.retry_after or self._retry_delay_seconds * (2**attempt)
-                delay += random.uniform(0, 1)
+                delay = self._backoff_delay(attempt, e.retry_after)
                 logger.warning(
                     "Rate limit uploading %s (attempt %d/%d), retrying in %.1fs",
                     file.id,
@@ -811,7 +997,7 @@ class MigrationEngine:
                         self._retry_attempts,
                     )
                 self._note_retryable_error()
-                delay = self._retry_delay_seconds * (2**attempt) + random.uniform(0, 1)
+                delay = self._backoff_delay(attempt)
                 logger.warning(
                     "Error uploading %s (attempt %d/%d): %s, retrying in %.1fs",
                     file.id,
@@ -847,7 +1033,7 @@ class MigrationEngine:
                     stream,
                     s3_key,
                     content_type,
-                    8,
+                    self._upload_chunk_size_mb,
                     callback,
                 )
                 return s3_url
@@ -858,8 +1044,7 @@ class MigrationEngine:
                 stream.cancel()
                 last_error = e
                 self._note_retryable_error()
-                delay = e.retry_after or self._retry_delay_seconds * (2**attempt)
-                delay += random.uniform(0, 1)
+                delay = self._backoff_delay(attempt, e.retry_after)
                 logger.warning(
                     "Rate limit streaming %s (attempt %d/%d), retrying in %.1fs",
                     file.id,
@@ -892,7 +1077,7 @@ class MigrationEngine:
                         self._retry_attempts,
                     )
                 self._note_retryable_error()
-                delay = self._retry_delay_seconds * (2**attempt) + random.uniform(0, 1)
+                delay = self._backoff_delay(attempt)
                 logger.warning(
                     "Error streaming %s (attempt %d/%d): %s, retrying in %.1fs",
                     file.id,
@@ -917,6 +1102,10 @@ class MigrationEngine:
         last_error: Optional[MigratorError] = None
         for attempt in range(self._retry_attempts):
             try:
+                if self._media_batcher is not None:
+                    return await self._media_batcher.submit(
+                        MediaInput(url, observation_id, media_type, is_public)
+                    )
                 return await asyncio.to_thread(
                     self._graphql_client.create_media,
                     url,
@@ -927,8 +1116,7 @@ class MigrationEngine:
             except RateLimitError as e:
                 last_error = e
                 self._note_retryable_error()
-                delay = e.retry_after or self._retry_delay_seconds * (2**attempt)
-                delay += random.uniform(0, 1)
+                delay = self._backoff_delay(attempt, e.retry_after)
                 logger.warning(
                     "Rate limit creating media for obs=%s (attempt %d/%d), "
                     "retrying in %.1fs",
@@ -943,7 +1131,7 @@ class MigrationEngine:
                     raise
                 last_error = e
                 self._note_retryable_error()
-                delay = self._retry_delay_seconds * (2**attempt) + random.uniform(0, 1)
+                delay = self._backoff_delay(attempt)
                 logger.warning(
                     "Error creating media for obs=%s (attempt %d/%d): %s, "
                     "retrying in %.1fs",
@@ -960,6 +1148,25 @@ class MigrationEngine:
             operation="CreateMedia",
         )
 
+    async def _flush_observation_batch(
+        self, sequential_ids: List[int]
+    ) -> List[Union[Optional[Observation], Exception]]:
+        results: List[Union[Optional[Observation], Exception]] = list(
+            await asyncio.to_thread(
+                self._graphql_client.batch_get_observations_by_sequential_ids,
+                sequential_ids,
+            )
+        )
+        return results
+
+    async def _flush_media_batch(
+        self, inputs: List[MediaInput]
+    ) -> List[Union[Media, Exception]]:
+        results: List[Union[Media, Exception]] = list(
+            await asyncio.to_thread(self._graphql_client.batch_create_media, inputs)
+        )
+        return results
+
     def _mark_failed(self, file: DriveFile, parsed: ParsedFilename, error: str) -> None:
         self._progress.update_file(
             file_id=file.id,
@@ -971,16 +1178,7 @@ class MigrationEngine:
         self._reporter.on_file_done(file.id, FileStatus.FAILED)
 
     def get_summary(self) -> Dict[str, int]:
-        summary = self._progress.get_summary()
         return {
             "total": self._progress.total_files,
-            "pending": summary.pending,
-            "downloaded": summary.downloaded,
-            "uploaded": summary.uploaded,
-            "completed": summary.completed,
-            "failed": summary.failed,
-            "orphan": summary.orphan,
-            "needs_review": summary.needs_review,
-            "partial": summary.partial,
-            "duplicate": summary.duplicate,
+            **self._progress.get_summary()._asdict(),
         }
@@ -12,7 +12,7 @@ class FilenamePattern(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFilename:
     pattern: FilenamePattern
     sequential_ids: List[int]
@@ -26,26 +26,37 @@ VALID_EXTENSIONS = {"jpg", "jpeg", "jfif", "png", "gif", "mp4", "mov", "avi", "w
 
 COPY_SUFFIX_RE = re.compile(r"\s?\(\d+\)|\s-\s*copy", re.IGNORECASE)
 
-_EXT = r"(jpg|jpeg|jfif|png|gif|mp4|mov|avi|wmv)"
-_PREFIX = r"([A-Za-z]?)"
-_SINGLE_RE = re.compile(rf"^{_PREFIX}(\d+)\.{_EXT}$", re.IGNORECASE)
-_MULTIPLE_RE = re.compile(rf"^{_PREFIX}(\d+)[a-zA-Z]+\.{_EXT}$", re.IGNORECASE)
-_MULTIPLE_SPACE_RE = re.compile(rf"^{_PREFIX}(\d+)\s+[a-zA-Z]+\.{_EXT}$", re.IGNORECASE)
-_MULTIPLE_HYPHEN_RE = re.compile(
-    rf"^{_PREFIX}(\d+)-[^-.]*[^-.\d][^-.]*\.{_EXT}$", re.IGNORECASE
-)
-_RANGE_RE = re.compile(rf"^{_PREFIX}(\d+)-(\d+)\.{_EXT}$", re.IGNORECASE)
-_RANGE_MULTIPLE_RE = re.compile(
-    rf"^{_PREFIX}(\d+)-(\d+)-[^-.]*[^-.\d][^-.]*\.{_EXT}$", re.IGNORECASE
-)
+_EXT = r"(?:jpg|jpeg|jfif|png|gif|mp4|mov|avi|wmv)"
+_WORD_SUFFIX = r"[^-.]*[^-.\d][^-.]*"
 _LIST_ITEM = r"\d+(?:[A-Za-z]*|-[A-Za-z]+)"
-_LIST_RE = re.compile(
-    rf"^{_PREFIX}({_LIST_ITEM}(?:\s*[,+]\s*{_LIST_ITEM})+)\.{_EXT}$",
-    re.IGNORECASE,
+# Every supported pattern folded into one anchored alternation, so parse() is a
+# single match call. Branch order is the precedence order: range (optionally
+# with a word suffix), list, multiple (hyphen, space or letter suffix), single.
+_FILENAME_RE = re.compile(
+    rf"""
+    ^(?P<prefix>[A-Za-z]?)
+    (?:
+        (?P<range_start>\d+)-(?P<range_end>\d+)(?:-{_WORD_SUFFIX})?
+      | (?P<list>{_LIST_ITEM}(?:\s*[,+]\s*{_LIST_ITEM})+)
+      | (?P<multiple>\d+)(?:-{_WORD_SUFFIX}|\s+[a-zA-Z]+|[a-zA-Z]+)
+      | (?P<single>\d+)
+    )
+    \.(?P<ext>{_EXT})$
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_DIGITS_RE = re.compile(r"\d+")
+_EXTENSION_RE = re.compile(rf"\.*{_EXT}", re.IGNORECASE)
+# "jpg" and ".jpg" as plain set members, so is_valid_extension is one lookup.
+_VALID_EXTENSIONS_DOTTED = frozenset(
+    VALID_EXTENSIONS | {f".{ext}" for ext in VALID_EXTENSIONS}
 )
 
 
 def _strip_copy_suffix(filename: str) -> str:
+    # Both copy-suffix forms need "(" or "-"; most names have neither.
+    if "(" not in filename and "-" not in filename:
+        return filename
     dot_idx = filename.rfind(".")
     if dot_idx == -1:
         return COPY_SUFFIX_RE.sub("", filename)
@@ -53,18 +64,47 @@ def _strip_copy_suffix(filename: str) -> str:
     return COPY_SUFFIX_RE.sub("", stem) + ext
 
 
+def _parse_plain(filename: str) -> Optional[ParsedFilename]:
+    """Scan the common [prefix]digits[letters].ext shape without the regex engine.
+
+    Returns None for anything else (including names that would be invalid), so
+    the caller falls back to _FILENAME_RE; claimed names parse identically.
+    """
+    dot_idx = filename.rfind(".")
+    stem = filename[:dot_idx]
+    if dot_idx <= 0 or not stem.isascii() or not stem.isalnum():
+        return None
+    ext = filename[dot_idx + 1 :].lower()
+    if ext not in VALID_EXTENSIONS:
+        return None
+    prefix = stem[0] if stem[0].isalpha() else ""
+    body = stem[len(prefix) :]
+    suffix = body.lstrip("0123456789")
+    digits = body[: len(body) - len(suffix)]
+    if not digits or (suffix and not suffix.isalpha()):
+        return None
+    return ParsedFilename(
+        pattern=FilenamePattern.MULTIPLE if suffix else FilenamePattern.SINGLE,
+        sequential_ids=[int(digits)],
+        extension=ext,
+        original_filename=filename,
+        prefix=prefix,
+    )
+
+
 class FilenameMapper:
     VALID_EXTENSIONS = VALID_EXTENSIONS
 
     def parse(self, filename: str) -> ParsedFilename:
-        name = _strip_copy_suffix(filename)
-
-        for regex in (_RANGE_RE, _RANGE_MULTIPLE_RE):
-            match = regex.match(name)
-            if match:
-                prefix = match.group(1)
-                start, end = int(match.group(2)), int(match.group(3))
-                ext = match.group(4).lower()
+        plain = _parse_plain(filename)
+        if plain is not None:
+            return plain
+        match = _FILENAME_RE.match(_strip_copy_suffix(filename))
+        if match:
+            prefix = match["prefix"]
+            ext = match["ext"].lower()
+            if match["range_start"] is not None:
+                start, end = int(match["range_start"]), int(match["range_end"])
                 if start > end:
                     return ParsedFilename(
                         pattern=FilenamePattern.INVALID,
@@ -74,46 +114,25 @@ class FilenameMapper:
                         error=f"Range start ({start}) is greater than end ({end})",
                         prefix=prefix,
                     )
-                return ParsedFilename(
-                    pattern=FilenamePattern.RANGE,
-                    sequential_ids=list(range(start, end + 1)),
-                    extension=ext,
-                    original_filename=filename,
-                    prefix=prefix,
-                )
-
-        list_match = _LIST_RE.match(name)
-        if list_match:
-            prefix = list_match.group(1)
-            ids = [int(n) for n in re.findall(r"\d+", list_match.group(2))]
-            ext = list_match.group(3).lower()
+                pattern = FilenamePattern.RANGE
+                ids = list(range(start, end + 1))
+            elif match["list"] is not None:
+                pattern = FilenamePattern.LIST
+                ids = [int(n) for n in _DIGITS_RE.findall(match["list"])]
+            elif match["multiple"] is not None:
+                pattern = FilenamePattern.MULTIPLE
+                ids = [int(match["multiple"])]
+            else:
+                pattern = FilenamePattern.SINGLE
+                ids = [int(match["single"])]
             return ParsedFilename(
-                pattern=FilenamePattern.LIST,
+                pattern=pattern,
                 sequential_ids=ids,
                 extension=ext,
                 original_filename=filename,
                 prefix=prefix,
             )
 
-        for regex, pattern in (
-            (_MULTIPLE_HYPHEN_RE, FilenamePattern.MULTIPLE),
-            (_MULTIPLE_SPACE_RE, FilenamePattern.MULTIPLE),
-            (_MULTIPLE_RE, FilenamePattern.MULTIPLE),
-            (_SINGLE_RE, FilenamePattern.SINGLE),
-        ):
-            match = regex.match(name)
-            if match:
-                prefix = match.group(1)
-                seq_id = int(match.group(2))
-                ext = match.group(3).lower()
-                return ParsedFilename(
-                    pattern=pattern,
-                    sequential_ids=[seq_id],
-                    extension=ext,
-                    original_filename=filename,
-                    prefix=prefix,
-                )
-
         dot_idx = filename.rfind(".")
         ext = filename[dot_idx + 1 :].lower() if dot_idx != -1 else ""
         if ext and ext not in VALID_EXTENSIONS:
@@ -131,7 +150,13 @@ class FilenameMapper:
         )
 
     def is_valid_extension(self, extension: str) -> bool:
-        return extension.lower().lstrip(".") in VALID_EXTENSIONS
+        if extension.lower() in _VALID_EXTENSIONS_DOTTED:
+            return True
+        # Repeated leading dots are rare; leave them to the regex.
+        return (
+            extension.startswith("..")
+            and _EXTENSION_RE.fullmatch(extension) is not None
+        )
 
     def build_s3_key(self, observation_id: str, filename: str) -> str:
         return f"media/{observation_id}/{filename}"
@@ -1,10 +1,20 @@
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from ..utils.json_io import (
+    dumps_line,
+    dumps_pretty,
+    iter_dumps_pretty,
+    loads,
+    write_atomic_chunks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +31,11 @@ class FileStatus(Enum):
     DUPLICATE = "duplicate"
 
 
-@dataclass
+# Plain dict lookup for load(); FileStatus(value) goes through Enum.__call__.
+_STATUS_BY_VALUE: Dict[str, FileStatus] = {s.value: s for s in FileStatus}
+
+
+@dataclass(slots=True)
 class FileProgress:
     filename: str
     status: FileStatus
@@ -30,13 +44,20 @@ class FileProgress:
     s3_url: Optional[str] = None
     media_ids: List[str] = field(default_factory=list)
     error: Optional[str] = None
-    updated_at: Optional[datetime] = None
+    # Epoch seconds; the datetime is only built when updated_at is read, so
+    # loading a large progress file never parses per-file timestamps.
+    updated_at_ts: Optional[float] = None
     size: int = 0
     checksum: Optional[str] = None
 
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        if self.updated_at_ts is None:
+            return None
+        return datetime.fromtimestamp(self.updated_at_ts, tz=timezone.utc)
+
 
-@dataclass
-class ProgressSummary:
+class ProgressSummary(NamedTuple):
     pending: int = 0
     downloaded: int = 0
     uploaded: int = 0
@@ -60,31 +81,48 @@ def _file_progress_to_dict(fp: FileProgress) -> Dict[str, Any]:
         "s3_url": fp.s3_url,
         "media_ids": fp.media_ids,
         "error": fp.error,
-        "updated_at": fp.updated_at.isoformat() if fp.updated_at else None,
+        "updated_at": fp.updated_at_ts,
         "size": fp.size,
         "checksum": fp.checksum,
     }
 
 
 def _file_progress_from_dict(data: Dict[str, Any]) -> FileProgress:
-    updated_at = None
-    if data.get("updated_at"):
-        updated_at = datetime.fromisoformat(data["updated_at"])
+    updated_at = data.get("updated_at") or None
+    if isinstance(updated_at, str):
+        # Progress files written before timestamps moved to epoch seconds.
+        updated_at = datetime.fromisoformat(updated_at).timestamp()
     return FileProgress(
         filename=data["filename"],
-        status=FileStatus(data["status"]),
+        status=_STATUS_BY_VALUE[data["status"]],
         sequential_ids=data.get("sequential_ids", []),
         observation_ids=data.get("observation_ids", []),
         s3_url=data.get("s3_url"),
         media_ids=data.get("media_ids", []),
         error=data.get("error"),
-        updated_at=updated_at,
+        updated_at_ts=updated_at,
         size=data.get("size", 0),
         checksum=data.get("checksum"),
     )
 
 
 class ProgressTracker:
+    """Per-folder migration state, persisted as a snapshot plus an append log.
+
+    save() appends the files changed since the last save to a JSONL log next to
+    the snapshot, so checkpoints cost O(changes) rather than O(files). The
+    snapshot is rewritten (and the log dropped) on save(compact=True), when
+    the header changed, or once the log reaches COMPACT_AFTER records; load()
+    replays the log over the snapshot.
+
+    Each snapshot carries a generation number and every log record the
+    generation it applies to, so a log left behind by a crash between the
+    snapshot replace and the log unlink is skipped instead of replayed over
+    the newer snapshot.
+    """
+
+    COMPACT_AFTER = 10_000
+
     def __init__(self, progress_dir: Optional[Path] = None) -> None:
         self._progress_dir = progress_dir or DEFAULT_PROGRESS_DIR
         self._folder_id: Optional[str] = None
@@ -92,6 +130,21 @@ class ProgressTracker:
         self._updated_at: Optional[datetime] = None
         self._total_files: int = 0
         self._files: Dict[str, FileProgress] = {}
+        # Per-status index kept in step by update_file so status queries and
+        # summaries cost O(matches) instead of a scan over every tracked file.
+        self._by_status: Dict[FileStatus, Dict[str, FileProgress]] = {
+            status: {} for status in FileStatus
+        }
+        self._revision = 0
+        # Files changed since the last save; the lock makes the swap in save()
+        # safe against update_file running on the event loop thread.
+        self._dirty: Dict[str, FileProgress] = {}
+        self._dirty_lock = threading.Lock()
+        # Serializes save() between the autosave thread and the final save.
+        self._save_lock = threading.Lock()
+        self._log_records = 0
+        self._snapshot_current = False
+        self._generation = 0
 
     @property
     def progress_path(self) -> Optional[Path]:
@@ -99,6 +152,12 @@ class ProgressTracker:
             return None
         return self._progress_dir / f"progress_{self._folder_id}.json"
 
+    @property
+    def log_path(self) -> Optional[Path]:
+        if self._folder_id is None:
+            return None
+        return self._progress_dir / f"progress_{self._folder_id}.log.jsonl"
+
     @property
     def folder_id(self) -> Optional[str]:
         return self._folder_id
@@ -111,37 +170,42 @@ class ProgressTracker:
     def files(self) -> Dict[str, FileProgress]:
         return self._files
 
+    @property
+    def revision(self) -> int:
+        """Number of update_file calls so far; lets savers skip unchanged state."""
+        return self._revision
+
     def load(self, folder_id: str) -> bool:
         self._folder_id = folder_id
         path = self.progress_path
         assert path is not None
+        self._dirty = {}
+        self._log_records = 0
+        self._snapshot_current = False
 
         if not path.exists():
-            self._started_at = datetime.now(timezone.utc)
-            self._updated_at = self._started_at
-            self._total_files = 0
-            self._files = {}
+            self._reset_state()
             logger.info("No existing progress file for folder %s", folder_id)
             return False
 
         try:
-            raw = path.read_text(encoding="utf-8")
-            data = json.loads(raw)
+            data = loads(path.read_bytes())
         except (OSError, json.JSONDecodeError) as e:
             logger.warning("Failed to load progress file: %s", e)
-            self._started_at = datetime.now(timezone.utc)
-            self._updated_at = self._started_at
-            self._total_files = 0
-            self._files = {}
+            self._reset_state()
             return False
 
         self._started_at = datetime.fromisoformat(data["started_at"])
         self._updated_at = datetime.fromisoformat(data["updated_at"])
         self._total_files = data.get("total_files", 0)
+        self._generation = data.get("generation", 0)
         self._files = {
             file_id: _file_progress_from_dict(file_data)
             for file_id, file_data in data.get("files", {}).items()
         }
+        self._snapshot_current = True
+        self._replay_log()
+        self._rebuild_status_index()
         logger.info(
             "Loaded progress for folder %s: %d files tracked",
             folder_id,
@@ -149,30 +213,116 @@ class ProgressTracker:
         )
         return True
 
-    def save(self) -> None:
+    def save(self, compact: bool = False) -> None:
         path = self.progress_path
         if path is None:
             raise RuntimeError("Cannot save: no folder_id set. Call load() first.")
 
-        self._updated_at = datetime.now(timezone.utc)
+        with self._save_lock:
+            self._updated_at = datetime.now(timezone.utc)
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, {}
+
+            try:
+                if (
+                    compact
+                    or not self._snapshot_current
+                    or self._log_records + len(dirty) >= self.COMPACT_AFTER
+                ):
+                    self._write_snapshot(path)
+                elif dirty:
+                    self._append_log(dirty)
+            except BaseException:
+                # Keep the unsaved changes for the next save; entries updated
+                # since the swap are newer and win.
+                with self._dirty_lock:
+                    self._dirty = {**dirty, **self._dirty}
+                raise
+
+    def _write_snapshot(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {
-            "folder_id": self._folder_id,
-            "started_at": self._started_at.isoformat() if self._started_at else None,
-            "updated_at": self._updated_at.isoformat(),
-            "total_files": self._total_files,
-            "files": {
-                file_id: _file_progress_to_dict(fp)
-                for file_id, fp in self._files.items()
-            },
-            "summary": self._build_summary_dict(),
-        }
-
-        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        generation = self._generation + 1
+        # Stream the files section entry by entry so a large folder never
+        # exists as one dict of dicts or one serialized buffer.
+        files = (
+            (file_id, _file_progress_to_dict(fp))
+            for file_id, fp in list(self._files.items())
+        )
+        members = (
+            ("folder_id", self._folder_id),
+            ("started_at", self._started_at.isoformat() if self._started_at else None),
+            ("updated_at", self._updated_at.isoformat() if self._updated_at else None),
+            ("generation", generation),
+            ("total_files", self._total_files),
+            ("files", files),
+            ("summary", self._build_summary_dict()),
+        )
+        write_atomic_chunks(path, iter_dumps_pretty(members))
+        self._generation = generation
+        log_path = self.log_path
+        assert log_path is not None
+        log_path.unlink(missing_ok=True)
+        self._log_records = 0
+        self._snapshot_current = True
         logger.info("Progress saved to %s", path)
 
+    def _append_log(self, dirty: Dict[str, FileProgress]) -> None:
+        log_path = self.log_path
+        assert log_path is not None
+        payload = b"".join(
+            dumps_line(
+                {
+                    "id": file_id,
+                    "generation": self._generation,
+                    **_file_progress_to_dict(fp),
+                }
+            )
+            for file_id, fp in dirty.items()
+        )
+        with log_path.open("ab") as f:
+            f.write(payload)
+        self._log_records += len(dirty)
+        logger.debug("Appended %d progress records to %s", len(dirty), log_path)
+
+    def _replay_log(self) -> None:
+        log_path = self.log_path
+        assert log_path is not None
+        try:
+            lines = log_path.read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("Failed to read progress log: %s", e)
+            return
+        for line in lines:
+            try:
+                record = loads(line)
+                file_id = record.pop("id")
+                if record.pop("generation", 0) != self._generation:
+                    # Written against an older snapshot; the crash came after
+                    # the snapshot replace, so the snapshot already has it.
+                    # The next save compacts the stale log away.
+                    self._snapshot_current = False
+                    continue
+                self._files[file_id] = _file_progress_from_dict(record)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                # A crash mid-append can leave a torn final line.
+                logger.warning("Skipping unreadable progress log record: %s", e)
+                continue
+            self._log_records += 1
+
+    def _reset_state(self) -> None:
+        self._started_at = datetime.now(timezone.utc)
+        self._updated_at = self._started_at
+        self._total_files = 0
+        self._generation = 0
+        self._files = {}
+        self._rebuild_status_index()
+
     def set_total_files(self, total: int) -> None:
+        if total != self._total_files:
+            # The header lives only in the snapshot.
+            self._snapshot_current = False
         self._total_files = total
 
     def update_file(
@@ -188,8 +338,12 @@ class ProgressTracker:
         size: Optional[int] = None,
         checksum: Optional[str] = None,
     ) -> None:
+        self._revision += 1
         existing = self._files.get(file_id)
         if existing:
+            if existing.status is not status:
+                del self._by_status[existing.status][file_id]
+                self._by_status[status][file_id] = existing
             existing.status = status
             if sequential_ids is not None:
                 existing.sequential_ids = sequential_ids
@@ -204,9 +358,10 @@ class ProgressTracker:
             if checksum is not None:
                 existing.checksum = checksum
             existing.error = error
-            existing.updated_at = datetime.now(timezone.utc)
+            existing.updated_at_ts = time.time()
+            entry = existing
         else:
-            self._files[file_id] = FileProgress(
+            entry = FileProgress(
                 filename=filename,
                 status=status,
                 sequential_ids=sequential_ids or [],
@@ -214,83 +369,66 @@ class ProgressTracker:
                 s3_url=s3_url,
                 media_ids=media_ids or [],
                 error=error,
-                updated_at=datetime.now(timezone.utc),
+                updated_at_ts=time.time(),
                 size=size or 0,
                 checksum=checksum,
             )
+            self._files[file_id] = self._by_status[status][file_id] = entry
+        with self._dirty_lock:
+            self._dirty[file_id] = entry
 
     def get_file(self, file_id: str) -> Optional[FileProgress]:
         return self._files.get(file_id)
 
     def get_files_by_status(self, status: FileStatus) -> List[FileProgress]:
-        return [fp for fp in self._files.values() if fp.status == status]
+        return list(self._by_status[status].values())
 
     def get_summary(self) -> ProgressSummary:
-        summary = ProgressSummary()
-        for fp in self._files.values():
-            attr = fp.status.value
-            setattr(summary, attr, getattr(summary, attr) + 1)
-        return summary
+        return ProgressSummary(
+            **{status.value: len(files) for status, files in self._by_status.items()}
+        )
 
     def get_pending_file_ids(self) -> List[str]:
-        return [
-            fid for fid, fp in self._files.items() if fp.status == FileStatus.PENDING
-        ]
+        return list(self._by_status[FileStatus.PENDING])
 
     def get_failed_file_ids(self) -> List[str]:
-        return [
-            fid for fid, fp in self._files.items() if fp.status == FileStatus.FAILED
-        ]
+        return list(self._by_status[FileStatus.FAILED])
 
     def get_partial_file_ids(self) -> List[str]:
-        return [
-            fid for fid, fp in self._files.items() if fp.status == FileStatus.PARTIAL
-        ]
+        return list(self._by_status[FileStatus.PARTIAL])
 
     def get_needs_review_file_ids(self) -> List[str]:
-        return [
-            fid
-            for fid, fp in self._files.items()
-            if fp.status == FileStatus.NEEDS_REVIEW
-        ]
+        return list(self._by_status[FileStatus.NEEDS_REVIEW])
 
     def get_orphan_file_ids(self) -> List[str]:
-        return [
-            fid for fid, fp in self._files.items() if fp.status == FileStatus.ORPHAN
-        ]
+        return list(self._by_status[FileStatus.ORPHAN])
 
     def get_duplicate_file_ids(self) -> List[str]:
-        return [
-            fid for fid, fp in self._files.items() if fp.status == FileStatus.DUPLICATE
-        ]
+        return list(self._by_status[FileStatus.DUPLICATE])
 
     def get_interrupted_file_ids(self) -> List[str]:
         """Return files stuck in transient mid-flight states from a killed run."""
-        return [
-            fid
-            for fid, fp in self._files.items()
-            if fp.status in (FileStatus.DOWNLOADED, FileStatus.UPLOADED)
-        ]
+        return list(self._by_status[FileStatus.DOWNLOADED]) + list(
+            self._by_status[FileStatus.UPLOADED]
+        )
 
     def export_to_json(self, status: FileStatus, output_path: Path) -> int:
+        # Exports are read by people, so timestamps stay ISO 8601 here even
+        # though the snapshot and log store epoch seconds.
         matching = {
-            fid: _file_progress_to_dict(fp)
-            for fid, fp in self._files.items()
-            if fp.status == status
+            fid: {
+                **_file_progress_to_dict(fp),
+                "updated_at": fp.updated_at.isoformat() if fp.updated_at else None,
+            }
+            for fid, fp in self._by_status[status].items()
         }
-        output_path.write_text(json.dumps(matching, indent=2) + "\n", encoding="utf-8")
+        output_path.write_bytes(dumps_pretty(matching))
         return len(matching)
 
+    def _rebuild_status_index(self) -> None:
+        self._by_status = {status: {} for status in FileStatus}
+        for file_id, fp in self._files.items():
+            self._by_status[fp.status][file_id] = fp
+
     def _build_summary_dict(self) -> Dict[str, int]:
-        summary = self.get_summary()
-        return {
-            "pending": summary.pending,
-            "downloaded": summary.downloaded,
-            "uploaded": summary.uploaded,
-            "completed": summary.completed,
-            "failed": summary.failed,
-            "orphan": summary.orphan,
-            "needs_review": summary.needs_review,
-            "partial": summary.partial,
-            "duplicate": summary.duplicate,
-        }
+        return self.get_summary()._asdict()
@@ -1,6 +1,19 @@
-from .google_drive import GoogleDriveClient, DriveFile
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .google_drive import DriveFile, GoogleDriveClient
+
+_LAZY_ATTRS = {
+    "GoogleDriveClient": ".google_drive",
+    "DriveFile": ".google_drive",
+}
 
 __all__ = [
     "GoogleDriveClient",
     "DriveFile",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
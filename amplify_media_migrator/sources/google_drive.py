@@ -2,9 +2,23 @@ import io
 import logging
 import threading
 import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, NoReturn, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httplib2
 from google_auth_httplib2 import AuthorizedHttp
@@ -25,6 +39,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+_METADATA_FIELDS = "id,name,mimeType,size,parents,md5Checksum"
+# Drive's batch endpoint accepts at most 100 calls per HTTP request.
+_METADATA_BATCH_SIZE = 100
+# Buffered downloads at least this large are fetched as parallel byte ranges
+# of at least _RANGE_MIN_PART bytes, over at most _RANGE_PARTS connections.
+# Files the engine streams (above its stream threshold) never come through
+# download_file, so this only covers mid-sized buffered files.
+_RANGE_DOWNLOAD_MIN_BYTES = 16 * 1024 * 1024
+_RANGE_MIN_PART = 4 * 1024 * 1024
+_RANGE_PARTS = 8
+# Upper bound on range threads; each one builds its own Drive service.
+_RANGE_POOL_MAX_THREADS = 32
+# Files known to be smaller than this are fetched with one plain GET.
+_SINGLE_REQUEST_MAX_BYTES = 8 * 1024 * 1024
 
 
 def sanitize_filename(name: str) -> str:
@@ -32,7 +60,7 @@ def sanitize_filename(name: str) -> str:
     return cleaned.strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveFile:
     id: str
     name: str
@@ -45,19 +73,40 @@ class DriveFile:
         self.name = sanitize_filename(self.name)
 
 
+def _drive_file_from_metadata(data: Dict[str, Any]) -> DriveFile:
+    parents = data.get("parents", [])
+    return DriveFile(
+        id=data["id"],
+        name=data["name"],
+        mime_type=data.get("mimeType", ""),
+        size=int(data.get("size", 0)),
+        parent_id=parents[0] if parents else None,
+        checksum=data.get("md5Checksum"),
+    )
+
+
 class GoogleDriveClient:
     def __init__(
         self,
         credentials: Any,
         rate_limiter: Optional[RateLimiter] = None,
         timeout_seconds: float = 300.0,
+        download_chunk_size_mb: int = 8,
+        max_workers: int = 1,
     ) -> None:
         self._credentials = credentials
         self._rate_limiter = rate_limiter or RateLimiter()
         self._timeout_seconds = timeout_seconds
+        self._download_chunk_size = download_chunk_size_mb * 1024 * 1024
         self._connected = False
         # Each thread gets its own service instance (httplib2 is not thread-safe)
         self._local = threading.local()
+        # Room for every concurrent download's ranges, up to a fixed cap.
+        self._range_pool_size = min(
+            max(1, max_workers) * _RANGE_PARTS, _RANGE_POOL_MAX_THREADS
+        )
+        self._range_pool: Optional[ThreadPoolExecutor] = None
+        self._range_pool_lock = threading.Lock()
 
     def connect(self) -> None:
         self._connected = True
@@ -112,61 +161,134 @@ class GoogleDriveClient:
         folder_id: str,
         recursive: bool = True,
     ) -> Iterator[DriveFile]:
+        """Walk the folder tree breadth-first.
+
+        Pages still to fetch wait in a queue as (folder_id, page_token); up to
+        _METADATA_BATCH_SIZE of them, typically sibling folders, go out in one
+        batch request instead of one round trip each.
+        """
+        self._ensure_connected()
+        pending: Deque[Tuple[str, Optional[str]]] = deque([(folder_id, None)])
+
+        while pending:
+            pages = [
+                pending.popleft()
+                for _ in range(min(len(pending), _METADATA_BATCH_SIZE))
+            ]
+            for (parent_id, _), response in zip(pages, self._list_pages(pages)):
+                for file_data in response.get("files", []):
+                    if file_data.get("mimeType", "") == FOLDER_MIME_TYPE:
+                        if recursive:
+                            pending.append((file_data["id"], None))
+                        continue
+                    yield _drive_file_from_metadata(file_data)
+
+                page_token = response.get("nextPageToken")
+                if page_token:
+                    pending.append((parent_id, page_token))
+
+    def _list_pages(
+        self, pages: List[Tuple[str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Fetch one listing page per (folder_id, page_token), in order."""
         service = self._ensure_connected()
-        query = f"'{folder_id}' in parents and trashed=false"
-        page_token: Optional[str] = None
 
-        while True:
+        def _list_request(folder_id: str, page_token: Optional[str]) -> Any:
+            request_kwargs: Dict[str, Any] = {
+                "q": f"'{folder_id}' in parents and trashed=false",
+                "fields": (
+                    "nextPageToken, "
+                    "files(id, name, mimeType, size, parents, md5Checksum)"
+                ),
+                "pageSize": 1000,
+                "supportsAllDrives": True,
+                "includeItemsFromAllDrives": True,
+            }
+            if page_token:
+                request_kwargs["pageToken"] = page_token
+            return service.files().list(**request_kwargs)
+
+        if len(pages) == 1:
+            # A batch of one only adds multipart overhead.
+            self._rate_limiter.acquire()
             try:
-                request_kwargs: Dict[str, Any] = {
-                    "q": query,
-                    "fields": (
-                        "nextPageToken, "
-                        "files(id, name, mimeType, size, parents, md5Checksum)"
-                    ),
-                    "pageSize": 1000,
-                    "supportsAllDrives": True,
-                    "includeItemsFromAllDrives": True,
-                }
-                if page_token:
-                    request_kwargs["pageToken"] = page_token
-
-                self._rate_limiter.acquire()
-                response = service.files().list(**request_kwargs).execute()
+                return [_list_request(*pages[0]).execute()]
             except HttpError as e:
                 self._handle_http_error(e)
 
-            files = response.get("files", [])
-
-            for file_data in files:
-                mime_type = file_data.get("mimeType", "")
-
-                if mime_type == FOLDER_MIME_TYPE:
-                    if recursive:
-                        yield from self.list_files(file_data["id"], recursive=True)
-                    continue
-
-                parents = file_data.get("parents", [])
-                yield DriveFile(
-                    id=file_data["id"],
-                    name=file_data["name"],
-                    mime_type=mime_type,
-                    size=int(file_data.get("size", 0)),
-                    parent_id=parents[0] if parents else None,
-                    checksum=file_data.get("md5Checksum"),
+        responses: List[Dict[str, Any]] = [{} for _ in pages]
+        errors: List[HttpError] = []
+
+        def _on_response(
+            request_id: str, response: Any, exception: Optional[HttpError]
+        ) -> None:
+            if exception is not None:
+                errors.append(exception)
+                return
+            responses[int(request_id)] = response
+
+        batch = service.new_batch_http_request(callback=_on_response)
+        for index, (folder_id, page_token) in enumerate(pages):
+            self._rate_limiter.acquire()
+            batch.add(_list_request(folder_id, page_token), request_id=str(index))
+        try:
+            batch.execute()
+        except HttpError as e:
+            self._handle_http_error(e)
+        if errors:
+            # A missing page would silently drop part of the tree.
+            self._handle_http_error(errors[0])
+        return responses
+
+    def probe_folder(self, folder_id: str) -> bool:
+        """Check folder access with a single one-item listing; True if non-empty."""
+        service = self._ensure_connected()
+        try:
+            self._rate_limiter.acquire()
+            response = (
+                service.files()
+                .list(
+                    q=f"'{folder_id}' in parents and trashed=false",
+                    fields="files(id)",
+                    pageSize=1,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
                 )
+                .execute()
+            )
+        except HttpError as e:
+            self._handle_http_error(e, file_id=folder_id)
 
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        return bool(response.get("files"))
 
     def download_file(
-        self, file_id: str, on_bytes: Optional[Callable[[int], None]] = None
-    ) -> bytes:
+        self,
+        file_id: str,
+        on_bytes: Optional[Callable[[int], None]] = None,
+        size: Optional[int] = None,
+    ) -> Union[bytes, bytearray]:
+        """Download a whole file into memory.
+
+        When the caller knows the size, small files are one plain request and
+        files of at least _RANGE_DOWNLOAD_MIN_BYTES are fetched as parallel
+        byte ranges, returned as the bytearray they were assembled in.
+        """
+        if size is not None and size >= _RANGE_DOWNLOAD_MIN_BYTES:
+            assembled = self._download_ranges(file_id, size, on_bytes)
+            if assembled is not None:
+                return assembled
+
         service = self._ensure_connected()
         self._rate_limiter.acquire()
         try:
             request = service.files().get_media(fileId=file_id, supportsAllDrives=True)
+            if size is not None and size < _SINGLE_REQUEST_MAX_BYTES:
+                # Skips the chunk loop and the BytesIO copy.
+                data: bytes = request.execute()
+                if on_bytes is not None:
+                    on_bytes(len(data))
+                return data
+
             buffer = io.BytesIO()
             downloader = MediaIoBaseDownload(buffer, request)
 
@@ -185,18 +307,109 @@ class GoogleDriveClient:
                 file_id=file_id,
             ) from e
 
+    def _download_ranges(
+        self,
+        file_id: str,
+        size: int,
+        on_bytes: Optional[Callable[[int], None]],
+    ) -> Optional[bytearray]:
+        """Fetch `size` bytes as concurrent Range requests into one buffer.
+
+        Returns None when the file no longer matches the listed size, so the
+        caller can fall back to a sequential download.
+        """
+        parts = min(_RANGE_PARTS, size // _RANGE_MIN_PART)
+        step = -(-size // parts)
+        buffer = bytearray(size)
+        received = 0
+        progress_lock = threading.Lock()
+
+        def _fetch(start: int) -> bool:
+            nonlocal received
+            end = min(start + step, size) - 1
+            service = self._ensure_connected()
+            self._rate_limiter.acquire()
+            request = service.files().get_media(fileId=file_id, supportsAllDrives=True)
+            request.headers["range"] = f"bytes={start}-{end}"
+            chunk = request.execute()
+            if len(chunk) != end - start + 1:
+                return False
+            buffer[start : end + 1] = chunk
+            if on_bytes is not None:
+                with progress_lock:
+                    received += len(chunk)
+                    on_bytes(received)
+            return True
+
+        pool = self._get_range_pool()
+        futures = [pool.submit(_fetch, start) for start in range(0, size, step)]
+        try:
+            complete = all([future.result() for future in futures])
+        except HttpError as e:
+            if e.resp.status == 416:
+                complete = False
+            else:
+                self._handle_http_error(e, file_id=file_id)
+        except Exception as e:
+            raise DownloadError(
+                f"Network error downloading {file_id}: {e}",
+                file_id=file_id,
+            ) from e
+        finally:
+            for future in futures:
+                future.cancel()
+
+        if not complete:
+            logger.warning(
+                "Size of %s changed since listing; downloading sequentially", file_id
+            )
+            return None
+        return buffer
+
+    def _get_range_pool(self) -> ThreadPoolExecutor:
+        # Shared by all downloads so each range thread keeps its service.
+        with self._range_pool_lock:
+            if self._range_pool is None:
+                self._range_pool = ThreadPoolExecutor(
+                    max_workers=self._range_pool_size,
+                    thread_name_prefix="drive-range",
+                )
+            return self._range_pool
+
     def download_file_to_path(self, file_id: str, destination: Path) -> None:
-        data = self.download_file(file_id)
+        """Stream a file to disk chunk by chunk, never holding it all in memory."""
+        service = self._ensure_connected()
         destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_bytes(data)
+        self._rate_limiter.acquire()
+        try:
+            with destination.open("wb") as fd:
+                request = service.files().get_media(
+                    fileId=file_id, supportsAllDrives=True
+                )
+                downloader = MediaIoBaseDownload(
+                    fd, request, chunksize=self._download_chunk_size
+                )
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+        except HttpError as e:
+            destination.unlink(missing_ok=True)
+            self._handle_http_error(e, file_id=file_id)
+        except Exception as e:
+            destination.unlink(missing_ok=True)
+            raise DownloadError(
+                f"Network error downloading {file_id}: {e}",
+                file_id=file_id,
+            ) from e
 
     def open_download_stream(
-        self, file_id: str, chunk_size: int = 8 * 1024 * 1024
+        self, file_id: str, chunk_size: Optional[int] = None
     ) -> "_QueueStream":
         """Start a background download; return a stream readable by s3.upload_fileobj."""
         from amplify_media_migrator.utils.stream import _QueueStream
 
         stream = _QueueStream()
+        chunksize = chunk_size or self._download_chunk_size
 
         def _download() -> None:
             try:
@@ -205,7 +418,7 @@ class GoogleDriveClient:
                 request = service.files().get_media(
                     fileId=file_id, supportsAllDrives=True
                 )
-                downloader = MediaIoBaseDownload(stream, request, chunksize=chunk_size)
+                downloader = MediaIoBaseDownload(stream, request, chunksize=chunksize)
                 done = False
                 while not done:
                     _, done = downloader.next_chunk()
@@ -235,7 +448,7 @@ class GoogleDriveClient:
                 service.files()
                 .get(
                     fileId=file_id,
-                    fields="id,name,mimeType,size,parents,md5Checksum",
+                    fields=_METADATA_FIELDS,
                     supportsAllDrives=True,
                 )
                 .execute()
@@ -243,15 +456,44 @@ class GoogleDriveClient:
         except HttpError as e:
             self._handle_http_error(e, file_id=file_id)
 
-        parents = result.get("parents", [])
-        return DriveFile(
-            id=result["id"],
-            name=result["name"],
-            mime_type=result.get("mimeType", ""),
-            size=int(result.get("size", 0)),
-            parent_id=parents[0] if parents else None,
-            checksum=result.get("md5Checksum"),
-        )
+        return _drive_file_from_metadata(result)
+
+    def get_files_metadata(self, file_ids: List[str]) -> Dict[str, DriveFile]:
+        """Fetch metadata for many files via batch requests of up to 100 calls.
+
+        Files whose lookup fails are logged and left out of the result.
+        """
+        service = self._ensure_connected()
+        results: Dict[str, DriveFile] = {}
+
+        def _on_response(
+            request_id: str, response: Any, exception: Optional[HttpError]
+        ) -> None:
+            if exception is not None:
+                logger.warning(
+                    "Could not fetch metadata for file %s: %s", request_id, exception
+                )
+                return
+            results[request_id] = _drive_file_from_metadata(response)
+
+        for start in range(0, len(file_ids), _METADATA_BATCH_SIZE):
+            batch = service.new_batch_http_request(callback=_on_response)
+            for file_id in file_ids[start : start + _METADATA_BATCH_SIZE]:
+                self._rate_limiter.acquire()
+                batch.add(
+                    service.files().get(
+                        fileId=file_id,
+                        fields=_METADATA_FIELDS,
+                        supportsAllDrives=True,
+                    ),
+                    request_id=file_id,
+                )
+            try:
+                batch.execute()
+            except HttpError as e:
+                self._handle_http_error(e)
+
+        return results
 
     def get_folder_name(self, folder_id: str) -> str:
         service = self._ensure_connected()
@@ -1,10 +1,34 @@
-from .amplify_storage import AmplifyStorageClient
-from .graphql_client import GraphQLClient, Observation, Media, MediaType
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .amplify_storage import AmplifyStorageClient
+    from .graphql_client import (
+        GraphQLClient,
+        Media,
+        MediaInput,
+        MediaType,
+        Observation,
+    )
+
+_LAZY_ATTRS = {
+    "AmplifyStorageClient": ".amplify_storage",
+    "GraphQLClient": ".graphql_client",
+    "Observation": ".graphql_client",
+    "Media": ".graphql_client",
+    "MediaInput": ".graphql_client",
+    "MediaType": ".graphql_client",
+}
 
 __all__ = [
     "AmplifyStorageClient",
     "GraphQLClient",
     "Observation",
     "Media",
+    "MediaInput",
     "MediaType",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
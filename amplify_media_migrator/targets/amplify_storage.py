@@ -1,7 +1,8 @@
 import io
 import logging
+import time
 from pathlib import Path
-from typing import Any, Callable, NoReturn, Optional
+from typing import Any, Callable, Dict, NoReturn, Optional, Union
 from urllib.parse import quote
 
 import boto3
@@ -13,9 +14,41 @@ from ..utils.exceptions import AuthenticationError, UploadError
 
 logger = logging.getLogger(__name__)
 
+AUTH_ERROR_CODES = frozenset({"AccessDenied", "InvalidAccessKeyId"})
 TOKEN_EXPIRED_CODES = frozenset(
     {"ExpiredToken", "ExpiredTokenException", "RequestExpired", "TokenRefreshRequired"}
 )
+# In-memory payloads above this go through the multipart transfer manager;
+# smaller ones are a single put_object, which skips its thread-pool setup.
+MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+# Parts in flight per multipart transfer; callers size the connection pool
+# as workers * TRANSFER_MAX_CONCURRENCY so parts never wait on a connection.
+TRANSFER_MAX_CONCURRENCY = 8
+# On-disk files: part size for upload_file_multipart and the floor callers are
+# clamped to. Each part is one PUT with fixed per-request overhead, so small
+# parts cap throughput well below the link rate on large files.
+FILE_CHUNK_SIZE_MB = 64
+MIN_FILE_CHUNK_SIZE_MB = 16
+# Read size when the transfer manager pulls data from a file or stream; the
+# 256 KB default costs four times the read calls per part.
+TRANSFER_IO_CHUNKSIZE_KB = 1024
+# connect() with an unchanged ID token keeps the current S3 client while its
+# Identity Pool credentials have at least this many seconds left.
+_CREDENTIALS_REUSE_MARGIN = 30.0
+
+
+def _transfer_config(
+    chunk_size_mb: int,
+    max_concurrency: int = TRANSFER_MAX_CONCURRENCY,
+    io_chunksize_kb: int = TRANSFER_IO_CHUNKSIZE_KB,
+) -> TransferConfig:
+    chunk_size = chunk_size_mb * 1024 * 1024
+    return TransferConfig(
+        multipart_threshold=chunk_size,
+        multipart_chunksize=chunk_size,
+        max_concurrency=max_concurrency,
+        io_chunksize=io_chunksize_kb * 1024,
+    )
 
 
 class AmplifyStorageClient:
@@ -29,45 +62,63 @@ class AmplifyStorageClient:
     ) -> None:
         self._bucket = bucket
         self._region = region
+        self._url_prefix = f"https://{bucket}.s3.{region}.amazonaws.com/"
         self._identity_pool_id = identity_pool_id
         self._user_pool_id = user_pool_id
         self._max_pool_connections = max_pool_connections
         self._client: Optional[Any] = None
         self._credentials_expiry: Optional[float] = None
+        self._connected_token: Optional[str] = None
+        # One session for every client this instance builds, so config files
+        # and endpoint data are loaded once rather than per reconnect.
+        self._session: Optional[boto3.Session] = None
+        self._identity_client: Optional[Any] = None
+        # The Identity Pool maps a user to a fixed IdentityId, so it survives
+        # ID token refreshes and only GetCredentialsForIdentity is repeated.
+        self._identity_id: Optional[str] = None
 
     def connect(self, id_token: str) -> None:
+        if (
+            id_token == self._connected_token
+            and self._client is not None
+            and self._credentials_expiry is not None
+            and self._credentials_expiry - time.time() > _CREDENTIALS_REUSE_MARGIN
+        ):
+            logger.debug("S3 credentials still valid; keeping current client")
+            return
+
         login_provider = (
             f"cognito-idp.{self._region}.amazonaws.com/{self._user_pool_id}"
         )
         logins = {login_provider: id_token}
 
         try:
-            identity_client = boto3.client("cognito-identity", region_name=self._region)
-
-            identity_response = identity_client.get_id(
-                IdentityPoolId=self._identity_pool_id,
-                Logins=logins,
-            )
-            identity_id = identity_response["IdentityId"]
-
-            credentials_response = identity_client.get_credentials_for_identity(
-                IdentityId=identity_id,
-                Logins=logins,
-            )
-            creds = credentials_response["Credentials"]
+            if self._session is None:
+                self._session = boto3.Session(region_name=self._region)
+            if self._identity_client is None:
+                self._identity_client = self._session.client(
+                    "cognito-identity", region_name=self._region
+                )
+            creds = self._get_credentials(self._identity_client, logins)
             expiration = creds.get("Expiration")
             self._credentials_expiry = (
                 expiration.timestamp() if expiration is not None else None
             )
 
-            self._client = boto3.client(
+            self._client = self._session.client(
                 "s3",
                 region_name=self._region,
                 aws_access_key_id=creds["AccessKeyId"],
                 aws_secret_access_key=creds["SecretKey"],
                 aws_session_token=creds["SessionToken"],
-                config=Config(max_pool_connections=self._max_pool_connections),
+                config=Config(
+                    max_pool_connections=self._max_pool_connections,
+                    tcp_keepalive=True,
+                    retries={"mode": "adaptive"},
+                    s3={"addressing_style": "virtual"},
+                ),
             )
+            self._connected_token = id_token
             logger.info("Connected to S3 via Cognito Identity Pool")
 
         except ClientError as e:
@@ -76,6 +127,34 @@ class AmplifyStorageClient:
                 provider="cognito",
             ) from e
 
+    def _get_credentials(
+        self, identity_client: Any, logins: Dict[str, str]
+    ) -> Dict[str, Any]:
+        if self._identity_id is not None:
+            try:
+                response = identity_client.get_credentials_for_identity(
+                    IdentityId=self._identity_id,
+                    Logins=logins,
+                )
+                creds: Dict[str, Any] = response["Credentials"]
+                return creds
+            except ClientError:
+                # The token may belong to another user; resolve the identity
+                # again instead of failing the reconnect.
+                self._identity_id = None
+
+        identity_id = identity_client.get_id(
+            IdentityPoolId=self._identity_pool_id,
+            Logins=logins,
+        )["IdentityId"]
+        response = identity_client.get_credentials_for_identity(
+            IdentityId=identity_id,
+            Logins=logins,
+        )
+        self._identity_id = identity_id
+        creds = response["Credentials"]
+        return creds
+
     def credentials_expiry(self) -> Optional[float]:
         """Unix timestamp at which the current S3 credentials expire, if known.
 
@@ -84,6 +163,16 @@ class AmplifyStorageClient:
         """
         return self._credentials_expiry
 
+    def close(self) -> None:
+        # botocore clients hold pooled HTTPS connections until closed.
+        for client in (self._client, self._identity_client):
+            if client is not None:
+                client.close()
+        self._client = None
+        self._identity_client = None
+        self._connected_token = None
+        self._credentials_expiry = None
+
     def _ensure_connected(self) -> Any:
         if self._client is None:
             raise UploadError(
@@ -100,7 +189,7 @@ class AmplifyStorageClient:
     ) -> NoReturn:
         code = error.response["Error"]["Code"]
 
-        if code in ("AccessDenied", "InvalidAccessKeyId"):
+        if code in AUTH_ERROR_CODES:
             raise AuthenticationError(
                 f"S3 authentication error ({code}): {error}",
                 provider="cognito",
@@ -127,20 +216,28 @@ class AmplifyStorageClient:
 
     def upload_file(
         self,
-        data: bytes,
+        data: Union[bytes, bytearray],
         key: str,
         content_type: str,
         on_bytes: Optional[Callable[[int], None]] = None,
     ) -> str:
         s3 = self._ensure_connected()
         try:
-            s3.upload_fileobj(
-                io.BytesIO(data),
-                self._bucket,
-                key,
-                ExtraArgs={"ContentType": content_type},
-                Callback=on_bytes,
-            )
+            if len(data) > MULTIPART_THRESHOLD_BYTES:
+                s3.upload_fileobj(
+                    io.BytesIO(data),
+                    self._bucket,
+                    key,
+                    ExtraArgs={"ContentType": content_type},
+                    Config=_transfer_config(MULTIPART_THRESHOLD_BYTES >> 20),
+                    Callback=on_bytes,
+                )
+            else:
+                s3.put_object(
+                    Bucket=self._bucket, Key=key, Body=data, ContentType=content_type
+                )
+                if on_bytes is not None:
+                    on_bytes(len(data))
         except ClientError as e:
             self._handle_client_error(e, key=key, bucket=self._bucket)
         except BotoCoreError as e:
@@ -159,10 +256,7 @@ class AmplifyStorageClient:
         on_bytes: Optional[Callable[[int], None]] = None,
     ) -> str:
         s3 = self._ensure_connected()
-        config = TransferConfig(
-            multipart_threshold=chunk_size_mb * 1024 * 1024,
-            multipart_chunksize=chunk_size_mb * 1024 * 1024,
-        )
+        config = _transfer_config(chunk_size_mb)
         try:
             s3.upload_fileobj(
                 stream,
@@ -186,14 +280,21 @@ class AmplifyStorageClient:
         file_path: Path,
         key: str,
         content_type: str,
-        chunk_size_mb: int = 8,
+        chunk_size_mb: int = FILE_CHUNK_SIZE_MB,
         progress_callback: Optional[Callable[[int], None]] = None,
+        io_chunksize_kb: int = TRANSFER_IO_CHUNKSIZE_KB,
+        max_concurrency: int = TRANSFER_MAX_CONCURRENCY,
     ) -> str:
         s3 = self._ensure_connected()
-        config = TransferConfig(
-            multipart_threshold=chunk_size_mb * 1024 * 1024,
-            multipart_chunksize=chunk_size_mb * 1024 * 1024,
-        )
+        if chunk_size_mb < MIN_FILE_CHUNK_SIZE_MB:
+            logger.warning(
+                "Multipart chunk size %d MB is below %d MB; using %d MB",
+                chunk_size_mb,
+                MIN_FILE_CHUNK_SIZE_MB,
+                MIN_FILE_CHUNK_SIZE_MB,
+            )
+            chunk_size_mb = MIN_FILE_CHUNK_SIZE_MB
+        config = _transfer_config(chunk_size_mb, max_concurrency, io_chunksize_kb)
         try:
             s3.upload_file(
                 str(file_path),
@@ -218,13 +319,12 @@ class AmplifyStorageClient:
             s3.head_object(Bucket=self._bucket, Key=key)
             return True
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
+            if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
                 return False
             self._handle_client_error(e, key=key, bucket=self._bucket)
 
     def get_url(self, key: str) -> str:
-        encoded_key = quote(key, safe="/")
-        return f"https://{self._bucket}.s3.{self._region}.amazonaws.com/{encoded_key}"
+        return self._url_prefix + quote(key, safe="/")
 
     def delete_file(self, key: str) -> None:
         s3 = self._ensure_connected()
@@ -1,8 +1,11 @@
+import email.utils
+import functools
 import logging
 import re
 import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, NoReturn, Optional, Set
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NoReturn, Optional, Set, Union
 
 import requests
 import requests.adapters
@@ -12,19 +15,32 @@ from ..utils.exceptions import (
     GraphQLError,
     RateLimitError,
 )
+from ..utils.json_io import dumps_line, loads
 from ..utils.media import MediaType
 
 logger = logging.getLogger(__name__)
 
+# (connect, read): a dead or unreachable endpoint fails within seconds and goes
+# back through the retry path, while slow paginated queries keep a long read.
+_REQUEST_TIMEOUT = (5, 30)
+# Aliased lookups per request in get_observations_by_sequential_ids; bounds
+# the query document and AppSync's per-request resolver fan-out.
+_OBSERVATION_LOOKUP_CHUNK = 50
+# Bytes of a non-200 response body quoted in the raised error.
+_ERROR_BODY_LIMIT = 512
+# Upper bound on a server Retry-After hint, so a bad header cannot park a
+# worker for hours.
+_MAX_RETRY_AFTER = 300.0
 
-@dataclass
+
+@dataclass(slots=True)
 class Observation:
     id: str
     sequential_id: int
     discriminator_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Media:
     id: str
     url: str
@@ -33,6 +49,14 @@ class Media:
     is_available_for_public_use: bool
 
 
+@dataclass(slots=True)
+class MediaInput:
+    url: str
+    observation_id: str
+    type: MediaType
+    is_available_for_public_use: bool = False
+
+
 _FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
@@ -55,18 +79,105 @@ query GetObservationBySequentialId($sequentialId: Int!, $nextToken: String) {{
 """
 
 
-_MUTATION_CREATE_MEDIA = """
-mutation CreateMedia($input: CreateMediaInput!) {
-  createMedia(input: $input) {
+def _build_batch_observation_query(count: int) -> str:
+    params = ", ".join(
+        f"$sequentialId{i}: Int!, $nextToken{i}: String" for i in range(count)
+    )
+    fields = "".join(
+        f"\n  o{i}: listObservations("
+        f"filter: {{ sequentialId: {{ eq: $sequentialId{i} }} }}, "
+        f"limit: 10000, nextToken: $nextToken{i}) {{"
+        "\n    items {\n      id\n      sequentialId\n    }\n    nextToken\n  }"
+        for i in range(count)
+    )
+    return f"\nquery BatchGetObservationsBySequentialId({params}) {{{fields}\n}}\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_query(query: str) -> bytes:
+    # Documents repeat across calls (batch queries by size), so each is
+    # JSON-escaped once and spliced into request bodies as bytes.
+    return dumps_line(query)[:-1]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    if seconds != seconds:  # NaN
+        return None
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
+def _errors_by_alias(result: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    errors_by_alias: Dict[str, List[Dict[str, Any]]] = {}
+    for error in result.get("errors") or []:
+        path = error.get("path") or [""]
+        errors_by_alias.setdefault(str(path[0]), []).append(error)
+    return errors_by_alias
+
+
+def _alias_error(
+    result: Dict[str, Any],
+    errors_by_alias: Dict[str, List[Dict[str, Any]]],
+    alias: str,
+    operation: str,
+) -> GraphQLError:
+    errors = errors_by_alias.get(alias) or result.get("errors") or []
+    return GraphQLError(
+        f"GraphQL errors in {operation}",
+        operation=operation,
+        errors=errors,
+    )
+
+
+_MEDIA_FIELDS = """
     id
     url
     observationId
     type
-    isAvailableForPublicUse
-  }
-}
+    isAvailableForPublicUse"""
+
+_MUTATION_CREATE_MEDIA = f"""
+mutation CreateMedia($input: CreateMediaInput!) {{
+  createMedia(input: $input) {{{_MEDIA_FIELDS}
+  }}
+}}
 """
 
+
+def _build_batch_create_media_mutation(count: int) -> str:
+    params = ", ".join(f"$input{i}: CreateMediaInput!" for i in range(count))
+    fields = "".join(
+        f"\n  m{i}: createMedia(input: $input{i}) {{{_MEDIA_FIELDS}\n  }}"
+        for i in range(count)
+    )
+    return f"\nmutation BatchCreateMedia({params}) {{{fields}\n}}\n"
+
+
+_MEDIA_TYPE_BY_VALUE: Dict[str, MediaType] = {m.value: m for m in MediaType}
+
+
+def _media_from_item(item: Dict[str, Any]) -> Media:
+    return Media(
+        id=item["id"],
+        url=item["url"],
+        observation_id=item["observationId"],
+        type=_MEDIA_TYPE_BY_VALUE[item["type"]],
+        is_available_for_public_use=item["isAvailableForPublicUse"],
+    )
+
+
 _QUERY_MEDIA_BY_URL = """
 query GetMediaByUrl($url: String!, $nextToken: String) {
   listMedia(filter: { url: { eq: $url } }, limit: 10000, nextToken: $nextToken) {
@@ -105,20 +216,37 @@ class GraphQLClient:
         self,
         api_endpoint: str,
         region: str = "us-east-1",
+        max_pool_connections: Optional[int] = None,
     ) -> None:
         self._api_endpoint = api_endpoint
         self._region = region
         self._id_token: Optional[str] = None
+        # Rebuilt by connect() on every token refresh and shared read-only by
+        # all requests until then.
+        self._headers: Dict[str, str] = {}
         self._local = threading.local()
         self._sessions_lock = threading.Lock()
         self._all_sessions: List[requests.Session] = []
+        # With a pool size, every thread's session mounts one shared adapter so
+        # warm AppSync connections outlive the thread (or reset session) that
+        # opened them; urllib3's pool is thread-safe.
+        self._shared_adapter: Optional[requests.adapters.HTTPAdapter] = (
+            requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=max_pool_connections
+            )
+            if max_pool_connections
+            else None
+        )
 
     def _get_session(self) -> requests.Session:
         if not hasattr(self._local, "session"):
             s = requests.Session()
-            # Each thread keeps one persistent HTTPS connection to AppSync,
-            # eliminating per-request TLS handshake overhead.
-            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            # Keep-alive connections to AppSync are reused across requests,
+            # either from the shared pool or from a one-connection pool of
+            # this thread's own, so each request skips the TLS handshake.
+            adapter = self._shared_adapter or requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=1
+            )
             s.mount("https://", adapter)
             self._local.session = s
             with self._sessions_lock:
@@ -135,7 +263,25 @@ class GraphQLClient:
             self._all_sessions = []
             self._local = threading.local()
         for session in sessions:
-            session.close()
+            self._close_session(session)
+        if self._shared_adapter is not None:
+            self._shared_adapter.close()
+
+    def _close_session(self, session: requests.Session) -> None:
+        # Session.close() closes every mounted adapter; detach the shared one
+        # first so other threads' sessions keep their warm connections.
+        if (
+            self._shared_adapter is not None
+            and session.adapters.get("https://") is self._shared_adapter
+        ):
+            del session.adapters["https://"]
+        session.close()
+
+    def __enter__(self) -> "GraphQLClient":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
 
     def _reset_session(self) -> None:
         # A reset/aborted socket can be handed back from the pool on reuse.
@@ -152,12 +298,16 @@ class GraphQLClient:
             if session in self._all_sessions:
                 self._all_sessions.remove(session)
         try:
-            session.close()
+            self._close_session(session)
         finally:
             if hasattr(self._local, "session"):
                 del self._local.session
 
     def connect(self, id_token: str) -> None:
+        self._headers = {
+            "Authorization": id_token,
+            "Content-Type": "application/json",
+        }
         self._id_token = id_token
         logger.info("GraphQL client connected with auth token")
 
@@ -174,6 +324,7 @@ class GraphQLClient:
         status_code: int,
         response_text: str,
         operation: Optional[str] = None,
+        retry_after: Optional[str] = None,
     ) -> NoReturn:
         if status_code in (401, 403):
             raise AuthenticationError(
@@ -184,6 +335,7 @@ class GraphQLClient:
         if status_code == 429:
             raise RateLimitError(
                 f"GraphQL API rate limit exceeded: {response_text}",
+                retry_after=_parse_retry_after(retry_after),
             )
 
         raise GraphQLError(
@@ -198,22 +350,41 @@ class GraphQLClient:
         variables: Optional[Dict[str, Any]] = None,
         operation: Optional[str] = None,
     ) -> Dict[str, Any]:
-        id_token = self._ensure_connected()
-        headers = {
-            "Authorization": id_token,
-            "Content-Type": "application/json",
-        }
-        payload: Dict[str, Any] = {
-            "query": query,
-            "variables": variables or {},
-        }
+        result = self._post(query, variables, operation)
+
+        if "errors" in result:
+            raise GraphQLError(
+                f"GraphQL errors in {operation}",
+                operation=operation,
+                errors=result["errors"],
+            )
+
+        data: Dict[str, Any] = result.get("data", {})
+        return data
+
+    def _post(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation: Optional[str],
+    ) -> Dict[str, Any]:
+        self._ensure_connected()
+        body = b"".join(
+            (
+                b'{"query":',
+                _encoded_query(query),
+                b',"variables":',
+                dumps_line(variables or {})[:-1],
+                b"}",
+            )
+        )
 
         try:
             response = self._get_session().post(
                 self._api_endpoint,
-                headers=headers,
-                json=payload,
-                timeout=30,
+                headers=self._headers,
+                data=body,
+                timeout=_REQUEST_TIMEOUT,
             )
         except requests.exceptions.ConnectionError as e:
             self._reset_session()
@@ -230,21 +401,15 @@ class GraphQLClient:
             ) from e
 
         if response.status_code != 200:
-            self._handle_response_error(response.status_code, response.text, operation)
-
-        result: Dict[str, Any] = response.json()
-
-        if "errors" in result:
-            errors = result["errors"]
-            error_messages = [e.get("message", str(e)) for e in errors]
-            raise GraphQLError(
-                f"GraphQL errors in {operation}: {error_messages}",
-                operation=operation,
-                errors=errors,
+            self._handle_response_error(
+                response.status_code,
+                response.content[:_ERROR_BODY_LIMIT].decode("utf-8", "replace"),
+                operation,
+                response.headers.get("Retry-After"),
             )
 
-        data: Dict[str, Any] = result.get("data", {})
-        return data
+        result: Dict[str, Any] = loads(response.content)
+        return result
 
     def get_observation_by_sequential_id(
         self, sequential_id: int, discriminator_field: Optional[str] = None
@@ -318,11 +483,68 @@ class GraphQLClient:
     def get_observations_by_sequential_ids(
         self, sequential_ids: List[int]
     ) -> Dict[int, Observation]:
+        """Resolve many IDs with one aliased query per chunk of IDs.
+
+        IDs with no observation are left out; a failed alias raises its error.
+        """
         results: Dict[int, Observation] = {}
-        for seq_id in sequential_ids:
-            observation = self.get_observation_by_sequential_id(seq_id)
-            if observation is not None:
-                results[seq_id] = observation
+        for start in range(0, len(sequential_ids), _OBSERVATION_LOOKUP_CHUNK):
+            chunk = sequential_ids[start : start + _OBSERVATION_LOOKUP_CHUNK]
+            found = self.batch_get_observations_by_sequential_ids(chunk)
+            for seq_id, observation in zip(chunk, found):
+                if isinstance(observation, GraphQLError):
+                    raise observation
+                if observation is not None:
+                    results[seq_id] = observation
+        return results
+
+    def batch_get_observations_by_sequential_ids(
+        self, sequential_ids: List[int]
+    ) -> List[Union[Optional[Observation], GraphQLError]]:
+        """Look up the first observation for each sequential ID via aliased queries.
+
+        Results line up with the input; an ID with no observation is None and
+        an alias that failed is its GraphQLError. IDs whose filtered page came
+        back empty with a nextToken are re-queried together until resolved.
+        """
+        results: List[Union[Optional[Observation], GraphQLError]] = [None] * len(
+            sequential_ids
+        )
+        pending: Dict[int, Optional[str]] = dict.fromkeys(range(len(sequential_ids)))
+
+        while pending:
+            indices = list(pending)
+            variables: Dict[str, Any] = {}
+            for alias_index, index in enumerate(indices):
+                variables[f"sequentialId{alias_index}"] = sequential_ids[index]
+                variables[f"nextToken{alias_index}"] = pending[index]
+            result = self._post(
+                _build_batch_observation_query(len(indices)),
+                variables,
+                "BatchGetObservationsBySequentialId",
+            )
+
+            errors_by_alias = _errors_by_alias(result)
+            data: Dict[str, Any] = result.get("data") or {}
+            pending = {}
+            for alias_index, index in enumerate(indices):
+                alias = f"o{alias_index}"
+                page = data.get(alias)
+                if not page:
+                    results[index] = _alias_error(
+                        result,
+                        errors_by_alias,
+                        alias,
+                        "GetObservationBySequentialId",
+                    )
+                    continue
+                items = page.get("items") or []
+                if items:
+                    results[index] = Observation(
+                        id=items[0]["id"], sequential_id=items[0]["sequentialId"]
+                    )
+                elif page.get("nextToken"):
+                    pending[index] = page["nextToken"]
         return results
 
     def list_observations_without_media(self) -> List[Observation]:
@@ -372,15 +594,47 @@ class GraphQLClient:
             operation="CreateMedia",
         )
 
-        item = data.get("createMedia", {})
-        return Media(
-            id=item["id"],
-            url=item["url"],
-            observation_id=item["observationId"],
-            type=MediaType(item["type"]),
-            is_available_for_public_use=item["isAvailableForPublicUse"],
+        return _media_from_item(data.get("createMedia", {}))
+
+    def batch_create_media(
+        self, inputs: List[MediaInput]
+    ) -> List[Union[Media, GraphQLError]]:
+        """Create several Media records in one request via aliased createMedia fields.
+
+        Results line up with inputs; a record that failed comes back as its
+        GraphQLError instead of raising, so one bad input does not fail the rest.
+        """
+        if not inputs:
+            return []
+
+        variables = {
+            f"input{i}": {
+                "url": item.url,
+                "observationId": item.observation_id,
+                "type": item.type.value,
+                "isAvailableForPublicUse": item.is_available_for_public_use,
+            }
+            for i, item in enumerate(inputs)
+        }
+        result = self._post(
+            _build_batch_create_media_mutation(len(inputs)),
+            variables,
+            "BatchCreateMedia",
         )
 
+        errors_by_alias = _errors_by_alias(result)
+        data: Dict[str, Any] = result.get("data") or {}
+        results: List[Union[Media, GraphQLError]] = []
+        for i in range(len(inputs)):
+            item = data.get(f"m{i}")
+            if item:
+                results.append(_media_from_item(item))
+            else:
+                results.append(
+                    _alias_error(result, errors_by_alias, f"m{i}", "CreateMedia")
+                )
+        return results
+
     def get_media_observation_ids_by_url(self, url: str) -> Set[str]:
         observation_ids: Set[str] = set()
         next_token: Optional[str] = None
@@ -421,14 +675,7 @@ class GraphQLClient:
             list_data = data.get("listMedia", {})
             items = list_data.get("items", [])
             if items:
-                item = items[0]
-                return Media(
-                    id=item["id"],
-                    url=item["url"],
-                    observation_id=item["observationId"],
-                    type=MediaType(item["type"]),
-                    is_available_for_public_use=item["isAvailableForPublicUse"],
-                )
+                return _media_from_item(items[0])
 
             next_token = list_data.get("nextToken")
             if not next_token:
@@ -1,4 +1,4 @@
-from .media import MediaType, get_media_type, get_content_type
+from .media import MediaType, get_media_type, get_content_type, lookup_media
 from .rate_limiter import RateLimiter
 from .logger import setup_logging, get_logger, DEFAULT_LOG_DIR, DEFAULT_LOG_FORMAT
 from .exceptions import (
@@ -17,6 +17,7 @@ __all__ = [
     "MediaType",
     "get_media_type",
     "get_content_type",
+    "lookup_media",
     "RateLimiter",
     "setup_logging",
     "get_logger",
@@ -6,6 +6,8 @@ from typing import Any, List, Optional
 class MigratorError(Exception):
     """Base exception class for all migrator errors."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
         super().__init__(message)
@@ -14,6 +16,8 @@ class MigratorError(Exception):
 class ConfigurationError(MigratorError):
     """Raised when configuration is invalid or missing."""
 
+    __slots__ = ("config_key",)
+
     def __init__(self, message: str, config_key: Optional[str] = None) -> None:
         self.config_key = config_key
         super().__init__(message)
@@ -22,6 +26,8 @@ class ConfigurationError(MigratorError):
 class AuthenticationError(MigratorError):
     """Raised when authentication fails (Cognito or Google)."""
 
+    __slots__ = ("provider",)
+
     def __init__(self, message: str, provider: Optional[str] = None) -> None:
         self.provider = provider
         super().__init__(message)
@@ -30,6 +36,8 @@ class AuthenticationError(MigratorError):
 class RateLimitError(MigratorError):
     """Raised when API rate limit is exceeded. This error is retryable."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
         self.retry_after = retry_after
         super().__init__(message)
@@ -42,6 +50,8 @@ class RateLimitError(MigratorError):
 class DownloadError(MigratorError):
     """Raised when a Google Drive download fails."""
 
+    __slots__ = ("file_id", "filename")
+
     def __init__(
         self,
         message: str,
@@ -56,6 +66,8 @@ class DownloadError(MigratorError):
 class UploadError(MigratorError):
     """Raised when an S3 upload fails."""
 
+    __slots__ = ("bucket", "key", "is_token_expired")
+
     def __init__(
         self,
         message: str,
@@ -72,6 +84,8 @@ class UploadError(MigratorError):
 class GraphQLError(MigratorError):
     """Raised when a GraphQL API call fails."""
 
+    __slots__ = ("operation", "errors", "is_retryable")
+
     def __init__(
         self,
         message: str,
@@ -84,10 +98,23 @@ class GraphQLError(MigratorError):
         self.is_retryable = is_retryable
         super().__init__(message)
 
+    def __str__(self) -> str:
+        # Per-error details are only joined when the exception is rendered,
+        # so callers that catch and retry never pay for the formatting.
+        if not self.errors:
+            return self.message
+        details = ", ".join(
+            str(e.get("message", e)) if isinstance(e, dict) else str(e)
+            for e in self.errors
+        )
+        return f"{self.message}: {details}"
+
 
 class ObservationNotFoundError(MigratorError):
     """Raised when no observation exists for a given sequentialId."""
 
+    __slots__ = ("sequential_id",)
+
     def __init__(self, message: str, sequential_id: Optional[int] = None) -> None:
         self.sequential_id = sequential_id
         super().__init__(message)
@@ -96,6 +123,8 @@ class ObservationNotFoundError(MigratorError):
 class InvalidFilenameError(MigratorError):
     """Raised when a filename doesn't match any valid pattern."""
 
+    __slots__ = ("filename",)
+
     def __init__(self, message: str, filename: Optional[str] = None) -> None:
         self.filename = filename
         super().__init__(message)
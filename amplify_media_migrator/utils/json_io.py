@@ -0,0 +1,80 @@
+"""JSON helpers that use orjson when available and fall back to the stdlib."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Tuple, Union
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    _HAS_ORJSON = False
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize to 2-space-indented UTF-8 JSON with a trailing newline."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize to compact single-line UTF-8 JSON with a trailing newline (JSONL)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode(
+        "utf-8"
+    )
+
+
+def iter_dumps_pretty(items: Iterable[Tuple[str, Any]]) -> Iterator[bytes]:
+    """Yield dumps_pretty(dict(items)) in pieces, one member at a time.
+
+    A value that is itself an iterator of (key, value) pairs is streamed as a
+    nested object, so large sections never exist as one dict or one buffer.
+    """
+    yield from _iter_object(iter(items), 0)
+    yield b"\n"
+
+
+def _iter_object(items: Iterator[Tuple[str, Any]], level: int) -> Iterator[bytes]:
+    pad = b"\n" + b"  " * (level + 1)
+    opener = b"{" + pad
+    for key, value in items:
+        yield opener + dumps_line(key)[:-1] + b": "
+        opener = b"," + pad
+        if isinstance(value, Iterator):
+            yield from _iter_object(value, level + 1)
+        else:
+            yield dumps_pretty(value)[:-1].replace(b"\n", pad)
+    yield b"{}" if opener.startswith(b"{") else b"\n" + b"  " * level + b"}"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON; decode errors are json.JSONDecodeError on both backends."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and os.replace so readers never see a partial file."""
+    write_atomic_chunks(path, (data,))
+
+
+def write_atomic_chunks(path: Path, chunks: Iterable[bytes]) -> None:
+    """write_atomic for output produced incrementally, e.g. by iter_dumps_pretty."""
+    # A unique temp name, so concurrent writers never share a half-written file.
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
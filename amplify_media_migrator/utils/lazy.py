@@ -0,0 +1,26 @@
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str, namespace: Dict[str, Any], attrs: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build PEP 562 ``__getattr__``/``__dir__`` for a package's lazy exports.
+
+    ``attrs`` maps each exported name to the module it lives in, relative to
+    ``package``. A name is imported on first access and then stored in
+    ``namespace`` (the package's globals) so later lookups skip this hook.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attrs))
+
+    return __getattr__, __dir__
@@ -1,11 +1,54 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 DEFAULT_LOG_DIR = Path.home() / ".amplify-media-migrator" / "logs"
+# logging.Formatter.default_msec_format, which typeshed types as optional.
+_MSEC_FORMAT = "%s,%03d"
+
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _SecondCachingFormatter(logging.Formatter):
+    """Formatter that runs strftime for %(asctime)s once per wall-clock second."""
+
+    _cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if cached_second != second:
+            text = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            # One tuple assignment, so a concurrent reader never sees a
+            # timestamp paired with the wrong second.
+            self._cached_time = (second, text)
+        return _MSEC_FORMAT % (text, record.msecs)
+
+
+def _stop_file_listener() -> None:
+    global _file_listener
+    if _file_listener is None:
+        return
+    _file_listener.stop()
+    for handler in _file_listener.handlers:
+        handler.close()
+    _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 
 def setup_logging(
@@ -13,21 +56,32 @@ def setup_logging(
     log_file: Optional[Path] = None,
     log_format: str = DEFAULT_LOG_FORMAT,
 ) -> logging.Logger:
+    global _file_listener
     resolved_level = level or os.environ.get("LOG_LEVEL", "INFO")
     root_logger = logging.getLogger("amplify_media_migrator")
     root_logger.setLevel(getattr(logging, resolved_level.upper(), logging.INFO))
 
+    _stop_file_listener()
     root_logger.handlers.clear()
 
+    formatter = _SecondCachingFormatter(log_format)
+
     console_handler = logging.StreamHandler(sys.stderr)
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
     if log_file is not None:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(log_format))
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
+        # Records are enqueued on the calling thread and written to disk by
+        # the listener's thread, so workers never block on file I/O.
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(records))
+        _file_listener = logging.handlers.QueueListener(
+            records, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
 
     return root_logger
 
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict, Tuple
 
 
 class MediaType(Enum):
@@ -22,21 +23,31 @@ CONTENT_TYPES = {
 }
 
 
+# Content type and media type per lowercase extension, so callers that need
+# both resolve them with a single dict hit.
+MEDIA_INFO: Dict[str, Tuple[str, MediaType]] = {
+    ext: (content_type, MediaType.IMAGE if ext in IMAGE_EXTENSIONS else MediaType.VIDEO)
+    for ext, content_type in CONTENT_TYPES.items()
+}
+
+
 def _normalize_extension(extension: str) -> str:
     return extension.lower().lstrip(".")
 
 
+def lookup_media(extension: str) -> Tuple[str, MediaType]:
+    """Return (content_type, media_type) for an extension such as "jpg" or ".JPG"."""
+    info = MEDIA_INFO.get(extension)
+    if info is None:
+        info = MEDIA_INFO.get(_normalize_extension(extension))
+        if info is None:
+            raise ValueError(f"Unknown extension: {extension}")
+    return info
+
+
 def get_media_type(extension: str) -> MediaType:
-    ext = _normalize_extension(extension)
-    if ext in IMAGE_EXTENSIONS:
-        return MediaType.IMAGE
-    if ext in VIDEO_EXTENSIONS:
-        return MediaType.VIDEO
-    raise ValueError(f"Unknown extension: {extension}")
+    return lookup_media(extension)[1]
 
 
 def get_content_type(extension: str) -> str:
-    ext = _normalize_extension(extension)
-    if ext not in CONTENT_TYPES:
-        raise ValueError(f"Unknown extension: {extension}")
-    return CONTENT_TYPES[ext]
+    return lookup_media(extension)[0]
@@ -1,9 +1,15 @@
 import threading
 import time
-from typing import Optional
 
 
 class RateLimiter:
+    """Token bucket expressed as GCRA (generic cell rate algorithm).
+
+    Instead of refilling a token count, the limiter tracks the time the next
+    request is due; a request may run early by up to burst_size - 1 intervals.
+    Each acquire is one max() and one add under the lock.
+    """
+
     def __init__(
         self,
         requests_per_second: float = 200.0,
@@ -11,33 +17,20 @@ class RateLimiter:
     ) -> None:
         self._requests_per_second = requests_per_second
         self._burst_size = burst_size
-        self._tokens: float = float(burst_size)
-        self._last_update: Optional[float] = None
+        self._interval = 1.0 / requests_per_second
+        self._burst_tolerance = (burst_size - 1) * self._interval
+        self._next_available = 0.0
         self._lock = threading.Lock()
 
     def acquire(self) -> None:
         with self._lock:
             now = time.monotonic()
+            slot = max(now, self._next_available)
+            self._next_available = slot + self._interval
+            wait_time = slot - self._burst_tolerance - now
 
-            if self._last_update is None:
-                self._last_update = now
-
-            elapsed = now - self._last_update
-            self._tokens = min(
-                self._burst_size,
-                self._tokens + elapsed * self._requests_per_second,
-            )
-            self._last_update = now
-
-            if self._tokens >= 1.0:
-                self._tokens -= 1.0
-                return
-
-            wait_time = (1.0 - self._tokens) / self._requests_per_second
-            self._tokens = 0.0
-            self._last_update = now + wait_time
-
-        time.sleep(wait_time)
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def __enter__(self) -> "RateLimiter":
         self.acquire()
@@ -4,25 +4,38 @@
 import os
 import re
 import sys
+from typing import Optional, Tuple
+
+_VERSION_RE = re.compile(r'version\s*=\s*["\']([0-9]+\.[0-9]+\.[0-9]+)["\']')
 
 
 def get_current_version(setup_file: str = "setup.py") -> str:
     """Read the current version from setup.py."""
     with open(setup_file, "r") as f:
-        content = f.read()
-
-    match = re.search(r'version\s*=\s*["\']([0-9]+\.[0-9]+\.[0-9]+)["\']', content)
-    if not match:
-        raise ValueError("Could not find version in setup.py")
+        for line in f:
+            match = _VERSION_RE.search(line)
+            if match:
+                return match.group(1)
 
-    return match.group(1)
+    raise ValueError("Could not find version in setup.py")
 
 
 def bump_patch_version(version: str) -> str:
     """Increment the patch version (e.g., 0.1.0 -> 0.1.1)."""
-    major, minor, patch = version.split(".")
-    new_patch = int(patch) + 1
-    return f"{major}.{minor}.{new_patch}"
+    head, _, patch = version.rpartition(".")
+    return f"{head}.{int(patch) + 1}"
+
+
+def _find_version_literal(content: str, version: str) -> Optional[str]:
+    """Return the earliest common spelling of version=<version> in content."""
+    earliest: Optional[Tuple[int, str]] = None
+    for quote in ('"', "'"):
+        for sep in ("=", " = "):
+            literal = f"version{sep}{quote}{version}{quote}"
+            index = content.find(literal)
+            if index != -1 and (earliest is None or index < earliest[0]):
+                earliest = (index, literal)
+    return earliest[1] if earliest is not None else None
 
 
 def update_version_in_file(setup_file: str, old_version: str, new_version: str) -> str:
@@ -30,8 +43,12 @@ def update_version_in_file(setup_file: str, old_version: str, new_version: str)
     with open(setup_file, "r") as f:
         content = f.read()
 
-    pattern = rf'version\s*=\s*["\']({re.escape(old_version)})["\']'
-    new_content = re.sub(pattern, f'version="{new_version}"', content)
+    replacement = f'version="{new_version}"'
+    literal = _find_version_literal(content, old_version)
+    if literal is not None:
+        new_content = content.replace(literal, replacement, 1)
+    else:
+        new_content = _VERSION_RE.sub(replacement, content, count=1)
 
     with open(setup_file, "w") as f:
         f.write(new_content)
@@ -43,9 +60,13 @@ def write_github_output(version: str, old_version: str) -> None:
     """Write version info to GITHUB_OUTPUT if running in GitHub Actions."""
     github_output = os.environ.get("GITHUB_OUTPUT")
     if github_output:
-        with open(github_output, "a") as f:
-            f.write(f"version={version}\n")
-            f.write(f"old_version={old_version}\n")
+        # One O_APPEND write, so both lines land together even when other
+        # steps append to the same file.
+        fd = os.open(github_output, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, f"version={version}\nold_version={old_version}\n".encode())
+        finally:
+            os.close(fd)
 
 
 def main() -> int:
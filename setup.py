@@ -33,6 +33,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "dev": dev_requirements,
+        "speedups": ["uvloop>=0.19.0; sys_platform != 'win32'"],
     },
     entry_points={
         "console_scripts": [
@@ -1,10 +1,19 @@
+import time
 from pathlib import Path
+from typing import Optional
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError, EndpointConnectionError
 
-from amplify_media_migrator.targets.amplify_storage import AmplifyStorageClient
+from amplify_media_migrator.targets.amplify_storage import (
+    FILE_CHUNK_SIZE_MB,
+    MIN_FILE_CHUNK_SIZE_MB,
+    MULTIPART_THRESHOLD_BYTES,
+    TRANSFER_IO_CHUNKSIZE_KB,
+    TRANSFER_MAX_CONCURRENCY,
+    AmplifyStorageClient,
+)
 from amplify_media_migrator.utils.exceptions import (
     AuthenticationError,
     UploadError,
@@ -44,10 +53,16 @@ def connected_client(
 
 
 def _make_client_error(
-    code: str, message: str = "error", operation: str = "PutObject"
+    code: str,
+    message: str = "error",
+    operation: str = "PutObject",
+    status_code: int = 400,
 ) -> ClientError:
     return ClientError(
-        {"Error": {"Code": code, "Message": message}},
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        },
         operation,
     )
 
@@ -96,7 +111,7 @@ class TestConnect:
                 return mock_s3_client
             raise ValueError(f"Unexpected service: {service}")
 
-        mock_boto3.client.side_effect = client_factory
+        mock_boto3.Session.return_value.client.side_effect = client_factory
 
         client.connect(ID_TOKEN)
 
@@ -111,7 +126,7 @@ class TestConnect:
             IdentityId="us-east-1:identity-id-123",
             Logins=expected_logins,
         )
-        mock_boto3.client.assert_any_call(
+        mock_boto3.Session.return_value.client.assert_any_call(
             "s3",
             region_name=REGION,
             aws_access_key_id="AKID",
@@ -121,6 +136,30 @@ class TestConnect:
         )
         assert client._client is mock_s3_client
 
+    @patch("amplify_media_migrator.targets.amplify_storage.Config")
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_s3_client_keeps_connections_warm(
+        self, mock_boto3: MagicMock, mock_config: MagicMock
+    ) -> None:
+        session_client = mock_boto3.Session.return_value.client
+        session_client.return_value.get_credentials_for_identity.return_value = {
+            "Credentials": {
+                "AccessKeyId": "AKID",
+                "SecretKey": "SECRET",
+                "SessionToken": "TOKEN",
+            }
+        }
+        client = AmplifyStorageClient(bucket=BUCKET, max_pool_connections=40)
+
+        client.connect(ID_TOKEN)
+
+        mock_config.assert_called_once_with(
+            max_pool_connections=40,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive"},
+            s3={"addressing_style": "virtual"},
+        )
+
     @patch("amplify_media_migrator.targets.amplify_storage.boto3")
     def test_stores_credentials_expiry(
         self, mock_boto3: MagicMock, client: AmplifyStorageClient
@@ -144,7 +183,7 @@ class TestConnect:
                 mock_identity_client if service == "cognito-identity" else MagicMock()
             )
 
-        mock_boto3.client.side_effect = client_factory
+        mock_boto3.Session.return_value.client.side_effect = client_factory
 
         client.connect(ID_TOKEN)
 
@@ -169,12 +208,110 @@ class TestConnect:
                 mock_identity_client if service == "cognito-identity" else MagicMock()
             )
 
-        mock_boto3.client.side_effect = client_factory
+        mock_boto3.Session.return_value.client.side_effect = client_factory
 
         client.connect(ID_TOKEN)
 
         assert client.credentials_expiry() is None
 
+    @staticmethod
+    def _identity_client(expires_in: float) -> MagicMock:
+        from datetime import datetime, timezone
+
+        expiration = datetime.fromtimestamp(time.time() + expires_in, timezone.utc)
+        identity_client = MagicMock()
+        identity_client.get_id.return_value = {"IdentityId": "id-1"}
+        identity_client.get_credentials_for_identity.return_value = {
+            "Credentials": {
+                "AccessKeyId": "AKID",
+                "SecretKey": "SECRET",
+                "SessionToken": "TOKEN",
+                "Expiration": expiration,
+            }
+        }
+        return identity_client
+
+    @staticmethod
+    def _route_clients(mock_boto3: MagicMock, identity_client: MagicMock) -> None:
+        def client_factory(service: str, **kwargs: object) -> MagicMock:
+            return identity_client if service == "cognito-identity" else MagicMock()
+
+        mock_boto3.Session.return_value.client.side_effect = client_factory
+
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_reconnect_with_new_token_reuses_identity_id(
+        self, mock_boto3: MagicMock, client: AmplifyStorageClient
+    ) -> None:
+        identity_client = self._identity_client(expires_in=3600)
+        self._route_clients(mock_boto3, identity_client)
+
+        client.connect(ID_TOKEN)
+        client.connect("refreshed-id-token")
+
+        identity_client.get_id.assert_called_once()
+        assert identity_client.get_credentials_for_identity.call_count == 2
+        login_provider = f"cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}"
+        identity_client.get_credentials_for_identity.assert_called_with(
+            IdentityId="id-1",
+            Logins={login_provider: "refreshed-id-token"},
+        )
+
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_reconnect_with_same_token_keeps_valid_client(
+        self, mock_boto3: MagicMock, client: AmplifyStorageClient
+    ) -> None:
+        identity_client = self._identity_client(expires_in=3600)
+        self._route_clients(mock_boto3, identity_client)
+
+        client.connect(ID_TOKEN)
+        s3_client = client._client
+        client.connect(ID_TOKEN)
+
+        identity_client.get_credentials_for_identity.assert_called_once()
+        assert client._client is s3_client
+
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_reconnect_with_same_token_renews_expiring_credentials(
+        self, mock_boto3: MagicMock, client: AmplifyStorageClient
+    ) -> None:
+        identity_client = self._identity_client(expires_in=10)
+        self._route_clients(mock_boto3, identity_client)
+
+        client.connect(ID_TOKEN)
+        client.connect(ID_TOKEN)
+
+        assert identity_client.get_credentials_for_identity.call_count == 2
+
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_rejected_cached_identity_is_resolved_again(
+        self, mock_boto3: MagicMock, client: AmplifyStorageClient
+    ) -> None:
+        identity_client = self._identity_client(expires_in=3600)
+        self._route_clients(mock_boto3, identity_client)
+        client.connect(ID_TOKEN)
+        credentials = identity_client.get_credentials_for_identity.return_value
+        identity_client.get_credentials_for_identity.side_effect = [
+            _make_client_error("NotAuthorizedException"),
+            credentials,
+        ]
+
+        client.connect("other-user-token")
+
+        assert identity_client.get_id.call_count == 2
+        assert client._connected_token == "other-user-token"
+
+    @patch("amplify_media_migrator.targets.amplify_storage.boto3")
+    def test_clients_share_one_session(
+        self, mock_boto3: MagicMock, client: AmplifyStorageClient
+    ) -> None:
+        self._route_clients(mock_boto3, self._identity_client(expires_in=3600))
+
+        client.connect(ID_TOKEN)
+        client.connect("refreshed-id-token")
+
+        mock_boto3.Session.assert_called_once_with(region_name=REGION)
+        mock_boto3.client.assert_not_called()
+
     @patch("amplify_media_migrator.targets.amplify_storage.boto3")
     def test_client_error_raises_auth_error(
         self, mock_boto3: MagicMock, client: AmplifyStorageClient
@@ -183,7 +320,7 @@ class TestConnect:
         mock_identity_client.get_id.side_effect = _make_client_error(
             "NotAuthorizedException", "Invalid token"
         )
-        mock_boto3.client.return_value = mock_identity_client
+        mock_boto3.Session.return_value.client.return_value = mock_identity_client
 
         with pytest.raises(AuthenticationError, match="Identity Pool"):
             client.connect(ID_TOKEN)
@@ -200,6 +337,24 @@ class TestEnsureConnected:
         assert connected_client._ensure_connected() is mock_s3
 
 
+class TestClose:
+    def test_closes_clients_and_disconnects(
+        self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
+    ) -> None:
+        identity_client = MagicMock()
+        connected_client._identity_client = identity_client
+
+        connected_client.close()
+
+        mock_s3.close.assert_called_once_with()
+        identity_client.close.assert_called_once_with()
+        with pytest.raises(UploadError, match="Not connected"):
+            connected_client._ensure_connected()
+
+    def test_close_without_connect_is_noop(self, client: AmplifyStorageClient) -> None:
+        client.close()
+
+
 class TestHandleClientError:
     def test_access_denied_raises_auth_error(self) -> None:
         with pytest.raises(AuthenticationError, match="AccessDenied"):
@@ -265,18 +420,18 @@ class TestUploadFile:
             content_type="image/jpeg",
         )
 
-        mock_s3.upload_fileobj.assert_called_once()
-        call_args = mock_s3.upload_fileobj.call_args
-        assert call_args[0][0].read() == b"photo bytes"
-        assert call_args[0][1] == BUCKET
-        assert call_args[0][2] == "media/obs-1/photo.jpg"
-        assert call_args[1]["ExtraArgs"] == {"ContentType": "image/jpeg"}
-        assert call_args[1]["Callback"] is None
+        mock_s3.put_object.assert_called_once_with(
+            Bucket=BUCKET,
+            Key="media/obs-1/photo.jpg",
+            Body=b"photo bytes",
+            ContentType="image/jpeg",
+        )
+        mock_s3.upload_fileobj.assert_not_called()
         assert (
             url == f"https://{BUCKET}.s3.{REGION}.amazonaws.com/media/obs-1/photo.jpg"
         )
 
-    def test_passes_on_bytes_callback(
+    def test_reports_small_upload_bytes_once(
         self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
     ) -> None:
         callback = MagicMock()
@@ -288,12 +443,34 @@ class TestUploadFile:
             on_bytes=callback,
         )
 
-        assert mock_s3.upload_fileobj.call_args[1]["Callback"] is callback
+        callback.assert_called_once_with(4)
+
+    def test_large_payload_uses_multipart_transfer(
+        self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
+    ) -> None:
+        callback = MagicMock()
+        data = b"x" * (MULTIPART_THRESHOLD_BYTES + 1)
+
+        connected_client.upload_file(
+            data=data,
+            key="media/obs-1/video.mp4",
+            content_type="video/mp4",
+            on_bytes=callback,
+        )
+
+        mock_s3.put_object.assert_not_called()
+        call_args = mock_s3.upload_fileobj.call_args
+        assert call_args[0][0].read() == data
+        assert call_args[0][1] == BUCKET
+        assert call_args[0][2] == "media/obs-1/video.mp4"
+        assert call_args[1]["ExtraArgs"] == {"ContentType": "video/mp4"}
+        assert call_args[1]["Config"].multipart_threshold == MULTIPART_THRESHOLD_BYTES
+        assert call_args[1]["Callback"] is callback
 
     def test_client_error_raises_upload_error(
         self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
     ) -> None:
-        mock_s3.upload_fileobj.side_effect = _make_client_error("InternalError")
+        mock_s3.put_object.side_effect = _make_client_error("InternalError")
 
         with pytest.raises(UploadError):
             connected_client.upload_file(
@@ -307,7 +484,7 @@ class TestUploadFile:
     def test_connection_error_raises_upload_error(
         self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
     ) -> None:
-        mock_s3.upload_fileobj.side_effect = EndpointConnectionError(
+        mock_s3.put_object.side_effect = EndpointConnectionError(
             endpoint_url="https://bucket.s3.amazonaws.com"
         )
 
@@ -341,6 +518,8 @@ class TestUploadFileMultipart:
         mock_transfer_config.assert_called_once_with(
             multipart_threshold=16 * 1024 * 1024,
             multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=TRANSFER_MAX_CONCURRENCY,
+            io_chunksize=TRANSFER_IO_CHUNKSIZE_KB * 1024,
         )
         mock_s3.upload_file.assert_called_once_with(
             str(file_path),
@@ -354,6 +533,55 @@ class TestUploadFileMultipart:
             url == f"https://{BUCKET}.s3.{REGION}.amazonaws.com/media/obs-1/video.mp4"
         )
 
+    @pytest.mark.parametrize(
+        "chunk_size_mb,expected_mb",
+        [(None, FILE_CHUNK_SIZE_MB), (5, MIN_FILE_CHUNK_SIZE_MB), (32, 32)],
+    )
+    @patch("amplify_media_migrator.targets.amplify_storage.TransferConfig")
+    def test_chunk_size_default_and_floor(
+        self,
+        mock_transfer_config: MagicMock,
+        connected_client: AmplifyStorageClient,
+        tmp_path: Path,
+        chunk_size_mb: Optional[int],
+        expected_mb: int,
+    ) -> None:
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"video data")
+        kwargs = {} if chunk_size_mb is None else {"chunk_size_mb": chunk_size_mb}
+
+        connected_client.upload_file_multipart(
+            file_path=file_path,
+            key="media/obs-1/video.mp4",
+            content_type="video/mp4",
+            **kwargs,
+        )
+
+        config_kwargs = mock_transfer_config.call_args.kwargs
+        assert config_kwargs["multipart_chunksize"] == expected_mb * 1024 * 1024
+
+    @patch("amplify_media_migrator.targets.amplify_storage.TransferConfig")
+    def test_custom_io_chunksize_and_concurrency(
+        self,
+        mock_transfer_config: MagicMock,
+        connected_client: AmplifyStorageClient,
+        tmp_path: Path,
+    ) -> None:
+        file_path = tmp_path / "video.mp4"
+        file_path.write_bytes(b"video data")
+
+        connected_client.upload_file_multipart(
+            file_path=file_path,
+            key="media/obs-1/video.mp4",
+            content_type="video/mp4",
+            io_chunksize_kb=4096,
+            max_concurrency=4,
+        )
+
+        config_kwargs = mock_transfer_config.call_args.kwargs
+        assert config_kwargs["io_chunksize"] == 4096 * 1024
+        assert config_kwargs["max_concurrency"] == 4
+
     def test_passes_progress_callback(
         self,
         connected_client: AmplifyStorageClient,
@@ -406,7 +634,9 @@ class TestFileExists:
     def test_returns_false_when_not_found(
         self, connected_client: AmplifyStorageClient, mock_s3: MagicMock
     ) -> None:
-        mock_s3.head_object.side_effect = _make_client_error("404", "Not Found")
+        mock_s3.head_object.side_effect = _make_client_error(
+            "404", "Not Found", status_code=404
+        )
 
         assert connected_client.file_exists("nonexistent.jpg") is False
 
@@ -102,6 +102,26 @@ setup(
         assert 'name="my-package"' in result
         assert 'description="Test"' in result
 
+    @pytest.mark.parametrize(
+        "original",
+        ["version='0.1.0'", 'version = "0.1.0"', "version  =  '0.1.0'"],
+    )
+    def test_updates_other_spellings(self, tmp_path, original):
+        setup_file = tmp_path / "setup.py"
+        setup_file.write_text(f"setup(\n    {original},\n)")
+
+        update_version_in_file(str(setup_file), "0.1.0", "0.1.1")
+
+        assert setup_file.read_text() == 'setup(\n    version="0.1.1",\n)'
+
+    def test_updates_only_first_version(self, tmp_path):
+        setup_file = tmp_path / "setup.py"
+        setup_file.write_text('version="0.1.0"\nversion="0.1.0"')
+
+        update_version_in_file(str(setup_file), "0.1.0", "0.1.1")
+
+        assert setup_file.read_text() == 'version="0.1.1"\nversion="0.1.0"'
+
     def test_returns_new_version(self, tmp_path):
         setup_file = tmp_path / "setup.py"
         setup_file.write_text('version="0.1.0"')
@@ -135,6 +155,14 @@ class TestWriteGithubOutput:
         assert "version=2.0.0\n" in content
         assert "old_version=1.9.9\n" in content
 
+    def test_creates_missing_file(self, tmp_path, monkeypatch):
+        output_file = tmp_path / "github_output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+
+        write_github_output("1.2.3", "1.2.2")
+
+        assert output_file.read_text() == "version=1.2.3\nold_version=1.2.2\n"
+
     def test_does_nothing_when_github_output_not_set(self, monkeypatch):
         monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
 
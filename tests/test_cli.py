@@ -1,17 +1,30 @@
 import asyncio
+import base64
+import io
 import json
+import time
 from pathlib import Path
+from typing import Callable, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import click
 import pytest
 from click.testing import CliRunner
 
+from amplify_media_migrator.auth.token_cache import (
+    CachedCognitoSession,
+    CognitoTokenCache,
+)
 from amplify_media_migrator.cli import (
+    COGNITO_PASSWORD_ENV,
     _authenticate_cognito,
     _authenticate_google,
     _create_engine,
+    _install_uvloop,
     _load_config,
+    _load_tracker,
     _print_summary,
+    _read_cognito_password,
     _run_with_progress,
     export,
     main,
@@ -31,12 +44,20 @@ from amplify_media_migrator.config import (
 )
 from amplify_media_migrator.migration.engine import MigrationEngine
 from amplify_media_migrator.migration.progress import FileStatus, ProgressTracker
+from amplify_media_migrator.targets.amplify_storage import TRANSFER_MAX_CONCURRENCY
 from amplify_media_migrator.targets.graphql_client import GraphQLClient, Observation
 from amplify_media_migrator.utils.exceptions import GraphQLError
 
 pytestmark = pytest.mark.unit
 
 
+def _make_jwt(exp: int) -> str:
+    header = base64.urlsafe_b64encode(b'{"alg":"RS256"}').rstrip(b"=").decode()
+    payload_bytes = json.dumps({"exp": exp, "sub": "test"}).encode()
+    payload = base64.urlsafe_b64encode(payload_bytes).rstrip(b"=").decode()
+    return f"{header}.{payload}.fakesignature"
+
+
 @pytest.fixture
 def runner() -> CliRunner:
     return CliRunner()
@@ -91,6 +112,28 @@ class TestMainGroup:
         assert result.exit_code == 0
 
 
+class TestInstallUvloop:
+    def test_sets_policy_when_available(self) -> None:
+        fake_uvloop = MagicMock()
+
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}), patch(
+            "amplify_media_migrator.cli.asyncio.set_event_loop_policy"
+        ) as mock_set_policy:
+            _install_uvloop()
+
+        mock_set_policy.assert_called_once_with(
+            fake_uvloop.EventLoopPolicy.return_value
+        )
+
+    def test_noop_when_not_installed(self) -> None:
+        with patch.dict("sys.modules", {"uvloop": None}), patch(
+            "amplify_media_migrator.cli.asyncio.set_event_loop_policy"
+        ) as mock_set_policy:
+            _install_uvloop()
+
+        mock_set_policy.assert_not_called()
+
+
 class TestConfigCommand:
     @patch("amplify_media_migrator.cli.ConfigManager")
     def test_new_config(self, mock_mgr_cls: MagicMock, runner: CliRunner) -> None:
@@ -141,11 +184,12 @@ class TestConfigCommand:
         mock_mgr = MagicMock()
         mock_mgr_cls.return_value = mock_mgr
         mock_mgr.exists.return_value = False
-        mock_config = Config()
-        mock_config.validate = MagicMock(side_effect=ConfigurationError("bad config"))
-        mock_mgr.config = mock_config
+        mock_mgr.config = Config()
 
-        result = runner.invoke(main, ["config"], input="\n" * 12)
+        with patch.object(
+            Config, "validate", side_effect=ConfigurationError("bad config")
+        ):
+            result = runner.invoke(main, ["config"], input="\n" * 12)
         assert result.exit_code == 1
         assert "Validation error" in result.output
 
@@ -240,6 +284,51 @@ class TestLoadConfig:
         assert result is mock_mgr
         mock_mgr.load.assert_called_once()
 
+    @patch("amplify_media_migrator.cli.ConfigManager")
+    def test_loads_once_per_invocation(self, mock_mgr_cls: MagicMock) -> None:
+        mock_mgr_cls.return_value.exists.return_value = True
+
+        with click.Context(main):
+            first = _load_config()
+            second = _load_config()
+        with click.Context(main):
+            third = _load_config()
+
+        assert first is second is third
+        assert mock_mgr_cls.call_count == 2
+        assert mock_mgr_cls.return_value.load.call_count == 2
+
+
+class TestLoadTracker:
+    def test_loads_once_per_invocation(self) -> None:
+        with patch("amplify_media_migrator.cli.ProgressTracker") as mock_tracker_cls:
+            mock_tracker_cls.return_value.load.return_value = True
+
+            with click.Context(main):
+                first = _load_tracker("F1")
+                second = _load_tracker("F1")
+
+            assert first is second
+            mock_tracker_cls.return_value.load.assert_called_once_with("F1")
+
+    def test_missing_progress_returns_none(self) -> None:
+        with patch("amplify_media_migrator.cli.ProgressTracker") as mock_tracker_cls:
+            mock_tracker_cls.return_value.load.return_value = False
+
+            with click.Context(main):
+                assert _load_tracker("F1") is None
+
+    def test_new_invocation_reloads(self) -> None:
+        with patch("amplify_media_migrator.cli.ProgressTracker") as mock_tracker_cls:
+            mock_tracker_cls.return_value.load.return_value = True
+
+            with click.Context(main):
+                _load_tracker("F1")
+            with click.Context(main):
+                _load_tracker("F1")
+
+            assert mock_tracker_cls.return_value.load.call_count == 2
+
 
 class TestAuthenticateGoogle:
     def test_success(self) -> None:
@@ -248,11 +337,12 @@ class TestAuthenticateGoogle:
             "google_drive.credentials_path": "/tmp/creds.json",
             "google_drive.token_path": "/tmp/token.json",
         }[key]
+        mock_cfg.config.google_drive.download_chunk_size_mb = 16
 
         with patch(
-            "amplify_media_migrator.cli.GoogleDriveAuthProvider"
+            "amplify_media_migrator.auth.google_drive.GoogleDriveAuthProvider"
         ) as mock_auth_cls, patch(
-            "amplify_media_migrator.cli.GoogleDriveClient"
+            "amplify_media_migrator.sources.google_drive.GoogleDriveClient"
         ) as mock_client_cls:
             mock_auth = MagicMock()
             mock_auth.authenticate.return_value = True
@@ -265,13 +355,14 @@ class TestAuthenticateGoogle:
             result = _authenticate_google(mock_cfg)
             assert result is mock_client
             mock_client.connect.assert_called_once()
+            assert mock_client_cls.call_args.kwargs["download_chunk_size_mb"] == 16
 
     def test_auth_failure_exits(self) -> None:
         mock_cfg = MagicMock()
         mock_cfg.get.side_effect = lambda key: "/tmp/path.json"
 
         with patch(
-            "amplify_media_migrator.cli.GoogleDriveAuthProvider"
+            "amplify_media_migrator.auth.google_drive.GoogleDriveAuthProvider"
         ) as mock_auth_cls:
             mock_auth = MagicMock()
             mock_auth.authenticate.return_value = False
@@ -282,6 +373,15 @@ class TestAuthenticateGoogle:
 
 
 class TestAuthenticateCognito:
+    @pytest.fixture(autouse=True)
+    def _isolated_token_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "amplify_media_migrator.auth.token_cache.DEFAULT_TOKEN_CACHE_DIR",
+            tmp_path,
+        )
+
     @patch("amplify_media_migrator.cli.click.prompt", return_value="password123")
     @patch("amplify_auth.CognitoAuthProvider")
     def test_success(self, mock_cognito_cls: MagicMock, mock_prompt: MagicMock) -> None:
@@ -317,6 +417,52 @@ class TestAuthenticateCognito:
         with pytest.raises(SystemExit):
             _authenticate_cognito(mock_cfg)
 
+    @patch("amplify_media_migrator.cli.click.prompt", return_value="password123")
+    @patch("amplify_auth.CognitoAuthProvider")
+    def test_success_caches_tokens(
+        self, mock_cognito_cls: MagicMock, mock_prompt: MagicMock
+    ) -> None:
+        mock_cfg = MagicMock()
+        mock_cfg.get.side_effect = lambda key: "value"
+        id_token = _make_jwt(int(time.time()) + 3600)
+
+        mock_cognito = MagicMock()
+        mock_cognito.authenticate.return_value = True
+        mock_cognito.get_id_token.return_value = id_token
+        mock_cognito.cognito_client.refresh_token = "refresh"
+        mock_cognito.cognito_client.access_token = "access"
+        mock_cognito_cls.return_value = mock_cognito
+
+        _authenticate_cognito(mock_cfg)
+
+        cached = CognitoTokenCache("value", "value").load()
+        assert cached is not None
+        assert cached.id_token == id_token
+        assert cached.refresh_token == "refresh"
+
+    @patch("amplify_media_migrator.cli.click.prompt")
+    @patch("pycognito.Cognito")
+    @patch("amplify_auth.CognitoAuthProvider")
+    def test_cached_tokens_skip_prompt(
+        self,
+        mock_cognito_cls: MagicMock,
+        mock_pycognito_cls: MagicMock,
+        mock_prompt: MagicMock,
+    ) -> None:
+        mock_cfg = MagicMock()
+        mock_cfg.get.side_effect = lambda key: "value"
+        id_token = _make_jwt(int(time.time()) + 3600)
+        CognitoTokenCache("value", "value").save(id_token, "refresh", "access")
+
+        token, cognito = _authenticate_cognito(mock_cfg)
+
+        assert token == id_token
+        assert isinstance(cognito, CachedCognitoSession)
+        mock_prompt.assert_not_called()
+        mock_cognito_cls.assert_not_called()
+        assert cognito.cognito_client is mock_pycognito_cls.return_value
+        assert mock_pycognito_cls.call_args.kwargs["refresh_token"] == "refresh"
+
     @patch("amplify_media_migrator.cli.click.prompt", return_value="password")
     @patch("amplify_auth.CognitoAuthProvider")
     def test_no_token_exits(
@@ -334,6 +480,41 @@ class TestAuthenticateCognito:
             _authenticate_cognito(mock_cfg)
 
 
+class TestReadCognitoPassword:
+    @patch("amplify_media_migrator.cli.click.prompt", return_value="typed")
+    def test_prompts_by_default(
+        self, mock_prompt: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv(COGNITO_PASSWORD_ENV, raising=False)
+        assert _read_cognito_password() == "typed"
+        mock_prompt.assert_called_once_with("Cognito password", hide_input=True)
+
+    @patch("amplify_media_migrator.cli.click.prompt")
+    def test_env_var_skips_prompt(
+        self, mock_prompt: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(COGNITO_PASSWORD_ENV, "from-env")
+        assert _read_cognito_password() == "from-env"
+        mock_prompt.assert_not_called()
+
+    @patch("amplify_media_migrator.cli.click.prompt")
+    def test_stdin_takes_first_line(
+        self, mock_prompt: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(COGNITO_PASSWORD_ENV, "from-env")
+        monkeypatch.setattr("sys.stdin", io.StringIO("from-stdin\nignored\n"))
+        assert _read_cognito_password(password_stdin=True) == "from-stdin"
+        mock_prompt.assert_not_called()
+
+    @pytest.mark.parametrize("stdin", ["", "\n"])
+    def test_empty_stdin_exits(
+        self, stdin: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+        with pytest.raises(SystemExit):
+            _read_cognito_password(password_stdin=True)
+
+
 class TestCreateEngine:
     def test_creates_engine_with_config(self) -> None:
         mock_cfg = MagicMock()
@@ -347,9 +528,9 @@ class TestCreateEngine:
         mock_cfg.config = Config(migration=MigrationConfig(max_workers=5))
 
         with patch(
-            "amplify_media_migrator.cli.AmplifyStorageClient"
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
         ) as mock_storage_cls, patch(
-            "amplify_media_migrator.cli.GraphQLClient"
+            "amplify_media_migrator.targets.graphql_client.GraphQLClient"
         ) as mock_gql_cls:
             mock_storage = MagicMock()
             mock_storage_cls.return_value = mock_storage
@@ -361,6 +542,10 @@ class TestCreateEngine:
             assert isinstance(engine, MigrationEngine)
             mock_storage.connect.assert_called_once_with("token")
             mock_gql.connect.assert_called_once_with("token")
+            assert mock_gql_cls.call_args.kwargs["max_pool_connections"] == 5
+            assert mock_storage_cls.call_args.kwargs["max_pool_connections"] == (
+                5 * TRANSFER_MAX_CONCURRENCY
+            )
 
     def test_passes_adaptive_settings_from_config(self) -> None:
         mock_cfg = MagicMock()
@@ -381,9 +566,9 @@ class TestCreateEngine:
             )
         )
 
-        with patch("amplify_media_migrator.cli.AmplifyStorageClient"), patch(
-            "amplify_media_migrator.cli.GraphQLClient"
-        ):
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ), patch("amplify_media_migrator.targets.graphql_client.GraphQLClient"):
             engine = _create_engine(mock_cfg, MagicMock(), "token")
 
         assert engine._controller is not None
@@ -401,9 +586,9 @@ class TestCreateEngine:
         }[key]
         mock_cfg.config = Config(migration=MigrationConfig(adaptive_concurrency=False))
 
-        with patch("amplify_media_migrator.cli.AmplifyStorageClient"), patch(
-            "amplify_media_migrator.cli.GraphQLClient"
-        ):
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ), patch("amplify_media_migrator.targets.graphql_client.GraphQLClient"):
             engine = _create_engine(mock_cfg, MagicMock(), "token")
 
         assert engine._controller is None
@@ -424,9 +609,9 @@ class TestCreateEngine:
         mock_cognito_client.id_token = "new-token"
         mock_cognito_provider.cognito_client = mock_cognito_client
 
-        with patch("amplify_media_migrator.cli.AmplifyStorageClient"), patch(
-            "amplify_media_migrator.cli.GraphQLClient"
-        ):
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ), patch("amplify_media_migrator.targets.graphql_client.GraphQLClient"):
             engine = _create_engine(
                 mock_cfg, MagicMock(), "token", mock_cognito_provider
             )
@@ -438,6 +623,50 @@ class TestCreateEngine:
         mock_cognito_client.renew_access_token.assert_called_once()
         assert result == "new-token"
 
+    def _refresh_fn_with_cache(
+        self, cognito_client: MagicMock, token_cache: CognitoTokenCache
+    ) -> Callable[[], Optional[str]]:
+        mock_cfg = MagicMock()
+        mock_cfg.get.return_value = "value"
+        mock_cfg.config = Config(migration=MigrationConfig(max_workers=5))
+        provider = MagicMock()
+        provider.cognito_client = cognito_client
+
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ), patch("amplify_media_migrator.targets.graphql_client.GraphQLClient"):
+            engine = _create_engine(
+                mock_cfg, MagicMock(), "token", provider, token_cache
+            )
+        assert engine._token_manager is not None
+        refresh: Callable[[], Optional[str]] = engine._token_manager._refresh_fn
+        return refresh
+
+    def test_refresh_writes_renewed_tokens_to_cache(self, tmp_path: Path) -> None:
+        token_cache = CognitoTokenCache("pool", "user", cache_dir=tmp_path)
+        renewed = _make_jwt(int(time.time()) + 3600)
+        cognito_client = MagicMock()
+        cognito_client.id_token = renewed
+        cognito_client.refresh_token = "refresh"
+        cognito_client.access_token = "access"
+
+        assert self._refresh_fn_with_cache(cognito_client, token_cache)() == renewed
+
+        cached = token_cache.load()
+        assert cached is not None
+        assert cached.id_token == renewed
+        assert cached.access_token == "access"
+
+    def test_failed_refresh_clears_cache(self, tmp_path: Path) -> None:
+        token_cache = CognitoTokenCache("pool", "user", cache_dir=tmp_path)
+        token_cache.save(_make_jwt(int(time.time()) + 3600), "refresh")
+        cognito_client = MagicMock()
+        cognito_client.renew_access_token.side_effect = RuntimeError("revoked")
+
+        assert self._refresh_fn_with_cache(cognito_client, token_cache)() is None
+
+        assert not token_cache.path.exists()
+
     def test_no_token_manager_without_cognito_provider(self) -> None:
         mock_cfg = MagicMock()
         mock_cfg.get.side_effect = lambda key: {
@@ -449,9 +678,9 @@ class TestCreateEngine:
         }[key]
         mock_cfg.config = Config(migration=MigrationConfig(max_workers=5))
 
-        with patch("amplify_media_migrator.cli.AmplifyStorageClient"), patch(
-            "amplify_media_migrator.cli.GraphQLClient"
-        ):
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ), patch("amplify_media_migrator.targets.graphql_client.GraphQLClient"):
             engine = _create_engine(mock_cfg, MagicMock(), "token")
 
         assert engine._token_manager is None
@@ -502,6 +731,24 @@ class TestRunWithProgress:
         mock_plain.assert_called_once()
 
 
+class TestRunLive:
+    def test_ticker_is_sole_refresher(self) -> None:
+        from amplify_media_migrator.cli import _run_live
+        from amplify_media_migrator.cli_progress import LiveReporter
+
+        async def coro() -> None:
+            await asyncio.sleep(0.05)
+
+        with patch("rich.live.Live") as mock_live_cls:
+            live = mock_live_cls.return_value.__enter__.return_value
+            _run_live(coro, LiveReporter(), MagicMock(), fps=50)
+
+        assert mock_live_cls.call_args.kwargs["auto_refresh"] is False
+        assert live.update.call_count >= 1
+        for call in live.update.call_args_list:
+            assert call.kwargs == {"refresh": True}
+
+
 class TestPrintSummary:
     def test_prints_all_fields(self, runner: CliRunner) -> None:
         summary = {
@@ -517,13 +764,34 @@ class TestPrintSummary:
         result = runner.invoke(main, ["--help"])
         _print_summary(summary)
 
+    def test_writes_report_in_one_call(self) -> None:
+        summary = dict.fromkeys(
+            [
+                "total",
+                "completed",
+                "failed",
+                "orphan",
+                "needs_review",
+                "partial",
+                "duplicate",
+                "pending",
+            ],
+            0,
+        )
+
+        with patch("amplify_media_migrator.cli.click.echo") as mock_echo:
+            _print_summary(summary)
+
+        mock_echo.assert_called_once()
+        assert "  Pending:        0" in mock_echo.call_args.args[0]
+
 
 class TestScanCommand:
     @patch("amplify_media_migrator.cli._load_config")
     @patch("amplify_media_migrator.cli._authenticate_google")
     @patch("amplify_media_migrator.cli.asyncio.run")
-    @patch("amplify_media_migrator.cli.AmplifyStorageClient")
-    @patch("amplify_media_migrator.cli.GraphQLClient")
+    @patch("amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
     def test_scan_success(
         self,
         mock_gql_cls: MagicMock,
@@ -843,8 +1111,8 @@ class TestMigrateVerbose:
 
 
 class TestValidateCommand:
-    @patch("amplify_media_migrator.cli.GraphQLClient")
-    @patch("amplify_media_migrator.cli.AmplifyStorageClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
+    @patch("amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient")
     @patch("amplify_media_migrator.cli._authenticate_cognito")
     @patch("amplify_media_migrator.cli._authenticate_google")
     @patch("amplify_media_migrator.cli._load_config")
@@ -861,7 +1129,7 @@ class TestValidateCommand:
         mock_cfg.get.side_effect = lambda key: "test-value"
         mock_load.return_value = mock_cfg
         mock_drive = MagicMock()
-        mock_drive.list_files.return_value = iter([])
+        mock_drive.probe_folder.return_value = True
         mock_auth_g.return_value = mock_drive
         mock_auth_c.return_value = ("test-token", MagicMock())
         mock_storage = MagicMock()
@@ -880,6 +1148,8 @@ class TestValidateCommand:
         assert "[PASS] S3 bucket access" in result.output
         assert "[PASS] GraphQL endpoint" in result.output
         assert "All checks passed" in result.output
+        mock_drive.probe_folder.assert_called_once_with("test-folder")
+        mock_drive.list_files.assert_not_called()
 
     @patch("amplify_media_migrator.cli._load_config")
     def test_config_failure_exits_immediately(
@@ -909,8 +1179,10 @@ class TestValidateCommand:
         mock_auth_g.side_effect = SystemExit(1)
         mock_auth_c.return_value = ("test-token", MagicMock())
 
-        with patch("amplify_media_migrator.cli.AmplifyStorageClient") as mock_s, patch(
-            "amplify_media_migrator.cli.GraphQLClient"
+        with patch(
+            "amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient"
+        ) as mock_s, patch(
+            "amplify_media_migrator.targets.graphql_client.GraphQLClient"
         ) as mock_g:
             mock_storage = MagicMock()
             mock_storage.file_exists.return_value = False
@@ -925,6 +1197,39 @@ class TestValidateCommand:
         assert "[FAIL] Google Drive authentication" in result.output
         assert "[SKIP] Google Drive folder access" in result.output
 
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
+    @patch("amplify_media_migrator.targets.amplify_storage.AmplifyStorageClient")
+    @patch("amplify_media_migrator.cli._authenticate_cognito")
+    @patch("amplify_media_migrator.cli._authenticate_google")
+    @patch("amplify_media_migrator.cli._load_config")
+    def test_probe_failure_does_not_stop_other_probes(
+        self,
+        mock_load: MagicMock,
+        mock_auth_g: MagicMock,
+        mock_auth_c: MagicMock,
+        mock_storage_cls: MagicMock,
+        mock_gql_cls: MagicMock,
+        runner: CliRunner,
+    ) -> None:
+        mock_cfg = MagicMock()
+        mock_cfg.get.side_effect = lambda key: "test-value"
+        mock_load.return_value = mock_cfg
+        mock_auth_g.return_value = MagicMock()
+        mock_auth_c.return_value = ("test-token", MagicMock())
+        mock_storage_cls.return_value.file_exists.side_effect = RuntimeError("denied")
+        mock_gql_cls.return_value.get_observation_by_sequential_id.return_value = None
+
+        result = runner.invoke(main, ["validate", "--folder-id", "test-folder"])
+
+        assert result.exit_code == 1
+        assert "[FAIL] S3 bucket access: denied" in result.output
+        assert "[PASS] GraphQL endpoint" in result.output
+        assert result.output.index("folder access") < result.output.index(
+            "S3 bucket access"
+        )
+        mock_storage_cls.return_value.close.assert_called_once_with()
+        mock_gql_cls.return_value.close.assert_called_once_with()
+
     def test_missing_folder_id(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["validate"])
         assert result.exit_code != 0
@@ -992,7 +1297,7 @@ class TestStatusCommand:
 
 
 class TestObservationsWithoutMediaCommand:
-    @patch("amplify_media_migrator.cli.GraphQLClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
     @patch("amplify_media_migrator.cli._authenticate_cognito")
     @patch("amplify_media_migrator.cli._load_config")
     def test_writes_sorted_json_to_given_output(
@@ -1028,7 +1333,7 @@ class TestObservationsWithoutMediaCommand:
             {"id": "obs-2", "sequentialId": 200},
         ]
 
-    @patch("amplify_media_migrator.cli.GraphQLClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
     @patch("amplify_media_migrator.cli._authenticate_cognito")
     @patch("amplify_media_migrator.cli._load_config")
     def test_empty_result_writes_empty_array_and_message(
@@ -1057,7 +1362,7 @@ class TestObservationsWithoutMediaCommand:
         assert "No observations without media found" in result.output
         assert json.loads(output_file.read_text()) == []
 
-    @patch("amplify_media_migrator.cli.GraphQLClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
     @patch("amplify_media_migrator.cli._authenticate_cognito")
     @patch("amplify_media_migrator.cli._load_config")
     def test_default_output_path_used_when_not_provided(
@@ -1084,7 +1389,7 @@ class TestObservationsWithoutMediaCommand:
         expected_path = default_dir / "observations_without_media.json"
         assert expected_path.exists()
 
-    @patch("amplify_media_migrator.cli.GraphQLClient")
+    @patch("amplify_media_migrator.targets.graphql_client.GraphQLClient")
     @patch("amplify_media_migrator.cli._authenticate_cognito")
     @patch("amplify_media_migrator.cli._load_config")
     def test_graphql_error_exits_with_code_1(
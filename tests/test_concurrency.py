@@ -1,11 +1,13 @@
 import asyncio
 import threading
+from typing import List, Union
 
 import pytest
 
 from amplify_media_migrator.migration.concurrency import (
     ConcurrencyController,
     InflightBudget,
+    MicroBatcher,
     ThroughputMeter,
 )
 
@@ -153,3 +155,61 @@ class TestControllerGate:
         await asyncio.sleep(0.02)
         assert waiter.done()
         await waiter
+
+
+class TestMicroBatcher:
+    async def test_flushes_when_batch_is_full(self) -> None:
+        calls: List[List[int]] = []
+
+        async def flush(items: List[int]) -> List[Union[int, Exception]]:
+            calls.append(items)
+            return [i * 10 for i in items]
+
+        batcher: MicroBatcher[int, int] = MicroBatcher(
+            flush, max_size=3, max_delay_seconds=10.0
+        )
+
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+        assert results == [0, 10, 20]
+        assert calls == [[0, 1, 2]]
+
+    async def test_flushes_partial_batch_after_delay(self) -> None:
+        calls: List[List[int]] = []
+
+        async def flush(items: List[int]) -> List[Union[int, Exception]]:
+            calls.append(items)
+            return list(items)
+
+        batcher: MicroBatcher[int, int] = MicroBatcher(
+            flush, max_size=25, max_delay_seconds=0.01
+        )
+
+        assert await batcher.submit(7) == 7
+        assert calls == [[7]]
+
+    async def test_per_item_error_only_fails_that_item(self) -> None:
+        async def flush(items: List[int]) -> List[Union[int, Exception]]:
+            return [ValueError("bad") if i == 1 else i for i in items]
+
+        batcher: MicroBatcher[int, int] = MicroBatcher(flush, max_size=3)
+
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+
+        assert results[0] == 0
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 2
+
+    async def test_flush_exception_fails_whole_batch(self) -> None:
+        async def flush(items: List[int]) -> List[Union[int, Exception]]:
+            raise RuntimeError("down")
+
+        batcher: MicroBatcher[int, int] = MicroBatcher(flush, max_size=2)
+
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(2)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
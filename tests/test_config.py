@@ -1,3 +1,4 @@
+import dataclasses
 import json
 from pathlib import Path
 from unittest.mock import patch
@@ -13,6 +14,7 @@ from amplify_media_migrator.config import (
     ConfigurationError,
     GoogleDriveConfig,
     MigrationConfig,
+    PrefixDisambiguationConfig,
     config_from_dict,
     config_to_dict,
     validate_config,
@@ -28,6 +30,7 @@ def sample_config_dict():
             "folder_id": "1ABC_test_folder",
             "credentials_path": "/tmp/test_creds.json",
             "token_path": "/tmp/test_token.json",
+            "download_chunk_size_mb": 8,
         },
         "aws": {
             "region": "eu-west-1",
@@ -53,6 +56,9 @@ def sample_config_dict():
             "initial_workers": None,
             "max_inflight_buffer_mb": 512,
             "window_seconds": 10.0,
+            "media_batch_size": 25,
+            "stream_threshold_mb": 25,
+            "lookup_batch_size": 25,
         },
         "prefix_disambiguation": {
             "enabled": False,
@@ -82,6 +88,7 @@ class TestConfigDataClasses:
             gd.credentials_path == "~/.amplify-media-migrator/google_credentials.json"
         )
         assert gd.token_path == "~/.amplify-media-migrator/google_token.json"
+        assert gd.download_chunk_size_mb == 8
 
     def test_cognito_defaults(self):
         cognito = CognitoConfig()
@@ -102,6 +109,9 @@ class TestConfigDataClasses:
         assert migration.retry_delay_seconds == 5
         assert migration.chunk_size_mb == 8
         assert migration.default_media_public is False
+        assert migration.media_batch_size == 25
+        assert migration.stream_threshold_mb == 25
+        assert migration.lookup_batch_size == 25
 
     def test_full_config_composition(self):
         config = Config(
@@ -151,6 +161,33 @@ class TestConfigSerialization:
         result = config_to_dict(config)
         assert result == sample_config_dict
 
+    def test_config_round_trips_through_dict(self):
+        config = Config(
+            google_drive=GoogleDriveConfig(folder_id="abc"),
+            aws=AWSConfig(cognito=CognitoConfig(username="user@example.com")),
+            migration=MigrationConfig(max_workers=7, default_media_public=True),
+            prefix_disambiguation=PrefixDisambiguationConfig(
+                enabled=True, discriminator_field="kind", prefixes={"A": "x"}
+            ),
+        )
+        result = config_to_dict(config)
+        assert result == dataclasses.asdict(config)
+        assert config_from_dict(result) == config
+
+    def test_unknown_keys_are_ignored(self, sample_config_dict):
+        sample_config_dict["migration"]["obsolete_option"] = 1
+        sample_config_dict["unknown_section"] = {"x": 1}
+        assert config_from_dict(sample_config_dict).migration.max_workers == 5
+
+    def test_dicts_are_copied_both_ways(self):
+        data = {"prefix_disambiguation": {"prefixes": {"A": "1"}}}
+        config = config_from_dict(data)
+        data["prefix_disambiguation"]["prefixes"]["B"] = "2"
+        assert config.prefix_disambiguation.prefixes == {"A": "1"}
+
+        config_to_dict(config)["prefix_disambiguation"]["prefixes"]["C"] = "3"
+        assert config.prefix_disambiguation.prefixes == {"A": "1"}
+
     def test_partial_dict_uses_defaults(self):
         partial = {"aws": {"region": "us-west-2"}}
         config = config_from_dict(partial)
@@ -189,6 +226,30 @@ class TestConfigValidation:
         with pytest.raises(ConfigurationError):
             validate_config(config)
 
+    def test_download_chunk_size_zero_fails(self):
+        config = Config(google_drive=GoogleDriveConfig(download_chunk_size_mb=0))
+        with pytest.raises(ConfigurationError):
+            validate_config(config)
+
+    def test_media_batch_size_zero_fails(self):
+        config = Config(migration=MigrationConfig(media_batch_size=0))
+        with pytest.raises(ConfigurationError):
+            validate_config(config)
+
+    def test_lookup_batch_size_zero_fails(self):
+        config = Config(migration=MigrationConfig(lookup_batch_size=0))
+        with pytest.raises(ConfigurationError):
+            validate_config(config)
+
+    def test_stream_threshold_zero_is_valid(self):
+        config = Config(migration=MigrationConfig(stream_threshold_mb=0))
+        validate_config(config)
+
+    def test_stream_threshold_negative_fails(self):
+        config = Config(migration=MigrationConfig(stream_threshold_mb=-1))
+        with pytest.raises(ConfigurationError):
+            validate_config(config)
+
     def test_chunk_size_zero_fails(self):
         config = Config(migration=MigrationConfig(chunk_size_mb=0))
         with pytest.raises(ConfigurationError):
@@ -238,6 +299,15 @@ class TestConfigManagerFileOps:
         mgr.save()
         assert path.exists()
 
+    def test_save_replaces_file_atomically(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        mgr = ConfigManager(config_path=path)
+        _ = mgr.config
+        mgr.save()
+        assert "migration" in json.loads(path.read_text())
+        assert list(tmp_path.iterdir()) == [path]
+
     def test_load_reads_config_correctly(self, manager, sample_config_dict):
         config = manager.load()
         assert (
@@ -266,9 +336,9 @@ class TestConfigManagerFileOps:
         path = tmp_path / "roundtrip.json"
         mgr1 = ConfigManager(config_path=path)
         _ = mgr1.config
-        mgr1.config.google_drive.folder_id = "roundtrip_folder"
-        mgr1.config.aws.region = "ap-northeast-1"
-        mgr1.config.migration.max_workers = 42
+        mgr1.set("google_drive.folder_id", "roundtrip_folder")
+        mgr1.set("aws.region", "ap-northeast-1")
+        mgr1.set("migration.max_workers", 42)
         mgr1.save()
 
         mgr2 = ConfigManager(config_path=path)
@@ -277,6 +347,19 @@ class TestConfigManagerFileOps:
         assert config.aws.region == "ap-northeast-1"
         assert config.migration.max_workers == 42
 
+    def test_loads_return_independent_configs(self, config_file):
+        first = ConfigManager(config_path=config_file).load()
+        first.prefix_disambiguation.prefixes["X"] = "mutated"
+        second = ConfigManager(config_path=config_file).load()
+        assert "X" not in second.prefix_disambiguation.prefixes
+
+    def test_modified_file_is_reparsed(self, config_file, sample_config_dict):
+        ConfigManager(config_path=config_file).load()
+        sample_config_dict["google_drive"]["folder_id"] = "changed_folder_id"
+        config_file.write_text(json.dumps(sample_config_dict))
+        config = ConfigManager(config_path=config_file).load()
+        assert config.google_drive.folder_id == "changed_folder_id"
+
 
 class TestConfigManagerDotNotation:
     def test_get_top_level_key(self, manager):
@@ -312,6 +395,17 @@ class TestConfigManagerDotNotation:
         manager.update("migration.max_workers", 99)
         assert manager.get("migration.max_workers") == 99
 
+    def test_set_replaces_instead_of_mutating(self, manager):
+        before = manager.load()
+        manager.set("aws.cognito.username", "other@test.com")
+        assert before.aws.cognito.username != "other@test.com"
+        assert manager.config.aws.region == before.aws.region
+
+    def test_config_is_frozen(self, manager):
+        config = manager.load()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.aws.region = "eu-west-1"  # type: ignore[misc]
+
 
 class TestConfigEnvOverrides:
     def test_aws_region_override(self, manager, monkeypatch):
@@ -469,6 +563,16 @@ class TestConfigManagerEdgeCases:
         with pytest.raises(ConfigurationError, match="unknown segment"):
             manager.set("aws.nonexistent_field", "x")
 
+    def test_set_error_names_first_unknown_segment(self, manager):
+        manager.load()
+        with pytest.raises(ConfigurationError, match="unknown segment 'bogus'"):
+            manager.set("aws.bogus.region", "x")
+
+    def test_set_replaces_whole_section(self, manager):
+        manager.load()
+        manager.set("aws.cognito", CognitoConfig(username="swapped@test.com"))
+        assert manager.get("aws.cognito.username") == "swapped@test.com"
+
 
 class TestConfigManagerProperties:
     def test_config_path_returns_path(self, config_file):
@@ -519,9 +623,10 @@ def test_prefix_disambiguation_validation_requires_fields():
         ConfigurationError,
     )
 
-    cfg = Config()
-    cfg.prefix_disambiguation = PrefixDisambiguationConfig(
-        enabled=True, discriminator_field="", prefixes={}
+    cfg = Config(
+        prefix_disambiguation=PrefixDisambiguationConfig(
+            enabled=True, discriminator_field="", prefixes={}
+        )
     )
     with pytest.raises(ConfigurationError):
         cfg.validate()
@@ -534,9 +639,10 @@ def test_prefix_disambiguation_rejects_multiple_catch_all():
         ConfigurationError,
     )
 
-    cfg = Config()
-    cfg.prefix_disambiguation = PrefixDisambiguationConfig(
-        enabled=True, discriminator_field="countryId", prefixes={"E": "*", "S": "*"}
+    cfg = Config(
+        prefix_disambiguation=PrefixDisambiguationConfig(
+            enabled=True, discriminator_field="countryId", prefixes={"E": "*", "S": "*"}
+        )
     )
     with pytest.raises(ConfigurationError):
         cfg.validate()
@@ -570,15 +676,12 @@ class TestAdaptiveConcurrencyConfig:
         assert cfg.migration.window_seconds == 5.0
 
     def test_validate_rejects_min_workers_below_one(self) -> None:
-        cfg = Config()
-        cfg.migration.min_workers = 0
+        cfg = Config(migration=MigrationConfig(min_workers=0))
         with pytest.raises(Exception):
             cfg.validate()
 
     def test_validate_rejects_min_above_max(self) -> None:
-        cfg = Config()
-        cfg.migration.max_workers = 4
-        cfg.migration.min_workers = 8
+        cfg = Config(migration=MigrationConfig(max_workers=4, min_workers=8))
         with pytest.raises(Exception):
             cfg.validate()
 
@@ -1,5 +1,7 @@
 import asyncio
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Callable, Dict, List, Optional
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
@@ -190,6 +192,21 @@ class TestScan:
 
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
+    def test_consumes_listing_generator_across_batches(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        drive_client.list_files.return_value = (
+            _drive_file(f"f{i}", f"{6000 + i}.jpg") for i in range(2500)
+        )
+        result = asyncio.run(engine.scan("folder-1"))
+
+        assert result["single"] == 2500
+        assert progress.total_files == 2500
+        assert len(progress.get_pending_file_ids()) == 2500
+
 
 class TestProcessFileSingle:
     def test_full_pipeline(
@@ -214,7 +231,7 @@ class TestProcessFileSingle:
 
         asyncio.run(engine.process_file(file))
 
-        drive_client.download_file.assert_called_once_with("f1", ANY)
+        drive_client.download_file.assert_called_once_with("f1", ANY, file.size)
         storage_client.upload_file.assert_called_once_with(
             b"photo bytes", "media/obs-1/6602.jpg", "image/jpeg", ANY
         )
@@ -892,7 +909,7 @@ class TestErrorHandling:
 
 
 class TestRetry:
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_retries_on_download_error(
         self,
         _mock_random: MagicMock,
@@ -919,7 +936,7 @@ class TestRetry:
         assert drive_client.download_file.call_count == 2
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_retries_on_rate_limit(
         self,
         _mock_random: MagicMock,
@@ -946,7 +963,7 @@ class TestRetry:
         assert drive_client.download_file.call_count == 2
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_exhausted_retries_marks_failed(
         self,
         _mock_random: MagicMock,
@@ -967,7 +984,7 @@ class TestRetry:
         assert drive_client.download_file.call_count == 2
         assert progress.files["f1"].status == FileStatus.FAILED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_retries_upload_on_connection_error(
         self,
         _mock_random: MagicMock,
@@ -994,7 +1011,7 @@ class TestRetry:
         assert storage_client.upload_file.call_count == 2
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_upload_exhausts_retries_then_fails(
         self,
         _mock_random: MagicMock,
@@ -1018,7 +1035,7 @@ class TestRetry:
         assert progress.files["f1"].status == FileStatus.FAILED
         graphql_client.create_media.assert_not_called()
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_retries_create_media_on_transient_graphql_error(
         self,
         _mock_random: MagicMock,
@@ -1049,7 +1066,7 @@ class TestRetry:
         assert graphql_client.create_media.call_count == 2
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_does_not_retry_create_media_on_non_retryable_error(
         self,
         _mock_random: MagicMock,
@@ -1075,7 +1092,7 @@ class TestRetry:
         assert graphql_client.create_media.call_count == 1
         assert progress.files["f1"].status == FileStatus.FAILED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_create_media_exhausts_retries_then_fails(
         self,
         _mock_random: MagicMock,
@@ -1105,7 +1122,7 @@ class TestRetry:
 
 
 class TestTokenExpiryRecovery:
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_stream_upload_forces_refresh_on_expired_token(
         self,
         _mock_random: MagicMock,
@@ -1151,7 +1168,7 @@ class TestTokenExpiryRecovery:
         assert storage_client.upload_file_stream.call_count == 2
         assert progress.files["f1"].status == FileStatus.COMPLETED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_expired_token_without_token_manager_falls_back_to_backoff(
         self,
         _mock_random: MagicMock,
@@ -1176,7 +1193,7 @@ class TestTokenExpiryRecovery:
         assert storage_client.upload_file_stream.call_count == 2
         assert progress.files["f1"].status == FileStatus.FAILED
 
-    @patch("amplify_media_migrator.migration.engine.random.uniform", return_value=0)
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0)
     def test_failed_refresh_falls_back_to_backoff(
         self,
         _mock_random: MagicMock,
@@ -1269,7 +1286,9 @@ class TestMigrate:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "6602.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "6602.jpg")
+        }
         obs = _observation("obs-1", 6602)
         graphql_client.get_observations_by_sequential_ids.return_value = {6602: obs}
         drive_client.download_file.return_value = b"data"
@@ -1315,6 +1334,33 @@ class TestMigrate:
         assert progress.files["f2"].status == FileStatus.COMPLETED
         assert drive_client.download_file.call_count == 1
 
+    def test_rescan_retries_failed_file_still_in_folder(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        graphql_client: MagicMock,
+        storage_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        progress.update_file("f1", "6602.jpg", FileStatus.FAILED, error="boom")
+        progress.update_file("f9", "6609.jpg", FileStatus.FAILED, error="gone")
+        progress.save()
+
+        drive_client.list_files.return_value = iter([_drive_file("f1", "6602.jpg")])
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            6602: _observation("obs-1", 6602)
+        }
+        drive_client.download_file.return_value = b"data"
+        storage_client.upload_file.return_value = "https://bucket/media/obs-1/6602.jpg"
+        graphql_client.create_media.return_value = _media("m-1")
+
+        asyncio.run(engine.migrate("folder-1", rescan=True))
+
+        assert progress.files["f1"].status == FileStatus.COMPLETED
+        assert progress.files["f9"].status == FileStatus.PENDING
+        assert drive_client.download_file.call_count == 1
+
     def test_reprocesses_needs_review_files_after_rename(
         self,
         engine: MigrationEngine,
@@ -1417,7 +1463,9 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "6602.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "6602.jpg")
+        }
         obs = _observation("obs-1", 6602)
         graphql_client.get_observations_by_sequential_ids.return_value = {6602: obs}
         drive_client.download_file.return_value = b"data"
@@ -1449,7 +1497,9 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "6000-6001.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "6000-6001.jpg")
+        }
         obs_a = _observation("obs-a", 6000)
         obs_b = _observation("obs-b", 6001)
         graphql_client.get_observations_by_sequential_ids.return_value = {
@@ -1504,7 +1554,9 @@ class TestMigrateFromProgress:
         progress.save()
 
         # Drive now returns a valid filename for the same file ID
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "6602.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "6602.jpg")
+        }
         obs = _observation("obs-1", 6602)
         graphql_client.get_observations_by_sequential_ids.return_value = {6602: obs}
         drive_client.download_file.return_value = b"data"
@@ -1530,7 +1582,9 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "still_bad.pdf")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "still_bad.pdf")
+        }
 
         asyncio.run(engine.migrate("folder-1"))
 
@@ -1552,11 +1606,57 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "still_bad.pdf")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "still_bad.pdf")
+        }
 
         # Should complete without raising
         asyncio.run(engine.migrate("folder-1"))
-        drive_client.get_file_metadata.assert_called_once()
+        drive_client.get_files_metadata.assert_called_once()
+
+    def test_needs_review_metadata_failure_is_tolerated(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        progress.update_file(
+            file_id="f1",
+            filename="bad.txt",
+            status=FileStatus.NEEDS_REVIEW,
+            error="Invalid filename pattern",
+        )
+        progress.save()
+
+        drive_client.get_files_metadata.side_effect = DownloadError("boom")
+
+        asyncio.run(engine.migrate("folder-1"))
+
+        assert progress.files["f1"].status == FileStatus.NEEDS_REVIEW
+
+    def test_needs_review_metadata_is_one_client_call(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        for i in range(150):
+            progress.update_file(
+                file_id=f"f{i:03d}",
+                filename="bad.txt",
+                status=FileStatus.NEEDS_REVIEW,
+            )
+        progress.save()
+        drive_client.get_files_metadata.return_value = {
+            "f000": _drive_file("f000", "6602.jpg")
+        }
+
+        asyncio.run(engine._fetch_and_evaluate_needs_review(set(progress.files)))
+
+        drive_client.get_files_metadata.assert_called_once_with(sorted(progress.files))
+        assert progress.files["f000"].status == FileStatus.PENDING
 
     def test_retries_orphan_files_when_flag_set(
         self,
@@ -1576,7 +1676,9 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "144.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "144.jpg")
+        }
         obs = _observation("obs-144", 144)
         graphql_client.get_observations_by_sequential_ids.return_value = {144: obs}
         drive_client.download_file.return_value = b"data"
@@ -1608,7 +1710,7 @@ class TestMigrateFromProgress:
         asyncio.run(engine.migrate("folder-1"))
 
         assert progress.files["f1"].status == FileStatus.ORPHAN
-        drive_client.get_file_metadata.assert_not_called()
+        drive_client.get_files_metadata.assert_not_called()
 
     def test_retry_orphans_stays_orphan_when_still_not_found(
         self,
@@ -1627,7 +1729,9 @@ class TestMigrateFromProgress:
         )
         progress.save()
 
-        drive_client.get_file_metadata.return_value = _drive_file("f1", "144.jpg")
+        drive_client.get_files_metadata.return_value = {
+            "f1": _drive_file("f1", "144.jpg")
+        }
         graphql_client.get_observations_by_sequential_ids.return_value = {}
 
         asyncio.run(engine.migrate("folder-1", retry_orphans=True))
@@ -1671,6 +1775,39 @@ class TestRunWorkers:
 
         assert max_concurrent["value"] == 2
 
+    def test_n_files_at_concurrency_n_all_run_in_parallel(
+        self,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        progress.load("folder-1")
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=10,
+            adaptive=AdaptiveSettings(enabled=False),
+        )
+        files = [_drive_file(f"f{i}", f"{6000 + i}.jpg") for i in range(10)]
+        max_concurrent = {"value": 0}
+        active = {"value": 0}
+
+        async def fake_process(file: DriveFile, dry_run: bool = False) -> None:
+            active["value"] += 1
+            max_concurrent["value"] = max(max_concurrent["value"], active["value"])
+            await asyncio.sleep(0.01)
+            active["value"] -= 1
+
+        engine.process_file = fake_process  # type: ignore[method-assign]
+        asyncio.run(engine._run_workers(files, dry_run=True))
+
+        assert max_concurrent["value"] == 10
+
     def test_auth_error_stops_pulling_new_files(
         self, engine: MigrationEngine, progress: ProgressTracker
     ) -> None:
@@ -1738,6 +1875,33 @@ class TestProgressReporter:
 
         assert ("done", "f1", FileStatus.COMPLETED) in reporter.events
 
+    def test_restarted_byte_count_keeps_metering(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            6602: _observation("obs-1", 6602)
+        }
+
+        def download(file_id: str, on_bytes: Callable, size: int) -> bytes:
+            # A ranged download that falls back restarts its count at zero.
+            for cumulative in (30, 10, 40):
+                on_bytes(cumulative)
+            return b"data"
+
+        drive_client.download_file.side_effect = download
+        storage_client.upload_file.return_value = "https://bucket/media/obs-1/6602.jpg"
+        graphql_client.create_media.return_value = _media("m-1")
+
+        asyncio.run(engine.process_file(_drive_file("f1", "6602.jpg")))
+
+        assert engine._throughput.total() == 30 + 40
+
     def test_phase_sequence_for_in_memory_path(
         self,
         engine: MigrationEngine,
@@ -1828,7 +1992,9 @@ class TestProgressReporter:
         obs = _observation("obs-1", 6602)
         graphql_client.get_observations_by_sequential_ids.return_value = {6602: obs}
 
-        def _download(file_id: str, on_bytes: object = None) -> bytes:
+        def _download(
+            file_id: str, on_bytes: object = None, size: object = None
+        ) -> bytes:
             if on_bytes is not None:
                 on_bytes(5)
                 on_bytes(10)
@@ -2232,12 +2398,14 @@ class TestAutosave:
             real_save()
 
         engine._progress.save = capturing_save  # type: ignore[method-assign]
+        engine._progress.load("folder-1")
 
         # Run with a very short interval so it fires before the gather completes
         with patch.object(
             engine, "_start_autosave", wraps=engine._start_autosave
         ) as spy:
             stop = engine._start_autosave(interval=0.05)
+            engine._progress.update_file("f1", "6602.jpg", FileStatus.PENDING)
             import time
 
             time.sleep(0.15)
@@ -2245,6 +2413,58 @@ class TestAutosave:
 
         assert len(fired) >= 1, "autosave thread should have fired at least once"
 
+    def test_stop_autosave_waits_for_running_save(
+        self,
+        engine: MigrationEngine,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        started = threading.Event()
+        finished: list = []
+
+        def slow_save() -> None:
+            started.set()
+            time.sleep(0.1)
+            finished.append(1)
+
+        with patch.object(progress, "save", side_effect=slow_save):
+            stop = engine._start_autosave(interval=60.0, max_unsaved=1, poll=0.01)
+            progress.update_file("f1", "6602.jpg", FileStatus.PENDING)
+            assert started.wait(1.0)
+            engine._stop_autosave(stop)
+
+        assert finished == [1]
+        assert engine._autosave_thread is None
+
+    def test_autosave_skips_unchanged_progress(
+        self,
+        engine: MigrationEngine,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        with patch.object(progress, "save") as save_mock:
+            stop = engine._start_autosave(interval=0.05)
+            time.sleep(0.15)
+            stop.set()
+
+        save_mock.assert_not_called()
+
+    def test_autosave_saves_early_once_enough_updates_accumulate(
+        self,
+        engine: MigrationEngine,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        saved = threading.Event()
+        with patch.object(progress, "save", side_effect=lambda: saved.set()):
+            stop = engine._start_autosave(interval=60.0, max_unsaved=3, poll=0.01)
+            for i in range(3):
+                progress.update_file(f"f{i}", f"{6000 + i}.jpg", FileStatus.PENDING)
+            try:
+                assert saved.wait(1.0)
+            finally:
+                stop.set()
+
     def test_autosave_not_started_for_dry_run(
         self,
         engine: MigrationEngine,
@@ -2347,7 +2567,7 @@ class TestProcessFileStreaming:
 
         asyncio.run(streaming_engine.process_file(file))
 
-        drive_client.download_file.assert_called_once_with("f1", ANY)
+        drive_client.download_file.assert_called_once_with("f1", ANY, file.size)
         drive_client.open_download_stream.assert_not_called()
         storage_client.upload_file_stream.assert_not_called()
 
@@ -2420,6 +2640,45 @@ class TestProcessFileStreaming:
         storage_client.upload_file_stream.assert_called_once()
         drive_client.download_file.assert_not_called()
 
+    def test_zero_threshold_streams_every_file(
+        self,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=2,
+            retry_attempts=1,
+            retry_delay_seconds=0,
+            large_file_threshold_mb=0,
+            upload_chunk_size_mb=16,
+        )
+        progress.load("folder-1")
+        file = _drive_file("f4", "321.jpg", size=1024)
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            321: _observation("obs-4", 321)
+        }
+        stream = MagicMock()
+        drive_client.open_download_stream.return_value = stream
+        storage_client.upload_file_stream.return_value = (
+            "https://bucket.s3.us-east-1.amazonaws.com/media/obs-4/321.jpg"
+        )
+        graphql_client.create_media.return_value = _media("media-4")
+
+        asyncio.run(engine.process_file(file))
+
+        drive_client.download_file.assert_not_called()
+        storage_client.upload_file_stream.assert_called_once_with(
+            stream, "media/obs-4/321.jpg", ANY, 16, ANY
+        )
+
 
 class TestProcessFilesConcurrency:
     def test_slow_file_does_not_block_others(
@@ -2654,3 +2913,259 @@ class TestDedupByChecksum:
         assert MigrationEngine._dedup_sort_key(
             "1953-A.jpg"
         ) < MigrationEngine._dedup_sort_key("1953-A - Copy.jpg")
+
+
+class TestObservationLookupBatching:
+    def test_concurrent_files_share_one_lookup(
+        self,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=2,
+            retry_attempts=2,
+            retry_delay_seconds=0,
+            lookup_batch_size=3,
+        )
+        progress.load("folder-1")
+        graphql_client.batch_get_observations_by_sequential_ids.side_effect = (
+            lambda ids: [
+                _observation(f"obs-{sid}", sid) if sid != 6602 else None for sid in ids
+            ]
+        )
+        drive_client.download_file.return_value = b"photo"
+        storage_client.upload_file.side_effect = (
+            lambda data, key, content_type, cb: f"https://bucket/{key}"
+        )
+        graphql_client.create_media.side_effect = (
+            lambda url, obs_id, media_type, is_public: _media(
+                f"m-{obs_id}", url, obs_id
+            )
+        )
+
+        async def _run() -> None:
+            await asyncio.gather(
+                engine.process_file(_drive_file("f1", "6601.jpg")),
+                engine.process_file(_drive_file("f2", "6602.jpg")),
+                engine.process_file(_drive_file("f3", "6603.jpg")),
+            )
+
+        asyncio.run(_run())
+
+        graphql_client.batch_get_observations_by_sequential_ids.assert_called_once()
+        (ids,) = graphql_client.batch_get_observations_by_sequential_ids.call_args.args
+        assert sorted(ids) == [6601, 6602, 6603]
+        graphql_client.get_observation_by_sequential_id.assert_not_called()
+        assert progress.files["f1"].status == FileStatus.COMPLETED
+        assert progress.files["f2"].status == FileStatus.ORPHAN
+        assert progress.files["f3"].status == FileStatus.COMPLETED
+
+
+class TestObservationLookupCache:
+    def test_files_sharing_a_sequential_id_query_once(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            6602: _observation()
+        }
+        drive_client.download_file.return_value = b"photo"
+        storage_client.upload_file.side_effect = (
+            lambda data, key, content_type, cb: f"https://bucket/{key}"
+        )
+        graphql_client.create_media.return_value = _media()
+
+        async def _run() -> None:
+            await asyncio.gather(
+                engine.process_file(_drive_file("f1", "6602.jpg")),
+                engine.process_file(_drive_file("f2", "6602a.jpg")),
+            )
+            await engine.process_file(_drive_file("f3", "6602b.jpg"))
+
+        asyncio.run(_run())
+
+        graphql_client.get_observation_by_sequential_id.assert_called_once_with(6602)
+        assert progress.files["f3"].status == FileStatus.COMPLETED
+
+    def test_failed_lookup_is_retried_by_next_file(
+        self,
+        engine: MigrationEngine,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+    ) -> None:
+        progress.load("folder-1")
+        graphql_client.get_observation_by_sequential_id.side_effect = [
+            GraphQLError("boom"),
+            _observation(),
+        ]
+        drive_client.download_file.return_value = b"photo"
+        storage_client.upload_file.return_value = "https://bucket/media/obs-1/x.jpg"
+        graphql_client.create_media.return_value = _media()
+
+        async def _run() -> None:
+            await engine.process_file(_drive_file("f1", "6602.jpg"))
+            await engine.process_file(_drive_file("f2", "6602a.jpg"))
+
+        asyncio.run(_run())
+
+        assert graphql_client.get_observation_by_sequential_id.call_count == 2
+        assert progress.files["f1"].status == FileStatus.FAILED
+        assert progress.files["f2"].status == FileStatus.COMPLETED
+
+    def test_cache_evicts_least_recently_used(self, engine: MigrationEngine) -> None:
+        fetched: List[int] = []
+
+        async def _fetch(sid: int) -> Optional[Observation]:
+            fetched.append(sid)
+            return None
+
+        async def _run() -> None:
+            for sid in (1, 2, 1, 3, 1, 2):
+                await engine._cached_lookup((sid, None), _fetch)
+
+        with patch(
+            "amplify_media_migrator.migration.engine._OBSERVATION_CACHE_SIZE", 2
+        ):
+            asyncio.run(_run())
+
+        assert fetched == [1, 2, 3, 2]
+
+
+class TestObservationPrefetch:
+    def test_next_file_lookup_overlaps_current_transfer(
+        self,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=1,
+            retry_attempts=1,
+            retry_delay_seconds=0,
+        )
+        drive_client.list_files.return_value = [
+            _drive_file("f1", "6601.jpg"),
+            _drive_file("f2", "6602.jpg"),
+        ]
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            6601: _observation("obs-1", 6601),
+            6602: _observation("obs-2", 6602),
+        }
+        drive_client.download_file.return_value = b"photo"
+        lookup = graphql_client.get_observation_by_sequential_id
+        looked_up_at_upload: List[List[int]] = []
+
+        def _upload(data: bytes, key: str, content_type: str, cb: object) -> str:
+            looked_up_at_upload.append([c.args[0] for c in lookup.call_args_list])
+            return f"https://bucket/{key}"
+
+        storage_client.upload_file.side_effect = _upload
+        graphql_client.create_media.return_value = _media()
+
+        asyncio.run(engine.migrate("folder-1"))
+
+        assert looked_up_at_upload[0] == [6601, 6602]
+        assert lookup.call_count == 2
+        assert progress.files["f2"].status == FileStatus.COMPLETED
+
+
+class TestMediaBatching:
+    def test_concurrent_files_share_one_batch_mutation(
+        self,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=2,
+            retry_attempts=2,
+            retry_delay_seconds=0,
+            media_batch_size=2,
+        )
+        progress.load("folder-1")
+        graphql_client.get_observations_by_sequential_ids.return_value = {
+            6601: _observation("obs-1", 6601),
+            6602: _observation("obs-2", 6602),
+        }
+        drive_client.download_file.return_value = b"photo"
+        storage_client.upload_file.side_effect = (
+            lambda data, key, content_type, cb: f"https://bucket/{key}"
+        )
+        graphql_client.batch_create_media.side_effect = lambda inputs: [
+            _media(f"media-{i.observation_id}", i.url, i.observation_id) for i in inputs
+        ]
+
+        async def _run() -> None:
+            await asyncio.gather(
+                engine.process_file(_drive_file("f1", "6601.jpg")),
+                engine.process_file(_drive_file("f2", "6602.jpg")),
+            )
+
+        asyncio.run(_run())
+
+        graphql_client.batch_create_media.assert_called_once()
+        (inputs,) = graphql_client.batch_create_media.call_args.args
+        assert sorted(i.observation_id for i in inputs) == ["obs-1", "obs-2"]
+        graphql_client.create_media.assert_not_called()
+        assert progress.files["f1"].media_ids == ["media-obs-1"]
+        assert progress.files["f2"].status == FileStatus.COMPLETED
+
+
+class TestBackoffDelay:
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0.5)
+    def test_doubles_per_attempt_with_jitter(
+        self,
+        _mock_random: MagicMock,
+        drive_client: MagicMock,
+        storage_client: MagicMock,
+        graphql_client: MagicMock,
+        progress: ProgressTracker,
+        mapper: FilenameMapper,
+    ) -> None:
+        engine = MigrationEngine(
+            drive_client=drive_client,
+            storage_client=storage_client,
+            graphql_client=graphql_client,
+            progress_tracker=progress,
+            mapper=mapper,
+            concurrency=1,
+            retry_attempts=3,
+            retry_delay_seconds=2,
+        )
+
+        assert [engine._backoff_delay(a) for a in range(3)] == [2.5, 4.5, 8.5]
+
+    @patch("amplify_media_migrator.migration.engine.random.random", return_value=0.0)
+    def test_prefers_server_retry_after(
+        self, _mock_random: MagicMock, engine: MigrationEngine
+    ) -> None:
+        assert engine._backoff_delay(0, retry_after=7.0) == 7.0
@@ -120,6 +120,13 @@ class TestGraphQLError:
         error = GraphQLError("query failed", errors=errors_list)
         assert error.errors == errors_list
 
+    def test_str_joins_error_messages(self):
+        error = GraphQLError(
+            "query failed", errors=[{"message": "error1"}, {"message": "error2"}]
+        )
+        assert error.message == "query failed"
+        assert str(error) == "query failed: error1, error2"
+
     def test_errors_defaults_to_empty_list(self):
         error = GraphQLError("query failed")
         assert error.errors == []
@@ -179,6 +186,21 @@ class TestExceptionHierarchy:
             assert isinstance(exc, MigratorError)
             assert isinstance(exc, Exception)
 
+    def test_fields_are_slots_not_instance_dict(self):
+        exceptions = [
+            MigratorError("test"),
+            ConfigurationError("test", config_key="k"),
+            AuthenticationError("test", provider="cognito"),
+            RateLimitError("test", retry_after=1.0),
+            DownloadError("test", file_id="f", filename="a.jpg"),
+            UploadError("test", bucket="b", key="k"),
+            GraphQLError("test", operation="op", errors=[{}]),
+            ObservationNotFoundError("test", sequential_id=1),
+            InvalidFilenameError("test", filename="a.jpg"),
+        ]
+        for exc in exceptions:
+            assert vars(exc) == {}
+
     def test_exceptions_can_be_caught_by_base_class(self):
         with pytest.raises(MigratorError):
             raise ConfigurationError("test")
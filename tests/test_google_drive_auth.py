@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from amplify_media_migrator.auth.google_drive import GoogleDriveAuthProvider
+from amplify_media_migrator.auth.google_drive import SCOPES, GoogleDriveAuthProvider
 
 
 @pytest.fixture
@@ -72,11 +72,13 @@ class TestLoadToken:
         token_path.write_text('{"token": "test"}')
 
         mock_creds = MagicMock()
-        mock_credentials_cls.from_authorized_user_file.return_value = mock_creds
+        mock_credentials_cls.from_authorized_user_info.return_value = mock_creds
 
         assert provider.load_token() is True
         assert provider._credentials is mock_creds
-        mock_credentials_cls.from_authorized_user_file.assert_called_once()
+        mock_credentials_cls.from_authorized_user_info.assert_called_once_with(
+            {"token": "test"}, SCOPES
+        )
 
     def test_corrupted_token_file(
         self,
@@ -87,7 +89,20 @@ class TestLoadToken:
         token_path.write_text("not valid json {{{")
 
         with patch("amplify_media_migrator.auth.google_drive.Credentials") as mock_cls:
-            mock_cls.from_authorized_user_file.side_effect = ValueError("Invalid token")
+            assert provider.load_token() is False
+            assert provider._credentials is None
+            mock_cls.from_authorized_user_info.assert_not_called()
+
+    def test_invalid_token_fields(
+        self,
+        provider: GoogleDriveAuthProvider,
+        token_path: Path,
+    ) -> None:
+        token_path.parent.mkdir(parents=True, exist_ok=True)
+        token_path.write_text('{"token": "test"}')
+
+        with patch("amplify_media_migrator.auth.google_drive.Credentials") as mock_cls:
+            mock_cls.from_authorized_user_info.side_effect = ValueError("Invalid token")
             assert provider.load_token() is False
             assert provider._credentials is None
 
@@ -110,6 +125,7 @@ class TestSaveToken:
 
         assert token_path.exists()
         assert token_path.read_text() == '{"token": "saved"}'
+        assert list(token_path.parent.iterdir()) == [token_path]
 
     def test_creates_parent_directories(
         self, provider: GoogleDriveAuthProvider, token_path: Path
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Iterator
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -327,6 +328,91 @@ class TestListFiles:
         with pytest.raises(DownloadError):
             list(connected_client.list_files("folder1"))
 
+    @staticmethod
+    def _fake_list_batch(
+        mock_service: MagicMock, outcomes: list, batches: list
+    ) -> None:
+        """Make batched list calls answer from `outcomes` in the order added."""
+        mock_service.files.return_value.list.side_effect = lambda **kw: kw["q"]
+
+        def new_batch(callback: object) -> MagicMock:
+            added: list = []
+            batch = MagicMock()
+            batch.add.side_effect = lambda req, request_id: added.append(
+                (request_id, req)
+            )
+
+            def execute() -> None:
+                for request_id, _ in added:
+                    response, exc = outcomes.pop(0)
+                    callback(request_id, response, exc)  # type: ignore[operator]
+
+            batch.execute.side_effect = execute
+            batches.append(added)
+            return batch
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+    def test_sibling_subfolders_share_one_batch(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        root_page = MagicMock()
+        root_page.execute.return_value = {
+            "files": [
+                {"id": "sub1", "name": "1-500", "mimeType": FOLDER_MIME_TYPE},
+                {"id": "sub2", "name": "501-1000", "mimeType": FOLDER_MIME_TYPE},
+            ],
+        }
+        batches: list = []
+        self._fake_list_batch(
+            mock_service,
+            [
+                ({"files": [{"id": "a", "name": "1.jpg", "size": "1"}]}, None),
+                ({"files": [{"id": "b", "name": "501.jpg", "size": "2"}]}, None),
+            ],
+            batches,
+        )
+        list_mock = mock_service.files.return_value.list
+        batched = list_mock.side_effect
+        list_mock.side_effect = lambda **kw: (
+            root_page if "'root' in" in kw["q"] else batched(**kw)
+        )
+
+        files = list(connected_client.list_files("root"))
+
+        assert [f.id for f in files] == ["a", "b"]
+        assert batches == [
+            [
+                ("0", "'sub1' in parents and trashed=false"),
+                ("1", "'sub2' in parents and trashed=false"),
+            ]
+        ]
+
+    def test_failed_batched_page_raises(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        root_page = MagicMock()
+        root_page.execute.return_value = {
+            "files": [
+                {"id": "sub1", "name": "a", "mimeType": FOLDER_MIME_TYPE},
+                {"id": "sub2", "name": "b", "mimeType": FOLDER_MIME_TYPE},
+            ],
+        }
+        batches: list = []
+        self._fake_list_batch(
+            mock_service,
+            [({"files": []}, None), (None, _make_http_error(403))],
+            batches,
+        )
+        list_mock = mock_service.files.return_value.list
+        batched = list_mock.side_effect
+        list_mock.side_effect = lambda **kw: (
+            root_page if "'root' in" in kw["q"] else batched(**kw)
+        )
+
+        with pytest.raises(AuthenticationError):
+            list(connected_client.list_files("root"))
+
 
 class TestDownloadFile:
     @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
@@ -377,6 +463,22 @@ class TestDownloadFile:
 
         assert seen == [100, 250]
 
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
+    def test_small_known_size_is_one_request(
+        self,
+        mock_download_cls: MagicMock,
+        connected_client: GoogleDriveClient,
+        mock_service: MagicMock,
+    ) -> None:
+        mock_service.files().get_media.return_value.execute.return_value = b"tiny"
+        seen: list = []
+
+        data = connected_client.download_file("file1", seen.append, size=4)
+
+        assert data == b"tiny"
+        assert seen == [4]
+        mock_download_cls.assert_not_called()
+
     def test_404_raises_download_error(
         self, connected_client: GoogleDriveClient, mock_service: MagicMock
     ) -> None:
@@ -398,31 +500,123 @@ class TestDownloadFile:
             client.download_file("file1")
 
 
+class TestRangeDownload:
+    SIZE = 20 * 1024 * 1024
+
+    @pytest.fixture
+    def range_service(self, client: GoogleDriveClient) -> Iterator[MagicMock]:
+        """A service shared by every thread, answering Range requests."""
+        content = bytes(range(256)) * (self.SIZE // 256)
+        service = MagicMock()
+
+        def get_media(fileId: str, supportsAllDrives: bool) -> MagicMock:
+            request = MagicMock()
+            request.headers = {}
+
+            def execute() -> bytes:
+                start, end = request.headers["range"][6:].split("-")
+                return content[int(start) : int(end) + 1]
+
+            request.execute.side_effect = execute
+            return request
+
+        service.files.return_value.get_media.side_effect = get_media
+        service.content = content
+        client._connected = True
+        with patch(
+            "amplify_media_migrator.sources.google_drive.build", return_value=service
+        ), patch("amplify_media_migrator.sources.google_drive.AuthorizedHttp"):
+            yield service
+
+    def test_assembles_parallel_ranges(
+        self, client: GoogleDriveClient, range_service: MagicMock
+    ) -> None:
+        seen: list = []
+
+        data = client.download_file("big", on_bytes=seen.append, size=self.SIZE)
+
+        assert data == range_service.content
+        assert isinstance(data, bytearray)
+        assert range_service.files.return_value.get_media.call_count == 5
+        assert seen[-1] == self.SIZE
+        assert seen == sorted(seen)
+
+    @pytest.mark.parametrize("max_workers, threads", [(1, 8), (2, 16), (50, 32)])
+    def test_range_pool_scales_with_workers_up_to_a_cap(
+        self, mock_credentials: MagicMock, max_workers: int, threads: int
+    ) -> None:
+        client = GoogleDriveClient(mock_credentials, max_workers=max_workers)
+
+        assert client._get_range_pool()._max_workers == threads
+
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
+    def test_falls_back_when_size_changed(
+        self,
+        mock_download_cls: MagicMock,
+        client: GoogleDriveClient,
+        range_service: MagicMock,
+    ) -> None:
+        mock_download_cls.return_value.next_chunk.return_value = (None, True)
+
+        client.download_file("big", size=self.SIZE + 1024)
+
+        mock_download_cls.assert_called_once()
+
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
+    def test_mid_size_files_download_sequentially(
+        self,
+        mock_download_cls: MagicMock,
+        client: GoogleDriveClient,
+        range_service: MagicMock,
+    ) -> None:
+        mock_download_cls.return_value.next_chunk.return_value = (None, True)
+
+        client.download_file("mid", size=10 * 1024 * 1024)
+
+        mock_download_cls.assert_called_once()
+
+
 class TestDownloadFileToPath:
-    @patch.object(GoogleDriveClient, "download_file")
+    @staticmethod
+    def _fake_downloader(mock_download_cls: MagicMock, chunks: list) -> None:
+        """Make MediaIoBaseDownload write `chunks` to its fd, one per call."""
+
+        def make(fd: object, request: object, chunksize: int) -> MagicMock:
+            remaining = list(chunks)
+            downloader = MagicMock()
+
+            def next_chunk() -> tuple:
+                fd.write(remaining.pop(0))  # type: ignore[attr-defined]
+                return None, not remaining
+
+            downloader.next_chunk.side_effect = next_chunk
+            return downloader
+
+        mock_download_cls.side_effect = make
+
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
     def test_writes_to_destination(
         self,
-        mock_download: MagicMock,
+        mock_download_cls: MagicMock,
         connected_client: GoogleDriveClient,
         tmp_path: Path,
     ) -> None:
-        content = b"photo data"
-        mock_download.return_value = content
+        self._fake_downloader(mock_download_cls, [b"photo ", b"data"])
         dest = tmp_path / "output" / "photo.jpg"
 
         connected_client.download_file_to_path("file1", dest)
 
         assert dest.exists()
-        assert dest.read_bytes() == content
+        assert dest.read_bytes() == b"photo data"
 
-    @patch.object(GoogleDriveClient, "download_file")
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
     def test_creates_parent_directories(
         self,
-        mock_download: MagicMock,
+        mock_download_cls: MagicMock,
         connected_client: GoogleDriveClient,
         tmp_path: Path,
     ) -> None:
-        mock_download.return_value = b"data"
+        self._fake_downloader(mock_download_cls, [b"data"])
         dest = tmp_path / "nested" / "dir" / "file.jpg"
 
         connected_client.download_file_to_path("file1", dest)
@@ -430,6 +624,36 @@ class TestDownloadFileToPath:
         assert dest.parent.exists()
         assert dest.exists()
 
+    @patch.object(GoogleDriveClient, "download_file")
+    @patch("amplify_media_migrator.sources.google_drive.MediaIoBaseDownload")
+    def test_does_not_buffer_whole_file(
+        self,
+        mock_download_cls: MagicMock,
+        mock_download: MagicMock,
+        connected_client: GoogleDriveClient,
+        tmp_path: Path,
+    ) -> None:
+        self._fake_downloader(mock_download_cls, [b"data"])
+
+        connected_client.download_file_to_path("file1", tmp_path / "f.jpg")
+
+        mock_download.assert_not_called()
+        assert mock_download_cls.call_args.kwargs["chunksize"] == 8 * 1024 * 1024
+
+    def test_http_error_removes_partial_file(
+        self,
+        connected_client: GoogleDriveClient,
+        mock_service: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        mock_service.files().get_media.side_effect = _make_http_error(404)
+        dest = tmp_path / "f.jpg"
+
+        with pytest.raises(DownloadError):
+            connected_client.download_file_to_path("file1", dest)
+
+        assert not dest.exists()
+
 
 class TestGetFileMetadata:
     def test_returns_drive_file(
@@ -492,6 +716,74 @@ class TestGetFileMetadata:
             connected_client.get_file_metadata("missing")
 
 
+class TestGetFilesMetadata:
+    @staticmethod
+    def _fake_batches(mock_service: MagicMock, outcomes: dict, batches: list) -> None:
+        """Make new_batch_http_request replay `outcomes` per added request."""
+
+        def new_batch(callback: object) -> MagicMock:
+            added: list = []
+            batch = MagicMock()
+            batch.add.side_effect = lambda req, request_id: added.append(request_id)
+
+            def execute() -> None:
+                for request_id in added:
+                    response, exc = outcomes[request_id]
+                    callback(request_id, response, exc)  # type: ignore[operator]
+
+            batch.execute.side_effect = execute
+            batches.append(added)
+            return batch
+
+        mock_service.new_batch_http_request.side_effect = new_batch
+
+    def test_returns_files_by_id(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        batches: list = []
+        self._fake_batches(
+            mock_service,
+            {
+                "f1": ({"id": "f1", "name": "1.jpg", "size": "10"}, None),
+                "f2": (None, _make_http_error(404)),
+            },
+            batches,
+        )
+
+        result = connected_client.get_files_metadata(["f1", "f2"])
+
+        assert list(result) == ["f1"]
+        assert result["f1"].name == "1.jpg"
+        assert result["f1"].size == 10
+        assert batches == [["f1", "f2"]]
+
+    def test_splits_into_batches_of_100(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        ids = [f"f{i}" for i in range(250)]
+        batches: list = []
+        self._fake_batches(
+            mock_service,
+            {i: ({"id": i, "name": f"{i}.jpg"}, None) for i in ids},
+            batches,
+        )
+
+        result = connected_client.get_files_metadata(ids)
+
+        assert len(result) == 250
+        assert [len(b) for b in batches] == [100, 100, 50]
+
+    def test_batch_http_error_is_mapped(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        batch = MagicMock()
+        batch.execute.side_effect = _make_http_error(401)
+        mock_service.new_batch_http_request.return_value = batch
+
+        with pytest.raises(AuthenticationError):
+            connected_client.get_files_metadata(["f1"])
+
+
 class TestGetFolderName:
     def test_returns_name(
         self, connected_client: GoogleDriveClient, mock_service: MagicMock
@@ -511,6 +803,34 @@ class TestGetFolderName:
             connected_client.get_folder_name("missing_folder")
 
 
+class TestProbeFolder:
+    def test_requests_single_item(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        mock_service.files().list().execute.return_value = {"files": [{"id": "f1"}]}
+
+        assert connected_client.probe_folder("folder1") is True
+
+        kwargs = mock_service.files().list.call_args.kwargs
+        assert kwargs["pageSize"] == 1
+        assert kwargs["fields"] == "files(id)"
+
+    def test_empty_folder_returns_false(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        mock_service.files().list().execute.return_value = {"files": []}
+
+        assert connected_client.probe_folder("folder1") is False
+
+    def test_404_raises_download_error(
+        self, connected_client: GoogleDriveClient, mock_service: MagicMock
+    ) -> None:
+        mock_service.files().list().execute.side_effect = _make_http_error(404)
+
+        with pytest.raises(DownloadError):
+            connected_client.probe_folder("missing_folder")
+
+
 class TestErrorHandling:
     def test_401_raises_authentication_error(
         self, connected_client: GoogleDriveClient
@@ -655,6 +975,26 @@ class TestOpenDownloadStream:
             fileId="file-123", supportsAllDrives=True
         )
 
+    def test_uses_configured_chunk_size(
+        self, mock_credentials: MagicMock, mock_service: MagicMock
+    ) -> None:
+        client = GoogleDriveClient(mock_credentials, download_chunk_size_mb=16)
+        client._connected = True
+        downloader = MagicMock()
+        downloader.next_chunk.return_value = (None, True)
+
+        with patch(
+            "amplify_media_migrator.sources.google_drive.build",
+            return_value=mock_service,
+        ), patch(
+            "amplify_media_migrator.sources.google_drive.MediaIoBaseDownload",
+            return_value=downloader,
+        ) as mock_download_cls:
+            stream = client.open_download_stream("file-123")
+            assert stream.read(100) == b""
+
+        assert mock_download_cls.call_args.kwargs["chunksize"] == 16 * 1024 * 1024
+
     def test_download_error_propagates_to_stream(
         self, client: GoogleDriveClient, mock_service: MagicMock
     ) -> None:
@@ -1,6 +1,9 @@
+import json
 import threading
-from typing import Any, List
-from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List, Optional
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import requests
@@ -8,6 +11,7 @@ import requests
 from amplify_media_migrator.targets.graphql_client import (
     GraphQLClient,
     Media,
+    MediaInput,
     Observation,
 )
 from amplify_media_migrator.utils.exceptions import (
@@ -39,11 +43,18 @@ def _make_response(
 ) -> MagicMock:
     resp = MagicMock(spec=requests.Response)
     resp.status_code = status_code
-    resp.json.return_value = json_data or {}
+    resp.content = text.encode() if text else json.dumps(json_data or {}).encode()
     resp.text = text
+    resp.headers = {}
     return resp
 
 
+def _payload(call: Any) -> Dict[str, Any]:
+    """Decode the JSON body a mocked Session.post was called with."""
+    decoded: Dict[str, Any] = json.loads(call.kwargs["data"])
+    return decoded
+
+
 class TestInit:
     def test_stores_endpoint(self) -> None:
         client = GraphQLClient(API_ENDPOINT)
@@ -77,6 +88,14 @@ class TestEnsureConnected:
     ) -> None:
         assert connected_client._ensure_connected() == ID_TOKEN
 
+    def test_reconnect_replaces_headers(self, connected_client: GraphQLClient) -> None:
+        first = connected_client._headers
+
+        connected_client.connect("refreshed-token")
+
+        assert first["Authorization"] == ID_TOKEN
+        assert connected_client._headers["Authorization"] == "refreshed-token"
+
 
 class TestHandleResponseError:
     def test_401_raises_auth_error(self) -> None:
@@ -96,8 +115,40 @@ class TestHandleResponseError:
         assert exc_info.value.operation == "TestOp"
 
     def test_429_raises_rate_limit_error(self) -> None:
-        with pytest.raises(RateLimitError, match="rate limit"):
+        with pytest.raises(RateLimitError, match="rate limit") as exc_info:
             GraphQLClient._handle_response_error(429, "Too Many Requests")
+        assert exc_info.value.retry_after is None
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("2.5", 2.5),
+            ("-3", 0.0),
+            ("86400", 300.0),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            ("soon", None),
+            ("nan", None),
+        ],
+    )
+    def test_429_carries_retry_after(
+        self, header: str, expected: Optional[float]
+    ) -> None:
+        with pytest.raises(RateLimitError) as exc_info:
+            GraphQLClient._handle_response_error(
+                429, "Too Many Requests", retry_after=header
+            )
+        assert exc_info.value.retry_after == expected
+
+    def test_429_retry_after_http_date_in_future(self) -> None:
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            GraphQLClient._handle_response_error(
+                429, "Too Many Requests", retry_after=format_datetime(when, usegmt=True)
+            )
+
+        assert exc_info.value.retry_after is not None
+        assert 28 <= exc_info.value.retry_after <= 30
 
 
 class TestExecute:
@@ -115,9 +166,24 @@ class TestExecute:
                 "Authorization": ID_TOKEN,
                 "Content-Type": "application/json",
             },
-            json={"query": "query { test }", "variables": {"x": 1}},
-            timeout=30,
+            data=ANY,
+            timeout=(5, 30),
         )
+        assert _payload(mock_post.call_args) == {
+            "query": "query { test }",
+            "variables": {"x": 1},
+        }
+
+    @patch("requests.Session.post")
+    def test_body_escapes_multiline_query(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(json_data={"data": {}})
+        query = 'query {\n  test(name: "é") }'
+
+        connected_client._execute(query)
+
+        assert _payload(mock_post.call_args) == {"query": query, "variables": {}}
 
     @patch("requests.Session.post")
     def test_returns_data(
@@ -157,6 +223,19 @@ class TestExecute:
         with pytest.raises(AuthenticationError):
             connected_client._execute("query { test }")
 
+    @patch("requests.Session.post")
+    def test_http_429_passes_retry_after_header(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        response = _make_response(status_code=429, text="Too Many Requests")
+        response.headers = {"Retry-After": "3"}
+        mock_post.return_value = response
+
+        with pytest.raises(RateLimitError) as exc_info:
+            connected_client._execute("query { test }")
+
+        assert exc_info.value.retry_after == 3.0
+
     @patch("requests.Session.post")
     def test_http_500_raises_graphql_error(
         self, mock_post: MagicMock, connected_client: GraphQLClient
@@ -168,6 +247,17 @@ class TestExecute:
         with pytest.raises(GraphQLError, match="500"):
             connected_client._execute("query { test }")
 
+    @patch("requests.Session.post")
+    def test_http_error_body_is_truncated(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(status_code=502, text="x" * 5000)
+
+        with pytest.raises(GraphQLError) as exc_info:
+            connected_client._execute("query { test }")
+
+        assert str(exc_info.value) == f"GraphQL HTTP error (502): {'x' * 512}"
+
     @patch("requests.Session.post")
     def test_network_error_raises_graphql_error(
         self, mock_post: MagicMock, connected_client: GraphQLClient
@@ -277,7 +367,7 @@ class TestGetObservationBySequentialId:
 
         assert result == Observation(id="obs-123", sequential_id=6001)
         assert mock_post.call_count == 2
-        second_call_variables = mock_post.call_args_list[1][1]["json"]["variables"]
+        second_call_variables = _payload(mock_post.call_args_list[1])["variables"]
         assert second_call_variables["nextToken"] == "token-page-2"
 
     @patch("requests.Session.post")
@@ -320,11 +410,7 @@ class TestGetObservationsBySequentialIds:
     ) -> None:
         mock_post.return_value = _make_response(
             json_data={
-                "data": {
-                    "listObservations": {
-                        "items": [{"id": "obs-1", "sequentialId": 6000}]
-                    }
-                }
+                "data": {"o0": {"items": [{"id": "obs-1", "sequentialId": 6000}]}}
             }
         )
 
@@ -337,24 +423,66 @@ class TestGetObservationsBySequentialIds:
     def test_skips_not_found(
         self, mock_post: MagicMock, connected_client: GraphQLClient
     ) -> None:
-        mock_post.side_effect = [
-            _make_response(
-                json_data={
-                    "data": {
-                        "listObservations": {
-                            "items": [{"id": "obs-1", "sequentialId": 6000}]
-                        }
-                    }
+        mock_post.return_value = _make_response(
+            json_data={
+                "data": {
+                    "o0": {"items": [{"id": "obs-1", "sequentialId": 6000}]},
+                    "o1": {"items": []},
                 }
-            ),
-            _make_response(json_data={"data": {"listObservations": {"items": []}}}),
-        ]
+            }
+        )
 
         result = connected_client.get_observations_by_sequential_ids([6000, 6001])
 
         assert len(result) == 1
         assert 6000 in result
         assert 6001 not in result
+        mock_post.assert_called_once()
+
+    @patch("requests.Session.post")
+    def test_chunks_large_id_lists(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        def _respond(*args: object, **kwargs: object) -> MagicMock:
+            variables = json.loads(kwargs["data"])["variables"]  # type: ignore[arg-type]
+            count = len(variables) // 2
+            return _make_response(
+                json_data={
+                    "data": {
+                        f"o{i}": {
+                            "items": [
+                                {
+                                    "id": f"obs-{variables[f'sequentialId{i}']}",
+                                    "sequentialId": variables[f"sequentialId{i}"],
+                                }
+                            ]
+                        }
+                        for i in range(count)
+                    }
+                }
+            )
+
+        mock_post.side_effect = _respond
+
+        result = connected_client.get_observations_by_sequential_ids(list(range(120)))
+
+        assert len(result) == 120
+        assert result[119].id == "obs-119"
+        assert mock_post.call_count == 3
+
+    @patch("requests.Session.post")
+    def test_alias_error_raises(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(
+            json_data={
+                "data": {"o0": None},
+                "errors": [{"message": "boom", "path": ["o0"]}],
+            }
+        )
+
+        with pytest.raises(GraphQLError):
+            connected_client.get_observations_by_sequential_ids([6000])
 
     @patch("requests.Session.post")
     def test_empty_list(
@@ -555,7 +683,7 @@ class TestCreateMedia:
             is_public=False,
         )
 
-        call_payload = mock_post.call_args[1]["json"]
+        call_payload = _payload(mock_post.call_args)
         assert call_payload["variables"] == {
             "input": {
                 "url": "https://example.com/photo.jpg",
@@ -566,6 +694,170 @@ class TestCreateMedia:
         }
 
 
+class TestBatchCreateMedia:
+    @staticmethod
+    def _item(i: int) -> dict:
+        return {
+            "id": f"media-{i}",
+            "url": f"https://bucket/{i}.jpg",
+            "observationId": f"obs-{i}",
+            "type": "PHOTO",
+            "isAvailableForPublicUse": False,
+        }
+
+    def test_empty_input_makes_no_request(
+        self, connected_client: GraphQLClient
+    ) -> None:
+        with patch("requests.Session.post") as mock_post:
+            assert connected_client.batch_create_media([]) == []
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.post")
+    def test_sends_one_aliased_mutation(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(
+            json_data={"data": {"m0": self._item(0), "m1": self._item(1)}}
+        )
+        inputs = [
+            MediaInput(f"https://bucket/{i}.jpg", f"obs-{i}", MediaType.IMAGE)
+            for i in range(2)
+        ]
+
+        results = connected_client.batch_create_media(inputs)
+
+        assert [r.id for r in results if isinstance(r, Media)] == [
+            "media-0",
+            "media-1",
+        ]
+        mock_post.assert_called_once()
+        payload = _payload(mock_post.call_args)
+        assert "m0: createMedia(input: $input0)" in payload["query"]
+        assert "m1: createMedia(input: $input1)" in payload["query"]
+        assert payload["variables"]["input1"] == {
+            "url": "https://bucket/1.jpg",
+            "observationId": "obs-1",
+            "type": "PHOTO",
+            "isAvailableForPublicUse": False,
+        }
+
+    @patch("requests.Session.post")
+    def test_failed_alias_returns_error_in_place(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(
+            json_data={
+                "data": {"m0": None, "m1": self._item(1)},
+                "errors": [{"message": "Conditional check failed", "path": ["m0"]}],
+            }
+        )
+        inputs = [
+            MediaInput(f"https://bucket/{i}.jpg", f"obs-{i}", MediaType.IMAGE)
+            for i in range(2)
+        ]
+
+        first, second = connected_client.batch_create_media(inputs)
+
+        assert isinstance(first, GraphQLError)
+        assert "Conditional check failed" in str(first)
+        assert isinstance(second, Media)
+
+    @patch("requests.Session.post")
+    def test_http_error_raises(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(status_code=429, text="slow down")
+
+        with pytest.raises(RateLimitError):
+            connected_client.batch_create_media(
+                [MediaInput("https://bucket/0.jpg", "obs-0", MediaType.IMAGE)]
+            )
+
+
+class TestBatchGetObservationsBySequentialIds:
+    @staticmethod
+    def _page(items: list, next_token: Optional[str] = None) -> dict:
+        return {"items": items, "nextToken": next_token}
+
+    @patch("requests.Session.post")
+    def test_sends_one_aliased_query(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(
+            json_data={
+                "data": {
+                    "o0": self._page([{"id": "obs-1", "sequentialId": 6601}]),
+                    "o1": self._page([]),
+                }
+            }
+        )
+
+        found, missing = connected_client.batch_get_observations_by_sequential_ids(
+            [6601, 6602]
+        )
+
+        assert found == Observation(id="obs-1", sequential_id=6601)
+        assert missing is None
+        mock_post.assert_called_once()
+        payload = _payload(mock_post.call_args)
+        assert "o1: listObservations(" in payload["query"]
+        assert payload["variables"]["sequentialId1"] == 6602
+        assert payload["variables"]["nextToken1"] is None
+
+    @patch("requests.Session.post")
+    def test_requeries_only_aliases_with_next_token(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.side_effect = [
+            _make_response(
+                json_data={
+                    "data": {
+                        "o0": self._page([{"id": "obs-1", "sequentialId": 6601}]),
+                        "o1": self._page([], next_token="tok"),
+                    }
+                }
+            ),
+            _make_response(
+                json_data={
+                    "data": {"o0": self._page([{"id": "obs-2", "sequentialId": 6602}])}
+                }
+            ),
+        ]
+
+        results = connected_client.batch_get_observations_by_sequential_ids(
+            [6601, 6602]
+        )
+
+        assert [r.id for r in results if isinstance(r, Observation)] == [
+            "obs-1",
+            "obs-2",
+        ]
+        second = _payload(mock_post.call_args_list[1])["variables"]
+        assert second == {"sequentialId0": 6602, "nextToken0": "tok"}
+
+    @patch("requests.Session.post")
+    def test_failed_alias_returns_error_in_place(
+        self, mock_post: MagicMock, connected_client: GraphQLClient
+    ) -> None:
+        mock_post.return_value = _make_response(
+            json_data={
+                "data": {
+                    "o0": None,
+                    "o1": self._page([{"id": "obs-2", "sequentialId": 6602}]),
+                },
+                "errors": [{"message": "Throttled", "path": ["o0"]}],
+            }
+        )
+
+        first, second = connected_client.batch_get_observations_by_sequential_ids(
+            [6601, 6602]
+        )
+
+        assert isinstance(first, GraphQLError)
+        assert "Throttled" in str(first)
+        assert isinstance(second, Observation)
+
+
 class TestGetMediaByUrl:
     @patch("requests.Session.post")
     def test_returns_media(
@@ -764,6 +1056,71 @@ def test_get_session_after_close_creates_new_session(client: GraphQLClient) -> N
     first.close.assert_called_once_with()
 
 
+def test_context_manager_closes_sessions(client: GraphQLClient) -> None:
+    with patch("requests.Session", side_effect=lambda: MagicMock()):
+        with client as entered:
+            session = entered._get_session()
+
+    assert entered is client
+    session.close.assert_called_once_with()
+
+
+def test_shared_pool_mounts_one_adapter_across_threads() -> None:
+    client = GraphQLClient(API_ENDPOINT, max_pool_connections=8)
+    adapters: List[Any] = []
+
+    def grab() -> None:
+        adapters.append(client._get_session().get_adapter(API_ENDPOINT))
+
+    threads = [threading.Thread(target=grab) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert adapters[0] is adapters[1]
+    assert adapters[0]._pool_maxsize == 8
+    client.close()
+
+
+def test_reset_keeps_shared_pool_for_other_sessions() -> None:
+    client = GraphQLClient(API_ENDPOINT, max_pool_connections=8)
+    other = threading.Thread(target=client._get_session)
+    other.start()
+    other.join()
+    client._get_session()
+    shared = client._shared_adapter
+    assert shared is not None
+
+    with patch.object(shared, "close") as close_shared:
+        client._reset_session()
+
+        close_shared.assert_not_called()
+        assert len(client._all_sessions) == 1
+        assert client._all_sessions[0].get_adapter(API_ENDPOINT) is shared
+
+        client.close()
+
+    close_shared.assert_called_once_with()
+
+
+def test_default_sessions_do_not_share_adapter() -> None:
+    client = GraphQLClient(API_ENDPOINT)
+    adapters: List[Any] = []
+
+    def grab() -> None:
+        adapters.append(client._get_session().get_adapter(API_ENDPOINT))
+
+    threads = [threading.Thread(target=grab) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert adapters[0] is not adapters[1]
+    client.close()
+
+
 class TestDiscriminatorLookup:
     def test_single_lookup_populates_discriminator_value(self):
         from amplify_media_migrator.targets.graphql_client import GraphQLClient
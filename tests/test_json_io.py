@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from amplify_media_migrator.utils import json_io
+
+pytestmark = pytest.mark.unit
+
+
+class TestDumpsPretty:
+    def test_matches_stdlib_indent_layout(self) -> None:
+        data = {"a": 1, "b": [1, 2], "c": {"d": None}}
+
+        out = json_io.dumps_pretty(data)
+
+        assert out == (json.dumps(data, indent=2) + "\n").encode()
+
+    def test_non_ascii_is_utf8(self) -> None:
+        out = json_io.dumps_pretty({"name": "תמונה.jpg"})
+
+        assert json.loads(out.decode("utf-8")) == {"name": "תמונה.jpg"}
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(json_io, "_HAS_ORJSON", False)
+
+        assert json_io.dumps_pretty({"a": 1}) == b'{\n  "a": 1\n}\n'
+
+
+class TestDumpsLine:
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_one_compact_line(
+        self, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+    ) -> None:
+        if has_orjson and not json_io._HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_io, "_HAS_ORJSON", has_orjson)
+
+        assert json_io.dumps_line({"a": [1, 2], "b": "é"}) == (
+            '{"a":[1,2],"b":"é"}\n'.encode("utf-8")
+        )
+
+
+class TestIterDumpsPretty:
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_matches_dumps_pretty(
+        self, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+    ) -> None:
+        if has_orjson and not json_io._HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_io, "_HAS_ORJSON", has_orjson)
+        files = {"a": {"ids": [1, 2], "note": "x\ny", "s3_url": None}, "b": {}}
+        data = {"id": "f", "files": files, "empty": {}, "summary": {"done": 1}}
+        members = [
+            ("id", "f"),
+            ("files", iter(files.items())),
+            ("empty", iter({}.items())),
+            ("summary", {"done": 1}),
+        ]
+
+        out = b"".join(json_io.iter_dumps_pretty(members))
+
+        assert out == json_io.dumps_pretty(data)
+
+
+class TestLoads:
+    def test_accepts_bytes_and_str(self) -> None:
+        assert json_io.loads(b'{"a": 1}') == {"a": 1}
+        assert json_io.loads('{"a": 1}') == {"a": 1}
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_decode_error_is_json_decode_error(
+        self, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+    ) -> None:
+        if has_orjson and not json_io._HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_io, "_HAS_ORJSON", has_orjson)
+
+        with pytest.raises(json.JSONDecodeError):
+            json_io.loads(b"{not json")
+
+
+class TestWriteAtomic:
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+        target.write_bytes(b"old")
+
+        json_io.write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestWriteAtomicChunks:
+    def test_joins_chunks(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+
+        json_io.write_atomic_chunks(target, iter([b"a", b"b", b"c"]))
+
+        assert target.read_bytes() == b"abc"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failed_write_leaves_target_and_no_temp_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+        target.write_bytes(b"old")
+
+        def chunks() -> Iterator[bytes]:
+            yield b"partial"
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            json_io.write_atomic_chunks(target, chunks())
+
+        assert target.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [target]
@@ -1,8 +1,10 @@
 import logging
+import logging.handlers
 from pathlib import Path
 
 import pytest
 
+from amplify_media_migrator.utils import logger as logger_module
 from amplify_media_migrator.utils.logger import (
     setup_logging,
     get_logger,
@@ -16,6 +18,7 @@ def _clean_logger():
     logger = logging.getLogger("amplify_media_migrator")
     logger.handlers.clear()
     yield
+    logger_module._stop_file_listener()
     logger.handlers.clear()
 
 
@@ -51,7 +54,8 @@ class TestSetupLogging:
 
         assert len(logger.handlers) == 2
         assert isinstance(logger.handlers[0], logging.StreamHandler)
-        assert isinstance(logger.handlers[1], logging.FileHandler)
+        assert isinstance(logger.handlers[1], logging.handlers.QueueHandler)
+        assert isinstance(logger_module._file_listener.handlers[0], logging.FileHandler)
 
     def test_creates_log_directory(self, tmp_path: Path):
         log_file = tmp_path / "nested" / "dir" / "test.log"
@@ -65,8 +69,7 @@ class TestSetupLogging:
 
         logger.info("Test message")
 
-        for handler in logger.handlers:
-            handler.flush()
+        logger_module._stop_file_listener()
 
         content = log_file.read_text()
         assert "Test message" in content
@@ -80,6 +83,64 @@ class TestSetupLogging:
         assert formatter is not None
         assert formatter._fmt == custom_format
 
+    def test_handlers_share_formatter(self, tmp_path: Path):
+        logger = setup_logging(log_file=tmp_path / "test.log")
+        file_handler = logger_module._file_listener.handlers[0]
+        assert logger.handlers[0].formatter is file_handler.formatter
+
+    def test_setup_again_stops_previous_listener(self, tmp_path: Path):
+        setup_logging(log_file=tmp_path / "first.log")
+        first = logger_module._file_listener
+
+        setup_logging()
+
+        assert logger_module._file_listener is None
+        assert first._thread is None
+
+    def test_leaves_process_wide_record_flags_alone(self):
+        flags = ("logThreads", "logProcesses", "logMultiprocessing")
+        before = [getattr(logging, flag) for flag in flags]
+
+        setup_logging()
+
+        assert [getattr(logging, flag) for flag in flags] == before
+
+
+class TestSecondCachingFormatter:
+    def _record(self, created: float) -> logging.LogRecord:
+        record = logging.LogRecord("n", logging.INFO, "p", 1, "msg", None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_matches_stdlib_formatter(self):
+        formatter = logger_module._SecondCachingFormatter(DEFAULT_LOG_FORMAT)
+        reference = logging.Formatter(DEFAULT_LOG_FORMAT)
+        for created in (1_700_000_000.25, 1_700_000_000.75, 1_700_000_001.5):
+            record = self._record(created)
+            assert formatter.format(record) == reference.format(record)
+
+    def test_strftime_runs_once_per_second(self, monkeypatch):
+        calls = []
+        real_strftime = logger_module.time.strftime
+
+        def counting_strftime(fmt, t):
+            calls.append(fmt)
+            return real_strftime(fmt, t)
+
+        monkeypatch.setattr(logger_module.time, "strftime", counting_strftime)
+        formatter = logger_module._SecondCachingFormatter(DEFAULT_LOG_FORMAT)
+        for created in (1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0):
+            formatter.format(self._record(created))
+
+        assert len(calls) == 2
+
+    def test_explicit_datefmt_bypasses_cache(self):
+        formatter = logger_module._SecondCachingFormatter("%(asctime)s", datefmt="%Y")
+        reference = logging.Formatter("%(asctime)s", datefmt="%Y")
+        record = self._record(1_700_000_000.0)
+        assert formatter.format(record) == reference.format(record)
+
 
 class TestGetLogger:
     def test_returns_child_logger(self):
@@ -1,9 +1,11 @@
 import pytest
 
 from amplify_media_migrator.migration.mapper import (
+    _FILENAME_RE,
     FilenameMapper,
     FilenamePattern,
     ParsedFilename,
+    _parse_plain,
 )
 
 
@@ -305,6 +307,11 @@ class TestIsValidExtension:
         assert mapper.is_valid_extension("pdf") is False
         assert mapper.is_valid_extension("txt") is False
 
+    def test_repeated_leading_dots(self, mapper: FilenameMapper) -> None:
+        assert mapper.is_valid_extension("..JPG") is True
+        assert mapper.is_valid_extension("..pdf") is False
+        assert mapper.is_valid_extension("jpg.") is False
+
 
 class TestOriginalFilename:
     def test_single_preserves_original(self, mapper: FilenameMapper) -> None:
@@ -558,3 +565,86 @@ class TestListPattern:
         result = mapper.parse("1200-1205.jpg")
         assert result.pattern == FilenamePattern.RANGE
         assert result.sequential_ids == [1200, 1201, 1202, 1203, 1204, 1205]
+
+
+class TestPlainFastPath:
+    @pytest.mark.parametrize(
+        "filename", ["6602.jpg", "6602ab.JPG", "S12.mp4", "e5414c.jfif", "0.png"]
+    )
+    def test_matches_regex_parse(self, filename: str) -> None:
+        plain = _parse_plain(filename)
+        match = _FILENAME_RE.match(filename)
+        assert plain is not None and match is not None
+        assert plain.prefix == match["prefix"]
+        assert plain.extension == match["ext"].lower()
+        seq = match["single"] or match["multiple"]
+        assert plain.sequential_ids == [int(seq)]
+
+    @pytest.mark.parametrize(
+        "filename",
+        ["1-3.jpg", "12 a.jpg", "12(1).jpg", "ab12.jpg", "12a3.jpg", "12.pdf", ".jpg"],
+    )
+    def test_defers_other_shapes(self, filename: str) -> None:
+        assert _parse_plain(filename) is None
+
+
+class TestPatternPrecedence:
+    """Pins which branch wins when a filename fits more than one shape."""
+
+    @pytest.mark.parametrize(
+        "filename, pattern, ids",
+        [
+            # Copy suffixes are stripped before the branch is chosen.
+            ("5414 (1).jpg", FilenamePattern.SINGLE, [5414]),
+            ("5414(12).jpg", FilenamePattern.SINGLE, [5414]),
+            ("5414 (1) (2).jpg", FilenamePattern.SINGLE, [5414]),
+            ("5414 - Copy.jpg", FilenamePattern.SINGLE, [5414]),
+            ("5414a - Copy (1).jpg", FilenamePattern.MULTIPLE, [5414]),
+            ("5414 a (1).jpg", FilenamePattern.MULTIPLE, [5414]),
+            ("5414-5416 (1).jpg", FilenamePattern.RANGE, [5414, 5415, 5416]),
+            ("5414,5415 (1).jpg", FilenamePattern.LIST, [5414, 5415]),
+            ("5414 (a).jpg", FilenamePattern.INVALID, []),
+            # Hyphens are ranges; commas and plus signs are lists.
+            ("5414-5416.jpg", FilenamePattern.RANGE, [5414, 5415, 5416]),
+            ("5414-5414.jpg", FilenamePattern.RANGE, [5414]),
+            ("5414,5416.jpg", FilenamePattern.LIST, [5414, 5416]),
+            ("5414+5416.jpg", FilenamePattern.LIST, [5414, 5416]),
+            ("5416-5414.jpg", FilenamePattern.INVALID, []),
+            # A hyphen followed by anything but a plain range end is a label.
+            ("5414-K.jpg", FilenamePattern.MULTIPLE, [5414]),
+            ("5414-5416a.jpg", FilenamePattern.MULTIPLE, [5414]),
+            ("5414-5416,5420.jpg", FilenamePattern.MULTIPLE, [5414]),
+            ("5414a-5416a.jpg", FilenamePattern.INVALID, []),
+            ("5414a,5416-5418.jpg", FilenamePattern.INVALID, []),
+            # Any Unicode decimal digits count, as int() reads them.
+            ("٥٤١٤.jpg", FilenamePattern.SINGLE, [5414]),
+            ("５４１４.jpg", FilenamePattern.SINGLE, [5414]),
+            ("5414١.jpg", FilenamePattern.SINGLE, [54141]),
+            ("٥٤-٥٦.jpg", FilenamePattern.RANGE, [54, 55, 56]),
+        ],
+    )
+    def test_branch(
+        self,
+        mapper: FilenameMapper,
+        filename: str,
+        pattern: FilenamePattern,
+        ids: list,
+    ) -> None:
+        result = mapper.parse(filename)
+        assert result.pattern == pattern
+        assert result.sequential_ids == ids
+
+    @pytest.mark.parametrize(
+        "filename, ids",
+        [
+            ("S5414.jpg", [5414]),
+            ("S5414-5416.jpg", [5414, 5415, 5416]),
+            ("S٥٤.jpg", [54]),
+        ],
+    )
+    def test_prefix_applies_to_every_branch(
+        self, mapper: FilenameMapper, filename: str, ids: list
+    ) -> None:
+        result = mapper.parse(filename)
+        assert result.prefix == "S"
+        assert result.sequential_ids == ids
@@ -1,9 +1,10 @@
 import pytest
 
-from amplify_media_migrator.targets.graphql_client import MediaType
 from amplify_media_migrator.utils.media import (
+    MediaType,
     get_media_type,
     get_content_type,
+    lookup_media,
     IMAGE_EXTENSIONS,
     VIDEO_EXTENSIONS,
     CONTENT_TYPES,
@@ -79,3 +80,16 @@ class TestGetContentType:
     def test_empty_extension_raises_value_error(self):
         with pytest.raises(ValueError, match="Unknown extension"):
             get_content_type("")
+
+
+class TestLookupMedia:
+    def test_agrees_with_single_lookups(self):
+        for ext in CONTENT_TYPES:
+            assert lookup_media(ext) == (get_content_type(ext), get_media_type(ext))
+
+    def test_normalizes_case_and_dot(self):
+        assert lookup_media(".MOV") == ("video/quicktime", MediaType.VIDEO)
+
+    def test_unknown_extension_raises_value_error(self):
+        with pytest.raises(ValueError, match="Unknown extension"):
+            lookup_media("pdf")
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyPackageImports:
+    def test_import_does_not_load_clients(self) -> None:
+        loaded = _run(
+            "import sys, amplify_media_migrator, amplify_media_migrator.migration, "
+            "amplify_media_migrator.targets, amplify_media_migrator.sources; "
+            "print(sorted(m for m in ('amplify_media_migrator.migration.engine', "
+            "'amplify_media_migrator.targets.amplify_storage', "
+            "'amplify_media_migrator.sources.google_drive', 'boto3', "
+            "'googleapiclient') if m in sys.modules))"
+        )
+        assert loaded == "[]"
+
+    def test_attribute_resolves_on_access(self) -> None:
+        name = _run(
+            "from amplify_media_migrator import FileStatus; "
+            "print(FileStatus.__module__)"
+        )
+        assert name == "amplify_media_migrator.migration.progress"
+
+    def test_unknown_attribute_raises(self) -> None:
+        import amplify_media_migrator
+
+        with pytest.raises(AttributeError):
+            getattr(amplify_media_migrator, "NotAThing")
@@ -1,6 +1,9 @@
 import json
 import shutil
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +13,7 @@ from amplify_media_migrator.migration.progress import (
     ProgressSummary,
     ProgressTracker,
 )
+from amplify_media_migrator.utils.json_io import dumps_pretty
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -165,6 +169,55 @@ class TestPendingAndFailedIds:
         assert ids == ["f1"]
 
 
+class TestStatusIndex:
+    def test_status_transition_moves_file(self, tracker: ProgressTracker) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.update_file("f1", "1.jpg", FileStatus.DOWNLOADED)
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+
+        assert tracker.get_pending_file_ids() == []
+        assert tracker.get_interrupted_file_ids() == []
+        completed = tracker.get_files_by_status(FileStatus.COMPLETED)
+        assert completed == [tracker.get_file("f1")]
+        assert tracker.get_summary() == ProgressSummary(completed=1)
+
+    def test_same_status_update_keeps_single_entry(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.FAILED, error="a")
+        tracker.update_file("f1", "1.jpg", FileStatus.FAILED, error="b")
+
+        failed = tracker.get_files_by_status(FileStatus.FAILED)
+        assert len(failed) == 1
+        assert failed[0].error == "b"
+
+    def test_index_rebuilt_on_load(self, tracker: ProgressTracker, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.NEEDS_REVIEW)
+        tracker.update_file("f2", "2.jpg", FileStatus.ORPHAN)
+        tracker.save()
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        reloaded.load("folder1")
+        assert reloaded.get_needs_review_file_ids() == ["f1"]
+        assert reloaded.get_orphan_file_ids() == ["f2"]
+
+        reloaded.load("other_folder")
+        assert reloaded.get_needs_review_file_ids() == []
+        assert reloaded.get_summary() == ProgressSummary()
+
+
+class TestRevision:
+    def test_counts_updates(self, tracker: ProgressTracker) -> None:
+        tracker.load("folder1")
+        assert tracker.revision == 0
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+        assert tracker.revision == 2
+
+
 class TestPartialFileIds:
     def test_partial_ids(self, tracker: ProgressTracker) -> None:
         tracker.load("folder1")
@@ -321,6 +374,48 @@ class TestFullFieldSerialization:
         assert f1 is not None
         assert f1.error == "Unsupported extension"
 
+    def test_updated_at_saved_as_epoch_seconds(self, tracker: ProgressTracker) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "6602.jpg", FileStatus.PENDING)
+        tracker.save()
+
+        path = tracker.progress_path
+        assert path is not None
+        stored = json.loads(path.read_text())["files"]["f1"]["updated_at"]
+        assert isinstance(stored, float)
+        f1 = tracker.get_file("f1")
+        assert f1 is not None
+        assert f1.updated_at == datetime.fromtimestamp(stored, tz=timezone.utc)
+
+    def test_iso_updated_at_from_old_progress_files(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        path = tracker.progress_path
+        assert path is not None
+        path.write_text(
+            json.dumps(
+                {
+                    "folder_id": "folder1",
+                    "started_at": "2026-01-01T00:00:00+00:00",
+                    "updated_at": "2026-01-01T00:00:00+00:00",
+                    "files": {
+                        "f1": {
+                            "filename": "6602.jpg",
+                            "status": "pending",
+                            "updated_at": "2026-01-02T03:04:05+00:00",
+                        }
+                    },
+                }
+            )
+        )
+
+        tracker2 = ProgressTracker(progress_dir=tracker._progress_dir)
+        tracker2.load("folder1")
+        f1 = tracker2.get_file("f1")
+        assert f1 is not None
+        assert f1.updated_at == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
 
 class TestBuildSummaryDict:
     def test_summary_dict_keys(self, tracker: ProgressTracker) -> None:
@@ -391,6 +486,21 @@ class TestExportToJson:
         assert "f3" in data
         assert "f2" not in data
 
+    def test_export_writes_iso_timestamps(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.ORPHAN)
+        output = tmp_path / "export.json"
+
+        tracker.export_to_json(FileStatus.ORPHAN, output)
+
+        exported = json.loads(output.read_text())["f1"]["updated_at"]
+        f1 = tracker.get_file("f1")
+        assert f1 is not None and f1.updated_at is not None
+        assert exported == f1.updated_at.isoformat()
+        assert datetime.fromisoformat(exported).tzinfo is not None
+
     def test_export_empty(self, tracker: ProgressTracker, tmp_path) -> None:  # type: ignore[no-untyped-def]
         tracker.load("folder1")
         output = tmp_path / "export.json"
@@ -477,3 +587,193 @@ def test_checksum_round_trips_through_save_load(tmp_path: Path) -> None:
     restored = reloaded.get_file("f1")
     assert restored is not None
     assert restored.checksum == "abc123"
+
+
+def _snapshot(tracker: ProgressTracker) -> Path:
+    path = tracker.progress_path
+    assert path is not None
+    return path
+
+
+def _log(tracker: ProgressTracker) -> Path:
+    path = tracker.log_path
+    assert path is not None
+    return path
+
+
+class TestAppendLog:
+    def test_streamed_snapshot_matches_pretty_dump(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED, sequential_ids=[1])
+        tracker.update_file("f2", "2.jpg", FileStatus.FAILED, error="boom")
+        tracker.save(compact=True)
+
+        raw = _snapshot(tracker).read_bytes()
+
+        assert raw == dumps_pretty(json.loads(raw))
+        assert set(json.loads(raw)["files"]) == {"f1", "f2"}
+
+    def test_failed_save_keeps_changes_for_next_save(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+
+        with patch.object(tracker, "_append_log", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                tracker.save()
+        tracker.save()
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        reloaded.load("folder1")
+        f1 = reloaded.get_file("f1")
+        assert f1 is not None
+        assert f1.status == FileStatus.COMPLETED
+
+    def test_concurrent_saves_leave_a_loadable_snapshot(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        for i in range(200):
+            tracker.update_file(f"f{i}", f"{i}.jpg", FileStatus.PENDING)
+
+        threads = [
+            threading.Thread(target=tracker.save, kwargs={"compact": True})
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        assert reloaded.load("folder1")
+        assert len(reloaded.files) == 200
+        assert [p.name for p in tmp_path.iterdir()] == [_snapshot(tracker).name]
+
+    def test_incremental_save_appends_only_changed_files(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.update_file("f2", "2.jpg", FileStatus.PENDING)
+        tracker.save()
+        snapshot = _snapshot(tracker).read_bytes()
+
+        tracker.update_file("f1", "1.jpg", FileStatus.FAILED, error="x")
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+        tracker.save()
+
+        assert _snapshot(tracker).read_bytes() == snapshot
+        lines = _log(tracker).read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["status"] == "completed"
+
+    def test_load_replays_log_over_snapshot(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED, media_ids=["m1"])
+        tracker.update_file("f2", "2.jpg", FileStatus.ORPHAN)
+        tracker.save()
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        reloaded.load("folder1")
+        f1 = reloaded.get_file("f1")
+        assert f1 is not None
+        assert f1.status == FileStatus.COMPLETED
+        assert f1.media_ids == ["m1"]
+        assert reloaded.get_orphan_file_ids() == ["f2"]
+
+    def test_torn_last_line_is_skipped(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+        tracker.save()
+        with _log(tracker).open("ab") as f:
+            f.write(b'{"id": "f1", "status": "fai')
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        reloaded.load("folder1")
+        f1 = reloaded.get_file("f1")
+        assert f1 is not None
+        assert f1.status == FileStatus.COMPLETED
+
+    def test_stale_log_from_crash_before_unlink_is_not_replayed(
+        self, tracker: ProgressTracker, tmp_path: Path
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.UPLOADED)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+
+        # Crash after the new snapshot replaced the old one, before the log
+        # it supersedes was removed.
+        with patch.object(Path, "unlink", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                tracker.save(compact=True)
+        assert _log(tracker).exists()
+
+        reloaded = ProgressTracker(progress_dir=tmp_path)
+        reloaded.load("folder1")
+        f1 = reloaded.get_file("f1")
+        assert f1 is not None
+        assert f1.status == FileStatus.COMPLETED
+        assert reloaded.get_interrupted_file_ids() == []
+
+        reloaded.save()
+        assert not _log(tracker).exists()
+
+    def test_compact_rewrites_snapshot_and_drops_log(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.COMPLETED)
+        tracker.save()
+
+        tracker.save(compact=True)
+
+        assert not _log(tracker).exists()
+        data = json.loads(_snapshot(tracker).read_text())
+        assert data["files"]["f1"]["status"] == "completed"
+        assert data["summary"]["completed"] == 1
+
+    def test_compacts_once_log_is_large(
+        self, tracker: ProgressTracker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ProgressTracker, "COMPACT_AFTER", 2)
+        tracker.load("folder1")
+        tracker.update_file("f1", "1.jpg", FileStatus.PENDING)
+        tracker.save()
+        tracker.update_file("f1", "1.jpg", FileStatus.FAILED)
+        tracker.save()
+        assert _log(tracker).exists()
+
+        tracker.update_file("f2", "2.jpg", FileStatus.PENDING)
+        tracker.save()
+
+        assert not _log(tracker).exists()
+
+    def test_total_files_change_rewrites_snapshot(
+        self, tracker: ProgressTracker
+    ) -> None:
+        tracker.load("folder1")
+        tracker.save()
+        tracker.set_total_files(5)
+        tracker.save()
+
+        data = json.loads(_snapshot(tracker).read_text())
+        assert data["total_files"] == 5
@@ -11,14 +11,13 @@ class TestRateLimiterInit:
         limiter = RateLimiter()
         assert limiter._requests_per_second == 200.0
         assert limiter._burst_size == 200
-        assert limiter._tokens == 200.0
-        assert limiter._last_update is None
+        assert limiter._next_available == 0.0
 
     def test_custom_values(self) -> None:
         limiter = RateLimiter(requests_per_second=5.0, burst_size=20)
         assert limiter._requests_per_second == 5.0
         assert limiter._burst_size == 20
-        assert limiter._tokens == 20.0
+        assert limiter._burst_tolerance == pytest.approx(19 * 0.2)
 
 
 class TestRateLimiterAcquire:
@@ -35,7 +34,6 @@ class TestRateLimiterAcquire:
         start = time.monotonic()
         limiter.acquire()
         assert time.monotonic() - start < 0.05
-        assert limiter._tokens == 9.0
 
     def test_burst_acquires_immediate(self) -> None:
         limiter = RateLimiter(requests_per_second=10.0, burst_size=5)
@@ -43,7 +41,9 @@ class TestRateLimiterAcquire:
         for _ in range(5):
             limiter.acquire()
         assert time.monotonic() - start < 0.1
-        assert limiter._tokens < 1.0
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
 
     def test_waits_when_tokens_exhausted(self) -> None:
         limiter = RateLimiter(requests_per_second=10.0, burst_size=1)
@@ -65,8 +65,12 @@ class TestRateLimiterAcquire:
         limiter = RateLimiter(requests_per_second=10.0, burst_size=3)
         limiter.acquire()
         time.sleep(0.5)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.05
         limiter.acquire()
-        assert limiter._tokens <= 3.0
+        assert time.monotonic() - start >= 0.09
 
     def test_concurrent_acquires_respect_rate(self) -> None:
         limiter = RateLimiter(requests_per_second=10.0, burst_size=2)
@@ -90,7 +94,7 @@ class TestRateLimiterContextManager:
         limiter = RateLimiter(requests_per_second=10.0, burst_size=10)
         with limiter:
             pass
-        assert limiter._tokens == 9.0
+        assert limiter._next_available > 0.0
 
     def test_context_manager_returns_limiter(self) -> None:
         limiter = RateLimiter()
@@ -114,5 +118,8 @@ class TestRateLimiterEdgeCases:
         limiter2 = RateLimiter(requests_per_second=10.0, burst_size=5)
         limiter1.acquire()
         limiter2.acquire()
-        assert limiter1._tokens < 1.0
-        assert limiter2._tokens >= 4.0
+        start = time.monotonic()
+        limiter2.acquire()
+        assert time.monotonic() - start < 0.05
+        limiter1.acquire()
+        assert time.monotonic() - start >= 0.09
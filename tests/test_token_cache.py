@@ -0,0 +1,100 @@
+import base64
+import json
+import os
+import stat
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from amplify_media_migrator.auth.token_cache import (
+    CachedCognitoSession,
+    CognitoTokenCache,
+)
+from amplify_media_migrator.auth.token_manager import REFRESH_BEFORE_EXPIRY_SECONDS
+
+pytestmark = pytest.mark.unit
+
+
+def _make_jwt(exp: int) -> str:
+    header = base64.urlsafe_b64encode(b'{"alg":"RS256"}').rstrip(b"=").decode()
+    payload_bytes = json.dumps({"exp": exp, "sub": "test"}).encode()
+    payload = base64.urlsafe_b64encode(payload_bytes).rstrip(b"=").decode()
+    return f"{header}.{payload}.fakesignature"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CognitoTokenCache:
+    return CognitoTokenCache("us-east-1_Pool", "user@test.com", cache_dir=tmp_path)
+
+
+class TestCognitoTokenCache:
+    def test_load_returns_none_when_missing(self, cache: CognitoTokenCache) -> None:
+        assert cache.load() is None
+
+    def test_round_trip(self, cache: CognitoTokenCache) -> None:
+        id_token = _make_jwt(int(time.time()) + 3600)
+        cache.save(id_token, "refresh", "access")
+
+        tokens = cache.load()
+
+        assert tokens is not None
+        assert tokens.id_token == id_token
+        assert tokens.refresh_token == "refresh"
+        assert tokens.access_token == "access"
+
+    def test_expiring_token_is_ignored(self, cache: CognitoTokenCache) -> None:
+        exp = int(time.time()) + REFRESH_BEFORE_EXPIRY_SECONDS - 10
+        cache.save(_make_jwt(exp), "refresh")
+
+        assert cache.load() is None
+
+    def test_undecodable_token_is_ignored(self, cache: CognitoTokenCache) -> None:
+        cache.save("not-a-jwt", "refresh")
+
+        assert cache.load() is None
+
+    def test_corrupt_file_is_ignored(self, cache: CognitoTokenCache) -> None:
+        cache.path.write_text("{not json")
+
+        assert cache.load() is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions only")
+    def test_file_is_owner_only(self, cache: CognitoTokenCache) -> None:
+        cache.save(_make_jwt(int(time.time()) + 3600), "refresh")
+
+        assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions only")
+    def test_save_tightens_existing_file(self, cache: CognitoTokenCache) -> None:
+        cache.path.write_text("{}")
+        cache.path.chmod(0o644)
+
+        cache.save(_make_jwt(int(time.time()) + 3600), "refresh")
+
+        assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+
+    def test_key_depends_on_pool_and_user(self, tmp_path: Path) -> None:
+        a = CognitoTokenCache("pool", "alice", cache_dir=tmp_path)
+        b = CognitoTokenCache("pool", "bob", cache_dir=tmp_path)
+
+        assert a.path != b.path
+
+    def test_clear_removes_file(self, cache: CognitoTokenCache) -> None:
+        cache.save(_make_jwt(int(time.time()) + 3600), "refresh")
+        cache.clear()
+        cache.clear()
+
+        assert not cache.path.exists()
+
+
+class TestCachedCognitoSession:
+    def test_id_token_follows_client_renewals(self) -> None:
+        client = MagicMock()
+        client.id_token = "first"
+        session = CachedCognitoSession(client)
+
+        client.id_token = "renewed"
+
+        assert session.get_id_token() == "renewed"